@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Purpose: asyncio output of drawings
+# module belongs to package: dxfwrite.py
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+"""
+Write drawings from asyncio event loops without blocking the loop: the DXF
+data is formatted chunk by chunk, the loop runs other tasks between the
+chunks, or the formatting runs in the default executor of the loop. Writes
+to an :class:`asyncio.StreamWriter` respect its flow control by awaiting
+:meth:`~asyncio.StreamWriter.drain`.
+
+Usage::
+
+    await drawing.save_async()  # write to drawing.filename
+    await drawing.save_async(stream_writer)
+"""
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import asyncio
+
+_END = object()  # end of chunks marker
+
+
+def is_stream_writer(writer):
+    """ True if `writer` is an :class:`asyncio.StreamWriter` like object with
+    a :meth:`drain` coroutine for flow control.
+    """
+    return hasattr(writer, 'drain')
+
+
+async def writechunks_async(writer, chunks, offload=False):
+    """ Write the iterable `chunks` to `writer`.
+
+    :param writer: :class:`asyncio.StreamWriter`, an object with a coroutine
+        `write` method, or a file-like object, which is written by the default
+        executor of the loop
+    :param bool offload: create the chunks in the default executor of the
+        loop, else in the loop, which runs other tasks between the chunks
+    """
+    loop = asyncio.get_event_loop()  # running loop, get_running_loop() is Python 3.7+
+    if is_stream_writer(writer):
+        async def write(chunk):
+            writer.write(chunk)
+            await writer.drain()  # backpressure of the transport
+    elif asyncio.iscoroutinefunction(writer.write):
+        write = writer.write
+    else:
+        def write(chunk):
+            return loop.run_in_executor(None, writer.write, chunk)
+
+    iterator = iter(chunks)
+    while True:
+        if offload:
+            chunk = await loop.run_in_executor(None, next, iterator, _END)
+        else:
+            chunk = next(iterator, _END)
+        if chunk is _END:
+            break
+        await write(chunk)
+        if not offload:
+            await asyncio.sleep(0)  # let other tasks run between chunks
@@ -8,6 +8,11 @@
 
 __author__ = "mozman <mozman@gmx.at>"
 
+import struct
+from array import array
+from contextlib import contextmanager
+from operator import methodcaller
+
 from .util import izip, PYTHON3, to_string, is_string, iterflatlist
 if PYTHON3:
     xrange = range
@@ -27,16 +32,59 @@ def dxfstr(obj):
     return obj.__dxf__()
 
 
+# cache: class -> True if instances of class are containers of DXF tags
+_CONTAINER_TYPES = {}
+
+
+def _is_container_type(cls):
+    # containers can declare by the class method __dxfleaf__() to be written
+    # as one DXF tag by their __dxf__() method
+    result = hasattr(cls, '__dxftags__') and not (
+        hasattr(cls, '__dxfleaf__') and cls.__dxfleaf__())
+    _CONTAINER_TYPES[cls] = result
+    return result
+
+
 def iterdxftags(dxfobj):
-    if hasattr(dxfobj, '__dxftags__'):
-        for tag in dxfobj.__dxftags__():
-            for subtag in iterdxftags(tag):
-                    yield subtag
-    else:
+    """ Iterate over all DXF tags (objects without a __dxftags__() method) of
+    `dxfobj`, nested containers are flattened.
+
+    Uses an explicit stack of iterators instead of recursive generators, and
+    caches for each class if it is a container of DXF tags.
+    """
+    container_types = _CONTAINER_TYPES
+    cls = dxfobj.__class__
+    is_container = container_types.get(cls)
+    if is_container is None:
+        is_container = _is_container_type(cls)
+    if not is_container:
         yield dxfobj
+        return
+
+    stack = [iter(dxfobj.__dxftags__())]
+    while stack:
+        for tag in stack[-1]:
+            cls = tag.__class__
+            is_container = container_types.get(cls)
+            if is_container is None:
+                is_container = _is_container_type(cls)
+            if is_container:
+                stack.append(iter(tag.__dxftags__()))
+                break  # continue with the nested container
+            yield tag
+        else:  # container exhausted, continue with the parent container
+            stack.pop()
+
+
+def _dxf_method(fmt):
+    """ Returns a function, which calls the __dxf__() method of a DXF tag. """
+    if fmt is None:
+        return methodcaller('__dxf__')
+    else:
+        return methodcaller('__dxf__', fmt)
 
 
-def tags2str(dxfobj):
+def tags2str(dxfobj, fmt=None):
     """ Creates the DXF string by collecting the DXF tags at first, by iterating over all dxf tags.
     Creates the DXF string by only one ''.join() operation.
     
@@ -44,24 +92,235 @@ def tags2str(dxfobj):
     
     Returns a valid dxf-string, last char has to be '\n'.
 
+    :param fmt: :class:`DXFFormat` object or `None` for the default format
     """
-    return "".join( (tag.__dxf__() for tag in iterdxftags(dxfobj)) )
+    return "".join(map(_dxf_method(fmt), iterdxftags(dxfobj)))
 
 
-def writetags(fileobj, dxfobj, encoding=None):        
+def writetags(fileobj, dxfobj, encoding=None, fmt=None):
+    write = fileobj.write
+    dxf = _dxf_method(fmt)
     if PYTHON3 or (encoding is None):
-        write = lambda tag: fileobj.write(tag)
+        for dxftag in iterdxftags(dxfobj):
+            write(dxf(dxftag))
     else:
-        write = lambda tag: fileobj.write(tag.encode(encoding))
-        
-    for dxftag in iterdxftags(dxfobj):
-        write(dxftag.__dxf__())
+        for dxftag in iterdxftags(dxfobj):
+            write(dxf(dxftag).encode(encoding))
+
+
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+
+def iterchunks(dxfobj, chunk_size=DEFAULT_CHUNK_SIZE, encoding=None, fmt=None):
+    """ Yields the DXF string of `dxfobj` in chunks of approximately
+    `chunk_size` chars. Yields encoded bytes if `encoding` is not `None`,
+    characters which can not be encoded are replaced by '?'.
+    """
+    buffer = []
+    append = buffer.append
+    size = 0
+    for string in map(_dxf_method(fmt), iterdxftags(dxfobj)):
+        append(string)
+        size += len(string)
+        if size >= chunk_size:
+            chunk = "".join(buffer)
+            del buffer[:]
+            size = 0
+            yield chunk if encoding is None else chunk.encode(encoding, 'replace')
+    if buffer:
+        chunk = "".join(buffer)
+        yield chunk if encoding is None else chunk.encode(encoding, 'replace')
+
+
+def writechunks(fileobj, dxfobj, encoding=None, chunk_size=DEFAULT_CHUNK_SIZE, fmt=None):
+    """ Write the DXF string of `dxfobj` in chunks of approximately
+    `chunk_size` chars, writes bytes to `fileobj` if `encoding` is not `None`.
+    """
+    write = fileobj.write
+    for chunk in iterchunks(dxfobj, chunk_size, encoding, fmt):
+        write(chunk)
+
+
+BINARY_SENTINEL = b"AutoCAD Binary DXF\r\n\x1a\x00"
+BINARY_ENCODING = 'cp1252'
+
+
+def _dxfbin_method(encoding):
+    """ Returns a function, which creates the binary DXF of a DXF tag, DXF
+    tags without a __dxfbin__() method are converted from their DXF string.
+    """
+    def dxfbin(dxftag):
+        try:
+            method = dxftag.__dxfbin__
+        except AttributeError:
+            return str2bin(dxftag.__dxf__(), encoding)
+        return method(encoding)
+    return dxfbin
+
+
+def tags2bin(dxfobj, encoding=BINARY_ENCODING):
+    """ Creates the binary DXF data of `dxfobj` as bytes, without the
+    binary DXF sentinel. Float values are written as 8 byte doubles with full
+    precision, a :class:`DXFFormat` does not apply.
+    """
+    return b"".join(map(_dxfbin_method(encoding), iterdxftags(dxfobj)))
+
+
+def iterbinchunks(dxfobj, chunk_size=DEFAULT_CHUNK_SIZE, encoding=BINARY_ENCODING):
+    """ Yields the binary DXF data of `dxfobj` in chunks of approximately
+    `chunk_size` bytes, without the binary DXF sentinel.
+    """
+    buffer = []
+    append = buffer.append
+    size = 0
+    for data in map(_dxfbin_method(encoding), iterdxftags(dxfobj)):
+        append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b"".join(buffer)
+            del buffer[:]
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+class DXFFormat(object):
+    """ Formatting policy for the DXF output of a drawing.
+
+    All float values (coordinates, distances and angles) are formatted by the
+    precompiled function :attr:`float2str`.
+
+    The serializers cache their templates by the DXFFormat object, don't
+    change the attributes, create a new DXFFormat object.
+    """
+    def __init__(self, precision=None, strip_zeros=False, shorten_integers=False, omit_defaults=False,
+                 drop_zero_z=False):
+        """ DXFFormat constructor.
+
+        :param int precision: count of decimal places of float values, `None`
+            for full precision
+        :param bool strip_zeros: strip trailing zeros of decimal places,
+            requires a `precision`
+        :param bool shorten_integers: write integer-valued floats without
+            decimal places, '5' instead of '5.0'
+        :param bool omit_defaults: omit entity attributes equal to their
+            default value of the DXF reference (:attr:`AttribDef.default`),
+            like layer '0', color BYLAYER or scale 1.0, the layer of VERTEX
+            and ATTRIB entities is always written
+        :param bool drop_zero_z: 2D output, write entity locations with
+            z-axis 0 as 10/20 groups without the 30 group, and 3D polylines
+            with all vertices in the xy-plane as 2D polylines
+        """
+        self.precision = precision
+        self.strip_zeros = strip_zeros
+        self.shorten_integers = shorten_integers
+        self.omit_defaults = omit_defaults
+        self.drop_zero_z = drop_zero_z
+        self.float2str = _float_formatter(precision, strip_zeros, shorten_integers)
+        # False if float2str is str(), floats are written by '%s' formatting
+        self.formats_floats = precision is not None or shorten_integers
+        # equal for DXFFormat objects with equal output
+        self.key = (precision, strip_zeros, shorten_integers, omit_defaults, drop_zero_z)
+
+    def __reduce__(self):
+        # float2str is a local function, pickle the constructor arguments
+        return DXFFormat, self.key
+
+
+def _float_formatter(precision, strip_zeros, shorten_integers):
+    if precision is None:
+        def float2str(value):
+            return str(value)
+        rounded = float
+    else:
+        template = "%%.%df" % precision
+
+        def rounded(value):
+            return round(value, precision) + 0.  # + 0. prevents '-0.0'
+        if strip_zeros:
+            def float2str(value):
+                string = template % rounded(value)
+                if '.' in string:
+                    string = string.rstrip('0')
+                    if string.endswith('.'):
+                        string += '0'
+                return string
+        else:
+            def float2str(value):
+                return template % rounded(value)
+
+    if not shorten_integers:
+        return float2str
+
+    max_int = float(1 << 53)  # exact integer range of float
+
+    def shortened_float2str(value):
+        integer = rounded(value)
+        if integer.is_integer() and -max_int < integer < max_int:
+            return "%d" % integer
+        return float2str(value)
+    return shortened_float2str
 
 
 class DXFValidationError(Exception):
     pass
 
 
+def _cast_bool(value):
+    return 1 if int(value) else 0
+
+
+def _is_bool(value):
+    return value in (0, 1)
+
+
+def _is_float(value):
+    return isinstance(value, float)
+
+
+def _is_int(value):
+    return isinstance(value, int)
+
+# type string -> (cast function, check function)
+_TYPE_FUNCTIONS = {
+    'string': (to_string, is_string),
+    'bool': (_cast_bool, _is_bool),
+    'float': (float, _is_float),
+    'int': (int, _is_int),
+}
+
+MAX_GROUP_CODE = 1071
+
+# type string -> struct format of the value in binary DXF, 's' for
+# null-terminated strings
+_BINARY_FORMATS = {
+    'string': 's',
+    'float': 'd',
+    'int': 'h',
+    'bool': 'B',
+}
+
+# group codes of 32 bit integers in binary DXF
+_INT32_GROUP_CODES = ((90, 99), (420, 429), (440, 459), (1071, 1071))
+
+
+def _binary_format(type_str, group_code):
+    if type_str == 'int':
+        for begin, end in _INT32_GROUP_CODES:
+            if begin <= group_code <= end:
+                return 'l'
+    return _BINARY_FORMATS[type_str]
+
+
+def _binary_group_code(group_code):
+    """ Group code in R12 binary DXF: 1 byte, group codes >= 255 as byte 255
+    followed by the group code as 2 byte integer.
+    """
+    if 0 <= group_code < 255:
+        return struct.pack('<B', group_code)
+    return struct.pack('<Bh', 255, group_code)
+
+
 class _DXFType(object):
     _group_code_types = None
 
@@ -71,6 +330,10 @@ class _DXFType(object):
 
     def _init_table(self):
         self._group_code_types = dict()
+        # dense tables indexed by group code, None for unknown group codes
+        self.casters = [None] * (MAX_GROUP_CODE + 1)
+        self.checkers = [None] * (MAX_GROUP_CODE + 1)
+        self.binary_formats = [None] * (MAX_GROUP_CODE + 1)
         for type_str, begin, end in [
             ('string', 0, 9),
             ('float', 10, 59),
@@ -102,30 +365,42 @@ class _DXFType(object):
 
     def check(self, value, code):
         try:
-            typestr = self.group_code_type(code)
+            checker = self.checker(code)
         except KeyError:
             raise ValueError("Unknown group code '%s'" % str(code))
-        if typestr == 'string':
-            return is_string(value)
-        elif typestr == 'bool':
-            return value in (0, 1)
-        elif typestr == 'float':
-            return isinstance(value, float)
-        elif typestr == 'int':
-            return isinstance(value, int)
+        return checker(value)
 
     def cast(self, value, code):
         """ Convert value depending on group code """
-        typestr = self.group_code_type(code)
-        if typestr == 'string':
-            return to_string(value)
-        elif typestr == 'bool':
-            return 1 if int(value) else 0
-        elif typestr == 'float':
-            return float(value)
-        elif typestr == 'int':
-            return int(value)
-        raise ValueError("Unknown format '%s'" % to_string(code))
+        return self.caster(code)(value)
+
+    def caster(self, group_code):
+        """ Get cast function for `group_code`, raises KeyError for unknown
+        group codes.
+        """
+        caster = self.casters[group_code] if 0 <= group_code <= MAX_GROUP_CODE else None
+        if caster is None:
+            raise KeyError(group_code)
+        return caster
+
+    def checker(self, group_code):
+        """ Get check function for `group_code`, raises KeyError for unknown
+        group codes.
+        """
+        checker = self.checkers[group_code] if 0 <= group_code <= MAX_GROUP_CODE else None
+        if checker is None:
+            raise KeyError(group_code)
+        return checker
+
+    def binary_format(self, group_code):
+        """ Get the struct format of the binary DXF value for `group_code`,
+        's' for null-terminated strings, raises KeyError for unknown group
+        codes.
+        """
+        binary_format = self.binary_formats[group_code] if 0 <= group_code <= MAX_GROUP_CODE else None
+        if binary_format is None:
+            raise KeyError(group_code)
+        return binary_format
 
     def group_code_type(self, group_code):
         return self._group_code_types[group_code]
@@ -136,21 +411,44 @@ class _DXFType(object):
         else:
             end += 1
 
+        caster, checker = _TYPE_FUNCTIONS[type_str]
         for code in xrange(begin, end):
             self._group_code_types[code] = type_str
+            self.casters[code] = caster
+            self.checkers[code] = checker
+            self.binary_formats[code] = _binary_format(type_str, code)
 
 
 class DXFAtom(object):
     """ The basic dxf object """
+    __slots__ = ('_group_code', '_value')
     _dxftype = _DXFType()
+    _casters = _dxftype.casters
 
     def __init__(self, value, group_code=0):
-        self._group_code = int(group_code)
-        self._value = self._typecast(value, self._group_code)
+        group_code = int(group_code)
+        self._group_code = group_code
+        try:
+            caster = self._casters[group_code]
+        except IndexError:
+            caster = None
+        if caster is None or group_code < 0:
+            caster = self._dxftype.caster(group_code)  # raises KeyError
+        self._value = caster(value)
 
-    def __dxf__(self):
-        """ Returns a valid DXF String. Last char has to be '\n'. """
-        return "%3d\n%s\n" % (self._group_code, to_string(self._value))
+    def __dxf__(self, fmt=None):
+        """ Returns a valid DXF String. Last char has to be '\n'.
+
+        :param fmt: :class:`DXFFormat` object or `None` for the default format
+        """
+        value = self._value  # strings are already escaped by to_string()
+        if fmt is not None and fmt.formats_floats and value.__class__ is float:
+            return "%3d\n%s\n" % (self._group_code, fmt.float2str(value))
+        return "%3d\n%s\n" % (self._group_code, value)
+
+    def __dxfbin__(self, encoding=BINARY_ENCODING):
+        """ Returns the binary DXF data as bytes. """
+        return pack_tag(self._group_code, self._value, encoding)
 
     def _typecast(self, value, group_code):
         return self._dxftype.cast(value, group_code)
@@ -194,9 +492,9 @@ class DXFAtom(object):
 
 class DXFList(list):
     """ Collection of DXFAtoms. """
-    def __dxf__(self):
+    def __dxf__(self, fmt=None):
         """ Returns a valid DXF String. """
-        return "".join((atom.__dxf__() for atom in self))
+        return "".join(map(_dxf_method(fmt), self))
 
     def __dxftags__(self):
         return self
@@ -221,50 +519,223 @@ class DXFList(list):
 
 class DXFString(DXFAtom):
     """ String with group code 1 """
+    __slots__ = ()
+
     def __init__(self, value, group_code=1):
         super(DXFString, self).__init__(to_string(value), group_code)
 
 
 class DXFName(DXFAtom):
     """ String with group code 2 """
+    __slots__ = ()
+
     def __init__(self, value, group_code=2):
         super(DXFName, self).__init__(to_string(value), group_code)
 
 
 class DXFFloat(DXFAtom):
     """ float with group code 40 """
+    __slots__ = ()
+
     def __init__(self, value, group_code=40):
         super(DXFFloat, self).__init__(float(value), group_code)
 
 
 class DXFAngle(DXFAtom):
     """ float with group code 50, angle in degrees """
+    __slots__ = ()
+
     def __init__(self, value, group_code=50):
         super(DXFAngle, self).__init__(float(value), group_code)
 
 
 class DXFInt(DXFAtom):
     """ 16 bit integer with group code 70 """
+    __slots__ = ()
+
     def __init__(self, value, group_code=70):
         super(DXFInt, self).__init__(int(value), group_code)
 
 
 class DXFBool(DXFAtom):
     """ Integer 0 or 1 """
+    __slots__ = ()
+
     def __init__(self, value=1, group_code=290):
         super(DXFBool, self).__init__(int(value), group_code)
 
 
+# group code -> (pack function of group code and value or None for strings,
+# group code as bytes)
+_TAG_PACKERS = {}
+
+
+def pack_tag(group_code, value, encoding=BINARY_ENCODING):
+    """ Pack one DXF tag into binary DXF, the struct format of `value`
+    depends on the type of `group_code`. Raises KeyError for unknown group
+    codes.
+    """
+    try:
+        pack, code = _TAG_PACKERS[group_code]
+    except KeyError:
+        value_format = DXFAtom._dxftype.binary_format(group_code)
+        code = _binary_group_code(group_code)
+        if value_format == 's':
+            pack = None
+        else:
+            pack = struct.Struct('<%ds%s' % (len(code), value_format)).pack
+        _TAG_PACKERS[group_code] = pack, code
+    if pack is None:
+        return code + value.encode(encoding, 'replace') + b'\x00'
+    return pack(code, value)
+
+
+def _iterstrtags(string):
+    """ Yields (group_code, value string) of the DXF string `string`. """
+    lines = string.split('\n')
+    for code, value in izip(lines[0:-1:2], lines[1::2]):
+        yield int(code), value
+
+
+def str2bin(string, encoding=BINARY_ENCODING):
+    """ Convert the DXF string `string` into binary DXF. """
+    cast = DXFAtom._dxftype.cast
+    return b"".join(pack_tag(code, cast(value, code), encoding)
+                    for code, value in _iterstrtags(string))
+
+
+_VARIABLE = object()  # value of DXF tags packed from function arguments
+
+
+def _compile_packer(items, encoding, params, args):
+    """ Generate a function, which packs the DXF tags `items` into binary
+    DXF by a few struct pack operations.
+
+    :param items: (group_code, value) tuples, the values of constant tags are
+        packed at compile time, the value :data:`_VARIABLE` is the next
+        expression of `args`, group code `None` for variable DXF tag objects
+    :param str params: parameter list of the function
+    :param args: expressions of the variable values
+    """
+    namespace = {'tags2bin': tags2bin, 'ENCODING': encoding}
+    parts = []  # expressions of the packed bytes
+    struct_format = []
+    struct_args = []
+    constant = []  # packed bytes of consecutive constant tags
+
+    def add_constant():
+        if constant:
+            name = 'C%d' % len(namespace)
+            namespace[name] = b"".join(constant)
+            struct_format.append('%ds' % len(namespace[name]))
+            struct_args.append(name)
+            del constant[:]
+
+    def add_struct():
+        add_constant()
+        if len(struct_args) == 1 and struct_format[0].endswith('s'):
+            parts.append(struct_args[0])  # constant tags only
+        elif struct_args:
+            name = 'S%d' % len(namespace)
+            namespace[name] = struct.Struct('<' + "".join(struct_format)).pack
+            parts.append('%s(%s)' % (name, ", ".join(struct_args)))
+        del struct_format[:]
+        del struct_args[:]
+
+    args = iter(args)
+    binary_format = DXFAtom._dxftype.binary_format
+    for group_code, value in items:
+        if group_code is None:
+            add_struct()
+            parts.append('tags2bin(%s, ENCODING)' % next(args))
+        elif value is _VARIABLE:
+            value_format = binary_format(group_code)
+            constant.append(_binary_group_code(group_code))
+            if value_format == 's':
+                add_struct()
+                parts.append("%s.encode(ENCODING, 'replace') + b'\\x00'" % next(args))
+            else:
+                add_constant()
+                struct_format.append(value_format)
+                struct_args.append(next(args))
+        else:
+            constant.append(pack_tag(group_code, value, encoding))
+    add_struct()
+    source = "def pack(%s):\n    return %s\n" % (params, " + ".join(parts) or "b''")
+    exec(source, namespace)
+    return namespace['pack']
+
+
+def compile_row_packer(template, encoding=BINARY_ENCODING):
+    """ Compile a function, which packs one row of the DXF string
+    `template` into binary DXF, like the row templates of columnar batches:
+    the arguments of the function are the values of the '%s' placeholders.
+    """
+    cast = DXFAtom._dxftype.cast
+    items = [(code, _VARIABLE if value == '%s' else cast(value.replace('%%', '%'), code))
+             for code, value in _iterstrtags(template)]
+    args = ['v%d' % index for index in xrange(sum(1 for code, value in items if value is _VARIABLE))]
+    return _compile_packer(items, encoding, ", ".join(args), args)
+
+
+# (index_shift, coordinate count) -> format string for __dxf__()
+_POINT_TEMPLATES = {}
+
+
+def _point_template(index_shift, count):
+    try:
+        return _POINT_TEMPLATES[(index_shift, count)]
+    except KeyError:
+        template = "".join("%3d\n%%s\n" % ((axis + 1) * 10 + index_shift)
+                           for axis in xrange(count))
+        _POINT_TEMPLATES[(index_shift, count)] = template
+        return template
+
+
+# (index_shift, coordinate count) -> pack function for __dxfbin__()
+_POINT_PACKERS = {}
+
+
+def _point_packer(index_shift, count):
+    try:
+        return _POINT_PACKERS[(index_shift, count)]
+    except KeyError:
+        items = [((axis + 1) * 10 + index_shift, _VARIABLE) for axis in xrange(count)]
+        packer = _compile_packer(items, BINARY_ENCODING, 'coords',
+                                 ['coords[%d]' % axis for axis in xrange(count)])
+        _POINT_PACKERS[(index_shift, count)] = packer
+        return packer
+
+
 class DXFPoint(object):
-    """ 3D point with 3 float coordinates """
+    """ 3D point with 3 float coordinates
+
+    The coordinates are stored as tuple of floats, the DXF tags are created
+    at output.
+    """
+    __slots__ = ('coords', 'index_shift')
+
     def __init__(self, coords=(0., 0., 0.), index_shift=0):
-        if len(coords) in (2, 3) :
-            # just use a normal list not DXFList, because point has public access
-            # and can be set as tuple or list too, so always expect a tuple or list
-            self.point = [DXFFloat(value, (pos+1)*10+index_shift) for pos, value in enumerate(coords)]
+        if len(coords) in (2, 3):
+            self.coords = tuple(map(float, coords))
+            self.index_shift = index_shift
         else:
             raise ValueError("only 2 or 3 coord-values allowed.")
 
+    @property
+    def point(self):
+        """ Coordinates as list of DXFFloat objects, setting the point
+        requires a list of DXFFloat objects too.
+        """
+        shift = self.index_shift
+        return [DXFFloat(value, (axis + 1) * 10 + shift)
+                for axis, value in enumerate(self.coords)]
+
+    @point.setter
+    def point(self, atoms):
+        self.coords = tuple(atom.value for atom in atoms)
+        self.index_shift = atoms[0].get_index_shift()
+
     def __getitem__(self, axis):
         """ Get coordinate for 'axis'.
 
@@ -275,14 +746,14 @@ class DXFPoint(object):
         """
         if axis in (0, 1, 2):
             try:
-                return self.point[axis].value
+                return self.coords[axis]
             except IndexError:
                 raise IndexError("DXF-Point has no '%s'-coordinate!" % ('x', 'y', 'z')[axis])
         elif is_string(axis):
             if axis in ('x', 'y', 'z'):
                 try:
                     index = ord(axis) - ord('x')
-                    return self.point[index].value
+                    return self.coords[index]
                 except IndexError:
                     raise IndexError("DXF-Point has no '%s'-coordinate!" % axis)
             elif len(axis) > 1:  # 'xy' or 'zx' get coords in letter order
@@ -292,37 +763,57 @@ class DXFPoint(object):
         else:
             raise IndexError("Invalid axis name '%s'" % axis)
 
-    def __dxf__(self):
-        return "".join([coord.__dxf__() for coord in self.point])
+    def __dxf__(self, fmt=None):
+        coords = self.coords
+        template = _point_template(self.index_shift, len(coords))
+        if fmt is None or not fmt.formats_floats:
+            return template % coords
+        else:
+            return template % tuple(map(fmt.float2str, coords))
+
+    def __dxfbin__(self, encoding=BINARY_ENCODING):
+        return _point_packer(self.index_shift, len(self.coords))(self.coords)
 
     def get_index_shift(self):
-        return self.point[0].group_code - 10
+        return self.index_shift
 
     def shift_group_code(self, index_shift):
         """ get DXFPoint with shifted group code """
-        return DXFPoint(self["xyz"[:len(self.point)]], index_shift)
+        return DXFPoint(self.coords, index_shift)
 
     def to_3D(self, zvalue=0.):
         """ add z-axis if absent """
-        if len(self.point) < 3:
-            self.point.append(DXFFloat(zvalue, self.get_index_shift()+30))
+        if len(self.coords) < 3:
+            self.coords += (float(zvalue), )
 
     @property
     def tuple(self):
         # CAUTION: do not override the 'value' attribute!!!
         # 'value' would be the suitable name for this property, but that causes
         # several serious problems.
-        return tuple(self['xyz'[:len(self.point)]])
+        return self.coords
 
 
 class DXFPoint2D(DXFPoint):
     """ only output x and y axis! """
-    def __dxf__(self):
-        return "".join([coord.__dxf__() for coord in self.point[:2]])
+    __slots__ = ()
+
+    def __dxf__(self, fmt=None):
+        coords = self.coords[:2]
+        template = _point_template(self.index_shift, 2)
+        if fmt is None or not fmt.formats_floats:
+            return template % coords
+        else:
+            return template % tuple(map(fmt.float2str, coords))
+
+    def __dxfbin__(self, encoding=BINARY_ENCODING):
+        return _point_packer(self.index_shift, 2)(self.coords)
 
 
 class DXFPoint3D(DXFPoint):
     """ An assurd 3D point """
+    __slots__ = ()
+
     def __init__(self, coords=(0., 0., 0.), index_shift=0):
         if len(coords) == 2:
             coords = (coords[0], coords[1], 0.)
@@ -352,11 +843,547 @@ class AttribDef(object):
         determines the output order of attributes, not really necessary for
         the DXF-format (if you belief Autodesk), but useful for testing.
         Prints lower values before higher values. (50, 51, 52, 100, 101, 102)
+
+    .. attribute:: default
+
+        value defined by the DXF reference for the absent attribute, `None`
+        if the attribute has no default value. Attributes equal to their
+        default are omitted in the output, if the :class:`DXFFormat` omits
+        defaults.
     """
-    def __init__(self, factory, group_code=0, priority=100):
+    def __init__(self, factory, group_code=0, priority=100, default=None):
         self.group_code = group_code
         self.factory = factory
         self.priority = priority
+        self.default = default
+
+
+def _coords(value):
+    if len(value) in (2, 3):
+        return tuple(map(float, value))
+    else:
+        raise ValueError("only 2 or 3 coord-values allowed.")
+
+
+def _coords3d(value):
+    coords = _coords(value)
+    if len(coords) == 2:
+        coords += (0., )
+    return coords
+
+
+# factory -> converter for the raw value, same conversion as the factory does
+_ATOM_CONVERTERS = {
+    DXFString: to_string,
+    DXFName: to_string,
+    DXFFloat: float,
+    DXFAngle: float,
+    DXFInt: int,
+    DXFBool: int,
+}
+_POINT_CONVERTERS = {
+    DXFPoint: _coords,
+    DXFPoint2D: _coords,
+    DXFPoint3D: _coords3d,
+}
+
+# point factories with fixed coordinate count in the output
+_POINT_COUNTS = {
+    DXFPoint2D: 2,
+    DXFPoint3D: 3,
+}
+
+# kinds of attribute values
+ATOM_VALUE, POINT_VALUE, OBJECT_VALUE = 0, 1, 2
+
+
+def _trusted_coords3d(value):
+    if len(value) == 2:
+        return value[0], value[1], 0.
+    return value
+
+
+def _value_converter(attribdef):
+    """ Returns (kind, converter) for the values of `attribdef`. """
+    factory = attribdef.factory
+    group_code = attribdef.group_code
+    if factory in _ATOM_CONVERTERS:
+        convert = _ATOM_CONVERTERS[factory]
+        cast = DXFAtom._dxftype.caster(group_code)
+        if convert is cast:
+            return ATOM_VALUE, cast
+        return ATOM_VALUE, lambda value: cast(convert(value))
+    elif factory in _POINT_CONVERTERS:
+        return POINT_VALUE, _POINT_CONVERTERS[factory]
+    else:  # unknown factories and PassThroughFactory: store created object
+        return OBJECT_VALUE, lambda value: factory(value, group_code)
+
+
+def _trusted_converter(kind, attribdef, converter):
+    """ Returns the converter for the trusted input mode, `None` to store
+    values unchanged.
+    """
+    if kind == ATOM_VALUE:
+        return None
+    elif kind == POINT_VALUE:
+        return _trusted_coords3d if attribdef.factory is DXFPoint3D else None
+    else:
+        return converter
+
+
+def _is_identical(value, expected):
+    """ True if `value` is stored like the converted `expected` value. """
+    if expected.__class__ is tuple:  # coordinates
+        return len(value) == len(expected) and \
+            all(coord.__class__ is float for coord in value) and \
+            tuple(value) == expected
+    return value.__class__ is expected.__class__ and value == expected
+
+
+class AttribLayout(object):
+    """ Storage layout for the DXF attributes of an attribute definition
+    table (dict of :class:`AttribDef`).
+
+    The attribute values are stored as raw Python values (str, int, float,
+    tuple of coordinates) in a list of slots, one slot per attribute and
+    `None` for absent attributes. The slot order is sorted by priority, which
+    is the output order, so the DXF tags are created at output without
+    sorting.
+
+    In the trusted input mode (see :func:`trusted_input`) the values are
+    stored without checks and casts, only 2D points of 3D point attributes
+    get a z-axis.
+    """
+    trusted = False  # trusted input mode, set by trusted_input()
+
+    def __init__(self, attribute_definition):
+        keys = sorted(attribute_definition,
+                      key=lambda key: attribute_definition[key].priority)
+        self.keys = tuple(keys)
+        self.index = dict((key, index) for index, key in enumerate(keys))
+        self.definitions = tuple(attribute_definition[key] for key in keys)
+        kinds_and_converters = [_value_converter(attribdef) for attribdef in self.definitions]
+        self.kinds = tuple(kind for kind, converter in kinds_and_converters)
+        self.converters = tuple(converter for kind, converter in kinds_and_converters)
+        self.trusted_converters = tuple(_trusted_converter(kind, attribdef, converter)
+                                        for attribdef, (kind, converter) in izip(self.definitions,
+                                                                                kinds_and_converters))
+        # float atoms, formatted by DXFFormat.float2str
+        self._is_float = tuple(kind == ATOM_VALUE and DXFAtom._dxftype.caster(attribdef.group_code) is float
+                               for kind, attribdef in izip(self.kinds, self.definitions))
+        # points with 2 or 3 coordinates in the output
+        self._variable_dims = tuple(index for index, attribdef in enumerate(self.definitions)
+                                    if attribdef.factory not in _POINT_COUNTS and
+                                    self.kinds[index] == POINT_VALUE)
+        # locations (group codes 10-18), but not directions like the extrusion
+        self.locations = tuple(index for index, attribdef in enumerate(self.definitions)
+                                if self.kinds[index] == POINT_VALUE and attribdef.group_code < 10)
+        # default value of each slot, None for attributes without default
+        self.defaults = tuple(attribdef.default for attribdef in self.definitions)
+        self._default_slots = tuple((index, default) for index, default in enumerate(self.defaults)
+                                    if default is not None)
+        # (name, default format, signature) -> compiled serializer
+        self._serializers = {}
+        # (name, encoding, signature) -> compiled binary serializer
+        self._binary_serializers = {}
+        self.owner = None  # class of the cached layout, set by get_attrib_layout()
+
+    def __reduce__(self):
+        # the compiled serializers can not be pickled, refer to the cached layout
+        return get_attrib_layout, (self.owner, )
+
+    def new_values(self):
+        """ Returns an empty value list. """
+        return [None] * len(self.keys)
+
+    def set_value(self, values, key, value):
+        index = self.index[key]
+        if self.trusted:
+            converter = self.trusted_converters[index]
+            values[index] = value if converter is None else converter(value)
+        else:
+            values[index] = self.converters[index](value)
+
+    def update_trusted(self, values, attribs):
+        """ Set the values of dict `attribs` without checks and casts,
+        `None` values are ignored. Raises KeyError for invalid keys.
+        """
+        index = self.index
+        converters = self.trusted_converters
+        for key, value in attribs.items():
+            if value is not None:
+                slot = index[key]
+                converter = converters[slot]
+                values[slot] = value if converter is None else converter(value)
+
+    def validate(self, name, values):
+        """ Validate all values, they have to be stored like the casting of
+        the default input mode would store them: floats for float attributes
+        and coordinates, ints for int attributes and escaped strings.
+
+        Raises :class:`DXFValidationError` for invalid values.
+        """
+        for index, (key, value) in enumerate(izip(self.keys, values)):
+            if value is None or self.kinds[index] == OBJECT_VALUE:
+                continue
+            try:
+                valid = _is_identical(value, self.converters[index](value))
+            except (TypeError, ValueError):
+                valid = False
+            if not valid:
+                raise DXFValidationError("invalid value %r for attribute '%s' of '%s'." % (value, key, name))
+
+    def cast(self, values):
+        """ Cast the numbers and coordinates of `values` like the default input
+        mode, for values stored in the trusted input mode. Strings are not
+        changed, they are stored equally in both modes.
+        """
+        for index, value in enumerate(values):
+            if value is None or is_string(value) or self.kinds[index] == OBJECT_VALUE:
+                continue
+            values[index] = self.converters[index](value)
+
+    def get_value(self, values, key):
+        """ Get the value of attribute `key`, points are returned as
+        :class:`DXFPoint` objects. Raises KeyError for absent attributes.
+        """
+        index = self.index[key]
+        value = values[index]
+        if value is None:
+            raise KeyError(key)
+        kind = self.kinds[index]
+        if kind == ATOM_VALUE:
+            return value
+        elif kind == POINT_VALUE:
+            return self.create_tag(index, value)
+        try:
+            return value.value  # DXFAtom
+        except AttributeError:
+            return value  # DXFList or list or tuple
+
+    def is_default(self, index, value):
+        """ True if `value` of slot `index` is the default value of the
+        attribute.
+        """
+        default = self.defaults[index]
+        return default is not None and value == default
+
+    def omit_defaults(self, values):
+        """ Returns `values` without the attributes equal to their default
+        value, returns `values` itself if no attribute is omitted.
+        """
+        omitted = None
+        for index, default in self._default_slots:
+            value = values[index]
+            if value is not None and value == default:
+                if omitted is None:
+                    omitted = list(values)
+                omitted[index] = None
+        return values if omitted is None else omitted
+
+    def drop_zero_z(self, values):
+        """ Returns `values` with 2D locations instead of 3D locations with
+        z-axis 0, returns `values` itself if no location is changed.
+        """
+        dropped = None
+        for index in self.locations:
+            value = values[index]
+            if value is not None and len(value) == 3 and value[2] == 0:
+                if dropped is None:
+                    dropped = list(values)
+                dropped[index] = value[:2]
+        return values if dropped is None else dropped
+
+    def present_keys(self, values):
+        """ Keys of the present attributes in output order. """
+        return [key for key, value in izip(self.keys, values) if value is not None]
+
+    def create_tag(self, index, value):
+        """ Create the DXF tag object for the raw `value` stored in slot `index`. """
+        if self.kinds[index] == OBJECT_VALUE:
+            return value
+        attribdef = self.definitions[index]
+        return attribdef.factory(value, attribdef.group_code)
+
+    def get_tags(self, values):
+        """ Create the DXF tag objects of the present attributes in output
+        order.
+        """
+        create_tag = self.create_tag
+        return [create_tag(index, value) for index, value in enumerate(values)
+                if value is not None]
+
+    def iterpoints(self, values):
+        """ Yields (index_shift, coords) of the present point attributes. """
+        for index, value in enumerate(values):
+            if value is not None and self.kinds[index] == POINT_VALUE:
+                yield self.definitions[index].group_code, value
+
+    def signature(self, values, planar=False):
+        """ Types of the attribute values and the coordinate count of points
+        without fixed dimension, and of all locations if `planar`, equal
+        signatures have equal serializers.
+        """
+        signature = tuple(map(type, values))  # NoneType for absent attributes
+        for index in (self._variable_dims + self.locations if planar else self._variable_dims):
+            value = values[index]
+            if value is not None:
+                signature += (len(value), )
+        return signature
+
+    def serialize(self, name, values, fmt=None):
+        """ Create the DXF string for the entity `name` and the present
+        attributes by a compiled serializer.
+
+        :param fmt: :class:`DXFFormat` object or `None` for the default format
+        """
+        planar = False
+        if fmt is not None:
+            if fmt.omit_defaults:
+                values = self.omit_defaults(values)
+            if fmt.drop_zero_z:
+                values = self.drop_zero_z(values)
+                planar = True
+        with_fmt = fmt is not None and fmt.formats_floats
+        key = (name, with_fmt, planar, self.signature(values, planar))
+        try:
+            serializer = self._serializers[key]
+        except KeyError:
+            serializer = self._compile(name, values, with_fmt, planar)
+            self._serializers[key] = serializer
+        return serializer(values, fmt)
+
+    def _compile(self, name, values, with_fmt, planar=False):
+        """ Generate a function, which creates the DXF string of all
+        attributes present in `values` by one string format operation,
+        locations are written with the coordinate count of the value if
+        `planar`.
+        """
+        template = ["  0\n%s\n" % to_string(name).replace('%', '%%')]
+        args = []
+        for index, value in enumerate(values):
+            if value is None:
+                continue
+            kind = self.kinds[index]
+            attribdef = self.definitions[index]
+            if kind == ATOM_VALUE:
+                template.append("%3d\n%%s\n" % attribdef.group_code)
+                arg = "values[%d]" % index
+                args.append("f(%s)" % arg if with_fmt and self._is_float[index] else arg)
+            elif kind == POINT_VALUE:
+                count = _POINT_COUNTS.get(attribdef.factory, len(value))
+                if planar and index in self.locations:
+                    count = min(count, len(value))
+                template.append(_point_template(attribdef.group_code, count))
+                for axis in xrange(count):
+                    arg = "values[%d][%d]" % (index, axis)
+                    args.append("f(%s)" % arg if with_fmt else arg)
+            else:
+                template.append("%s")
+                args.append("tags2str(values[%d], fmt)" % index)
+        source = "def serialize(values, fmt):\n"
+        if with_fmt:
+            source += "    f = fmt.float2str\n"
+        source += "    return TEMPLATE %% (%s)\n" % "".join(arg + ", " for arg in args)
+        namespace = {'TEMPLATE': "".join(template), 'tags2str': tags2str}
+        exec(source, namespace)
+        return namespace['serialize']
+
+    def serialize_binary(self, name, values, encoding=BINARY_ENCODING):
+        """ Create the binary DXF data for the entity `name` and the present
+        attributes by a compiled serializer.
+        """
+        key = (name, encoding, self.signature(values))
+        try:
+            serializer = self._binary_serializers[key]
+        except KeyError:
+            serializer = self._compile_binary(name, values, encoding)
+            self._binary_serializers[key] = serializer
+        return serializer(values)
+
+    def _compile_binary(self, name, values, encoding):
+        """ Generate a function, which packs all attributes present in
+        `values` into binary DXF.
+        """
+        items = [(0, to_string(name))]
+        args = []
+        for index, value in enumerate(values):
+            if value is None:
+                continue
+            kind = self.kinds[index]
+            attribdef = self.definitions[index]
+            if kind == ATOM_VALUE:
+                items.append((attribdef.group_code, _VARIABLE))
+                args.append("values[%d]" % index)
+            elif kind == POINT_VALUE:
+                count = _POINT_COUNTS.get(attribdef.factory, len(value))
+                for axis in xrange(count):
+                    items.append(((axis + 1) * 10 + attribdef.group_code, _VARIABLE))
+                    args.append("values[%d][%d]" % (index, axis))
+            else:
+                items.append((None, _VARIABLE))
+                args.append("values[%d]" % index)
+        return _compile_packer(items, encoding, 'values', args)
+
+
+class AttribTags(object):
+    """ The entity name and the present attributes of an entity or table
+    entry as one DXF tag, the DXF string is created at output by a compiled
+    serializer of the :class:`AttribLayout`.
+    """
+    __slots__ = ('name', 'layout', 'values')
+
+    def __init__(self, name, layout, values):
+        self.name = name
+        self.layout = layout
+        self.values = values
+
+    def __dxf__(self, fmt=None):
+        return self.layout.serialize(self.name, self.values, fmt)
+
+    def __dxfbin__(self, encoding=BINARY_ENCODING):
+        return self.layout.serialize_binary(self.name, self.values, encoding)
+
+    def iterpoints(self):
+        """ Yields (index_shift, coords) of the present point attributes. """
+        return self.layout.iterpoints(self.values)
+
+    def iterentities(self):
+        """ Yields (entity name, :class:`AttribLayout`, values). """
+        yield self.name, self.layout, self.values
+
+    def validate(self):
+        """ Raises :class:`DXFValidationError` for invalid attribute values. """
+        self.layout.validate(self.name, self.values)
+
+
+def coords_array(points, count=None):
+    """ Returns the coordinates of `points` as flat array('d') and the
+    coordinate count per point. `count` is 2 or 3, or `None` for the count of
+    the first point; z-axis of 2D points is 0, 3D points are cut to 2D for
+    `count` = 2.
+    """
+    coords = array('d')
+    extend = coords.extend
+    for point in points:
+        dims = len(point)
+        if count is None:
+            count = dims
+        if dims == count:
+            extend(point)
+        elif dims == 2 and count == 3:
+            extend(point)
+            coords.append(0.)
+        elif dims == 3 and count == 2:
+            extend(point[:2])
+        else:
+            raise ValueError("only 2 or 3 coord-values allowed, and equal count for all points.")
+    return coords, count or 3
+
+
+class BatchChunk(object):
+    """ Rows `start` to `stop` of a columnar batch as one DXF tag, created at
+    output by the `rows2str()` or the `rows2bin()` method of the batch.
+    """
+    __slots__ = ('batch', 'start', 'stop')
+
+    def __init__(self, batch, start, stop):
+        self.batch = batch
+        self.start = start
+        self.stop = stop
+
+    def __dxf__(self, fmt=None):
+        return self.batch.rows2str(self.start, self.stop, fmt)
+
+    def __dxfbin__(self, encoding=BINARY_ENCODING):
+        return self.batch.rows2bin(self.start, self.stop, encoding)
+
+    def iterpoints(self):
+        """ Yields (index_shift, coords) of the point attributes. """
+        return self.batch.iterpoints(self.start, self.stop)
+
+    def iterentities(self):
+        """ Yields (entity name, :class:`AttribLayout`, values) of the rows. """
+        return self.batch.iterentities(self.start, self.stop)
+
+
+class SerializedTags(object):
+    """ The DXF tags of `dxfobj` as one DXF tag, the DXF string is created
+    once for each output format and the binary DXF once for each encoding.
+
+    `dxfobj` must not change after the first output.
+    """
+    def __init__(self, dxfobj):
+        self.dxfobj = dxfobj
+        self._strings = {}  # DXFFormat.key -> DXF string
+        self._binaries = {}  # encoding -> binary DXF
+
+    def __dxf__(self, fmt=None):
+        key = None if fmt is None else fmt.key
+        try:
+            return self._strings[key]
+        except KeyError:
+            string = tags2str(self.dxfobj, fmt)
+            self._strings[key] = string
+            return string
+
+    def __dxfbin__(self, encoding=BINARY_ENCODING):
+        try:
+            return self._binaries[encoding]
+        except KeyError:
+            data = tags2bin(self.dxfobj, encoding)
+            self._binaries[encoding] = data
+            return data
+
+    def validate(self):
+        validatetags(self.dxfobj)
+
+
+@contextmanager
+def trusted_input():
+    """ Context manager for the trusted input mode: entities and table
+    entries created in this context store their attribute values without
+    checks and casts, which speeds up the construction of many entities.
+
+    The values have to be well-typed: floats for coordinates and float
+    attributes, ints for int attributes, and strings without non-ASCII
+    chars (or escaped by :func:`dxfwrite.util.to_string`). Use
+    :func:`validatetags` or :meth:`Drawing.validate` to check the values, for
+    example in tests or on a sample of the input data.
+
+    The trusted input mode is a global setting and not thread-safe.
+    """
+    previous = AttribLayout.trusted
+    AttribLayout.trusted = True
+    try:
+        yield
+    finally:
+        AttribLayout.trusted = previous
+
+
+def validatetags(dxfobj):
+    """ Validate the attribute values of all entities and table entries in
+    `dxfobj`, raises :class:`DXFValidationError` for invalid values.
+    """
+    for tag in iterdxftags(dxfobj):
+        if hasattr(tag, 'validate'):
+            tag.validate()
+
+
+# class -> AttribLayout of class.DXF_ATTRIBUTES
+_ATTRIB_LAYOUTS = {}
+
+
+def get_attrib_layout(cls):
+    """ Get the cached :class:`AttribLayout` for the DXF_ATTRIBUTES of `cls`. """
+    try:
+        return _ATTRIB_LAYOUTS[cls]
+    except KeyError:
+        layout = AttribLayout(cls.DXF_ATTRIBUTES)
+        layout.owner = cls
+        _ATTRIB_LAYOUTS[cls] = layout
+        return layout
+
 
 _LIMIT = 1./64.
 _WY = (0., 1., 0.)
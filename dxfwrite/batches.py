@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Purpose: columnar batches of entities
+# module belongs to package: dxfwrite.py
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+"""
+Entity batches store many entities of the same type as columns (struct of
+arrays) in one Python object: coordinates and numbers in `array.array`
+objects, strings in lists. Each attribute is a scalar for all entities or a
+column with one value per entity. The DXF output is created in chunks of rows
+by one string format operation per chunk and is identical to the output of
+single entities.
+
+Coordinate columns are any sequence of 2D or 3D points, like lists of tuples
+or NumPy arrays of shape (n, 2) or (n, 3).
+"""
+
+__author__ = "mozman <mozman@gmx.at>"
+
+from array import array
+from itertools import chain
+
+from .base import DXFAtom, DXFPoint, DXFPoint2D, DXFPoint3D, get_attrib_layout
+from .base import tags2str, coords_array, BatchChunk, ATOM_VALUE, POINT_VALUE
+from .base import compile_row_packer, BINARY_ENCODING
+from .util import izip, is_string, to_string, PYTHON3
+from .entities import Line, Point, Circle, Arc, Text, Solid
+
+if PYTHON3:
+    xrange = range
+
+
+def _is_point_column(value):
+    return len(value) == 0 or hasattr(value[0], '__len__')
+
+
+def _is_atom_column(value):
+    return not is_string(value) and hasattr(value, '__len__')
+
+
+# point factory -> coordinate count in the output, None for the count of the input
+_POINT_COUNTS = {
+    DXFPoint2D: 2,
+    DXFPoint3D: 3,
+    DXFPoint: None,
+}
+
+
+class EntityBatch(object):
+    """ Batch of entities of the same type, the attributes are stored as
+    scalars (same value for all entities) or columns (one value per entity).
+
+    Attribute names and group codes are defined by the attribute definitions
+    of :attr:`ENTITY_CLASS`, point attributes as columns are sequences of
+    2D or 3D points.
+    """
+    ENTITY_CLASS = None
+    CHUNK_SIZE = 1000  # entities per DXF tag in the output
+
+    def __init__(self, **attribs):
+        self._set_attribs(attribs)
+
+    def _set_attribs(self, attribs):
+        self.layout = get_attrib_layout(self.ENTITY_CLASS)
+        self.scalars = {}  # slot index -> raw value
+        self.columns = {}  # slot index -> (column, coordinate count or 0 for atoms)
+        self.nrows = None
+        attribs.setdefault('layer', '0')
+        for key, value in attribs.items():
+            self._set_attrib(key, value)
+        if self.nrows is None:
+            raise ValueError("'%s' requires at least one attribute column." % self.__class__.__name__)
+        self._templates = {}  # DXFFormat or None -> (row template, argument columns)
+        self._packers = {}  # encoding -> row packer
+
+    def __getstate__(self):
+        # the compiled templates and packers can not be pickled
+        state = dict(self.__dict__)
+        state['_templates'] = {}
+        state['_packers'] = {}
+        return state
+
+    def _set_attrib(self, key, value):
+        if value is None:  # None means: attribute is omitted
+            return
+        layout = self.layout
+        try:
+            index = layout.index[key]
+        except KeyError:
+            raise KeyError("Invalid attribute '%s' for '%s'." % (str(key), self.__class__.__name__))
+        kind = layout.kinds[index]
+        if kind == POINT_VALUE and _is_point_column(value):
+            factory = layout.definitions[index].factory
+            column, count = coords_array(value, _POINT_COUNTS.get(factory, 3))
+            self._add_column(index, column, count, len(column) // count)
+        elif kind == ATOM_VALUE and _is_atom_column(value):
+            column = self._atom_column(index, value)
+            self._add_column(index, column, 0, len(column))
+        else:
+            self.columns.pop(index, None)
+            self.scalars[index] = layout.converters[index](value)
+
+    def __getitem__(self, key):
+        """ Get the scalar value or the column of attribute `key`. """
+        index = self.layout.index[key]
+        if index in self.scalars:
+            return self.scalars[index]
+        elif index in self.columns:
+            return self.columns[index][0]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        """ Set attribute `key` for all entities to the scalar `value`, or to
+        the column `value` with one value per entity.
+        """
+        self._set_attrib(key, value)
+        self._templates.clear()
+        self._packers.clear()
+
+    def _atom_column(self, index, values):
+        caster = DXFAtom._dxftype.caster(self.layout.definitions[index].group_code)
+        if caster is float:
+            return array('d', map(float, values))
+        elif caster is int:
+            return array('l', map(int, values))
+        else:
+            return list(map(self.layout.converters[index], values))
+
+    def _add_column(self, index, column, count, nrows):
+        if self.nrows is None:
+            self.nrows = nrows
+        elif self.nrows != nrows:
+            raise ValueError("All attribute columns of '%s' require the same length." % self.__class__.__name__)
+        self.scalars.pop(index, None)
+        self.columns[index] = (column, count)
+
+    def __len__(self):
+        return self.nrows
+
+    def __dxf__(self, fmt=None):
+        return tags2str(self, fmt)
+
+    def __dxftags__(self):
+        chunk_size = self.CHUNK_SIZE
+        nrows = self.nrows
+        return [BatchChunk(self, start, min(start + chunk_size, nrows))
+                for start in xrange(0, nrows, chunk_size)]
+
+    def _row_template(self, fmt):
+        """ Returns the format string for one entity and the argument columns
+        as list of (column, offset, step, is_float) tuples.
+        """
+        layout = self.layout
+        name = self.ENTITY_CLASS.DXF_ENTITY_NAME
+        omit_defaults = fmt is not None and fmt.omit_defaults
+        drop_zero_z = fmt is not None and fmt.drop_zero_z
+        template = ["  0\n%s\n" % to_string(name).replace('%', '%%')]
+        args = []
+        for index, attribdef in enumerate(layout.definitions):
+            if index in self.scalars:
+                value = self.scalars[index]
+                if omit_defaults and layout.is_default(index, value):
+                    continue
+                if drop_zero_z and index in layout.locations and len(value) == 3 and value[2] == 0:
+                    tag = DXFPoint(value[:2], attribdef.group_code)
+                else:
+                    tag = layout.create_tag(index, value)
+                template.append(tags2str(tag, fmt).replace('%', '%%'))
+            elif index in self.columns:
+                column, count = self.columns[index]
+                if count:  # point column
+                    dims = count
+                    if count == 3 and drop_zero_z and index in layout.locations and not any(column[2::3]):
+                        dims = 2  # all z-axis are 0
+                    template.append("".join("%3d\n%%s\n" % ((axis + 1) * 10 + attribdef.group_code)
+                                            for axis in xrange(dims)))
+                    args.extend((column, axis, count, True) for axis in xrange(dims))
+                else:
+                    template.append("%3d\n%%s\n" % attribdef.group_code)
+                    args.append((column, 0, 1, column.__class__ is array and column.typecode == 'd'))
+        return "".join(template), args
+
+    def _template(self, fmt):
+        try:
+            return self._templates[fmt]
+        except KeyError:
+            template, args = self._templates[fmt] = self._row_template(fmt)
+            return template, args
+
+    def rows2str(self, start, stop, fmt=None):
+        """ Create the DXF string for the entities `start` to `stop`.
+
+        :param fmt: :class:`DXFFormat` object or `None` for the default format
+        """
+        template, args = self._template(fmt)
+        columns = []
+        for column, offset, step, is_float in args:
+            values = column[start * step + offset:stop * step:step]
+            if fmt is not None and fmt.formats_floats and is_float:
+                values = map(fmt.float2str, values)
+            columns.append(values)
+        return (template * (stop - start)) % tuple(chain.from_iterable(izip(*columns)))
+
+    def rows2bin(self, start, stop, encoding=BINARY_ENCODING):
+        """ Create the binary DXF data for the entities `start` to `stop`. """
+        template, args = self._template(None)
+        try:
+            pack = self._packers[encoding]
+        except KeyError:
+            pack = self._packers[encoding] = compile_row_packer(template, encoding)
+        columns = [column[start * step + offset:stop * step:step] for column, offset, step, is_float in args]
+        return b"".join(map(pack, *columns))
+
+    def iterpoints(self, start=0, stop=None):
+        """ Yields (index_shift, coords) of the point attributes of the
+        entities `start` to `stop`.
+        """
+        if stop is None:
+            stop = self.nrows
+        definitions = self.layout.definitions
+        for index, (column, count) in self.columns.items():
+            if count:
+                index_shift = definitions[index].group_code
+                for row in xrange(start, stop):
+                    yield index_shift, tuple(column[row * count:(row + 1) * count])
+        for index, value in self.scalars.items():
+            if self.layout.kinds[index] == POINT_VALUE and stop > start:
+                yield definitions[index].group_code, value
+
+    def iterentities(self, start=0, stop=None):
+        """ Yields (entity name, :class:`AttribLayout`, values) of the
+        entities `start` to `stop`, values like the values of single entities.
+        """
+        if stop is None:
+            stop = self.nrows
+        name = self.ENTITY_CLASS.DXF_ENTITY_NAME
+        values = self.layout.new_values()
+        for index, value in self.scalars.items():
+            values[index] = value
+        columns = list(self.columns.items())
+        for row in xrange(start, stop):
+            for index, (column, count) in columns:
+                values[index] = tuple(column[row * count:(row + 1) * count]) if count else column[row]
+            yield name, self.layout, list(values)
+
+
+class LineBatch(EntityBatch):
+    ENTITY_CLASS = Line
+
+    def __init__(self, starts, ends, **kwargs):
+        super(LineBatch, self).__init__(start=starts, end=ends, **kwargs)
+
+
+class PointBatch(EntityBatch):
+    ENTITY_CLASS = Point
+
+    def __init__(self, points, **kwargs):
+        super(PointBatch, self).__init__(point=points, **kwargs)
+
+
+class CircleBatch(EntityBatch):
+    ENTITY_CLASS = Circle
+
+    def __init__(self, centers, radii, **kwargs):
+        super(CircleBatch, self).__init__(center=centers, radius=radii, **kwargs)
+
+
+class ArcBatch(EntityBatch):
+    ENTITY_CLASS = Arc
+
+    def __init__(self, centers, radii, startangles, endangles, **kwargs):
+        super(ArcBatch, self).__init__(center=centers, radius=radii, startangle=startangles,
+                                       endangle=endangles, **kwargs)
+
+
+class TextBatch(EntityBatch):
+    ENTITY_CLASS = Text
+
+    def __init__(self, inserts, texts, height=1., **kwargs):
+        super(TextBatch, self).__init__(insert=inserts, text=texts, height=height, **kwargs)
+
+
+class SolidBatch(EntityBatch):
+    ENTITY_CLASS = Solid
+
+    def __init__(self, points, **kwargs):
+        # 3 or 4 points per solid, the 4th point is the 3rd point if omitted
+        corners = ([], [], [], [])
+        for solid in points:
+            if len(solid) not in (3, 4):
+                raise ValueError("3 or 4 points per solid required.")
+            for corner, point in izip(corners, solid):
+                corner.append(point)
+            if len(solid) == 3:
+                corners[3].append(solid[2])
+        kwargs.update(zip((0, 1, 2, 3), corners))
+        self._set_attribs(kwargs)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Purpose: compressed output of drawings
+# module belongs to package: dxfwrite.py
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+"""
+Compressed output: drawings are written in chunks straight into gzip, bz2, xz
+or zip member streams, the DXF data is compressed while the drawing is
+serialized, without an uncompressed file or an intermediate string of the
+whole drawing.
+
+A zip bundle holds the drawing, the drawings referenced by
+:meth:`Drawing.add_xref` and plot style tables (`.ctb` files) created by
+:mod:`dxfwrite.acadctb`.
+"""
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import bz2
+import copy
+import gzip
+import lzma
+import ntpath
+import os
+import posixpath
+import sys
+import zipfile
+from contextlib import contextmanager
+
+# filename suffix -> compression
+COMPRESSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zip': 'zip',
+}
+
+
+def compression_for(filename):
+    """ Returns the compression for the suffix of `filename`, `None` for
+    uncompressed files. :meth:`Drawing.save` compresses only by an explicit
+    `compression` argument: ``drawing.save(compression=compression_for(name))``.
+    """
+    return COMPRESSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+def member_name(filename):
+    """ Returns the name of the DXF file in the zip file `filename`:
+    'plan.zip' -> 'plan.dxf' and 'plan.dxf.zip' -> 'plan.dxf'.
+    """
+    name = os.path.basename(filename)
+    if compression_for(name) is not None:
+        name = os.path.splitext(name)[0]
+    if not name.lower().endswith('.dxf'):
+        name += '.dxf'
+    return name
+
+
+def _zipfile(filename, compresslevel):
+    # the compresslevel argument requires Python 3.7, Python 3.6 uses the default level
+    if compresslevel is None or sys.version_info < (3, 7):
+        return zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED)
+    return zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+
+
+@contextmanager
+def open_compressed(filename, compression, compresslevel=None, member=None):
+    """ Context manager, opens the file `filename` for writing compressed
+    bytes.
+
+    :param str compression: 'gzip', 'bz2', 'xz', 'zip' or `None` for an
+        uncompressed file
+    :param int compresslevel: 1 (fastest) to 9 (smallest), the preset of xz,
+        `None` for the default level of the compression, zip files use the
+        default level on Python 3.6
+    :param str member: name of the file in a zip file, default is the
+        :func:`member_name` of `filename`
+    """
+    if compression is None:
+        fileobj = open(filename, 'wb')
+    elif compression == 'gzip':
+        fileobj = gzip.open(filename, 'wb', compresslevel=9 if compresslevel is None else compresslevel)
+    elif compression == 'bz2':
+        fileobj = bz2.open(filename, 'wb', compresslevel=9 if compresslevel is None else compresslevel)
+    elif compression == 'xz':
+        fileobj = lzma.open(filename, 'wb', preset=compresslevel)
+    elif compression == 'zip':
+        with _zipfile(filename, compresslevel) as zip_file:
+            with zip_file.open(member or member_name(filename), 'w', force_zip64=True) as fileobj:
+                yield fileobj
+        return
+    else:
+        raise ValueError("invalid compression '%s', use 'gzip', 'bz2', 'xz' or 'zip'." % str(compression))
+    with fileobj:
+        yield fileobj
+
+
+def arcname(path):
+    """ Returns the normalized name of the relative `path` in a zip file, with
+    '/' as separator, `None` for absolute paths and paths outside of the zip
+    file like '../base.dxf'.
+    """
+    path = path.replace('\\', '/')
+    if ntpath.splitdrive(path)[0] or path.startswith('/'):
+        return None
+    name = posixpath.normpath(path)
+    if name in ('.', '..') or name.startswith('../'):
+        return None
+    return name
+
+
+def _xref_paths(drawing):
+    """ Yields (XREF path, path of the file, name in the bundle) of the XREF
+    targets of `drawing`, relative paths are relative to the directory of the
+    drawing.
+    """
+    basedir = os.path.dirname(drawing.filename)
+    for xref in drawing.xrefs:
+        path = xref if os.path.isabs(xref) else os.path.join(basedir, xref)
+        name = arcname(xref)
+        if name is None:
+            name = ntpath.basename(xref)  # also for Windows paths on POSIX
+        yield xref, path, name
+
+
+def _bundled_drawing(drawing, xrefs):
+    """ Returns a copy of `drawing` for the bundle, the XREF blocks refer to
+    the names of the XREF targets in the bundle. The blocks of `drawing` are
+    not modified.
+    """
+    renamed = dict((xref, name) for xref, path, name in xrefs if xref != name)
+    if not renamed:
+        return drawing
+    bundled = copy.copy(drawing)
+    bundled.blocks = copy.copy(drawing.blocks)
+    bundled.blocks.blocks = dict(drawing.blocks.blocks)
+    for block in drawing.blocks.blocks.values():
+        if block['xref'] in renamed:
+            block = copy.deepcopy(block)
+            block['xref'] = renamed[block['xref']]
+            bundled.blocks.add(block)
+    return bundled
+
+
+def save_bundle(drawing, filename, ctbs=None, compresslevel=None, **kwargs):
+    """ Write the zip file `filename` with the drawing, the XREF targets of
+    the drawing and plot style tables.
+
+    The drawing is the member :func:`member_name` of `filename`. XREF
+    targets with relative paths are stored by their relative path, so the
+    references remain valid after unpacking the bundle; targets with absolute
+    paths or paths outside of the directory of the drawing are stored by
+    their filename, and the XREF blocks of the bundled drawing refer to this
+    name. Raises IOError for missing XREF targets and ValueError for
+    `ctbs` names outside of the zip file and for duplicate names.
+
+    :param ctbs: dict of name -> :class:`~dxfwrite.acadctb.UserStyles`
+        object or filename of an existing `.ctb` file
+    :param int compresslevel: 1 (fastest) to 9 (smallest), `None` for the
+        default level
+    :param kwargs: further arguments of :meth:`Drawing.save_to_fileobj`
+    """
+    xrefs = list(_xref_paths(drawing))
+    for xref, path, name in xrefs:
+        if not os.path.isfile(path):
+            raise IOError("XREF target '%s' does not exist." % path)
+    styles = []
+    for name, ctb in sorted((ctbs or {}).items()):
+        if arcname(name) is None:
+            raise ValueError("invalid ctb name '%s', requires a relative path in the zip file." % name)
+        styles.append((arcname(name), ctb))
+    names = [member_name(filename)] + [name for xref, path, name in xrefs] + [name for name, ctb in styles]
+    for name in names:
+        if names.count(name) > 1:
+            raise ValueError("duplicate name '%s' in the zip file." % name)
+    with _zipfile(filename, compresslevel) as zip_file:
+        with zip_file.open(member_name(filename), 'w', force_zip64=True) as fileobj:
+            _bundled_drawing(drawing, xrefs).save_to_fileobj(fileobj, **kwargs)
+        for xref, path, name in xrefs:
+            zip_file.write(path, name)
+        for name, ctb in styles:
+            if hasattr(ctb, 'write'):
+                with zip_file.open(name, 'w') as fileobj:
+                    ctb.write(fileobj)
+            else:
+                zip_file.write(ctb, name)
@@ -15,7 +15,7 @@ if sys.version_info[0] > 2:
 
 from . import const
 from .vector2d import vadd
-from .base import dxfstr
+from .base import tags2str
 from .entities import Polyline
 from .algebra import rotate_2d, equals_almost
 from .algebra import CubicSpline, CubicBezierCurve
@@ -26,8 +26,8 @@ __all__ = ['Ellipse', 'Bezier', 'Spline', 'Clothoid']
 
 
 class _BaseCurve(SubscriptAttributes):
-    def __dxf__(self):
-        return dxfstr(self.__dxftags__())
+    def __dxf__(self, fmt=None):
+        return tags2str(self, fmt)
 
 
 class Ellipse(_BaseCurve):
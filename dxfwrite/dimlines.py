@@ -32,7 +32,7 @@ __author__ = "mozman <mozman@gmx.at>"
 from math import radians, degrees, pi
 
 from .vector2d import *
-from . import DXFList, dxfstr
+from . import DXFList, tags2str
 from .algebra import Ray2D
 from .entities import Line, Text, Block, Insert, Solid, Arc, Circle
 from . import const
@@ -223,10 +223,10 @@ class _DimensionBase(object):
             dimtext.rstrip(DIMENSIONS_FLOATINGPOINT)
         return self.prop('prefix') + dimtext + self.prop('suffix')
 
-    def __dxf__(self):
+    def __dxf__(self, fmt=None):
         """ Get the dxf string.
         """
-        return dxfstr(self.__dxftags__())
+        return tags2str(self, fmt)
 
     def __dxftags__(self):
         """ Get dxf tags as cascading DXFList.
@@ -8,14 +8,68 @@
 
 __author__ = "mozman <mozman@gmx.at>"
 
+import copy
 import os
+import threading
 
 from . import DXFEngine
 from .base import *
+from .util import is_binary_file
 from .sections import create_section
+from .streaming import DrawingStream
+from .parallel import iterchunks_parallel
+from .pipeline import writechunks_pipelined
+from .compression import open_compressed, save_bundle
+from .r2000 import iterchunks_r2000
 from . import const
 from . import std
 
+DIALECTS = ('R12', 'R2000')
+
+# Drawing methods, which create the default settings
+_SETTINGS_METHODS = ('default_settings', 'std_linetypes', 'std_styles', 'add_layer')
+_PROTOTYPE = None  # Drawing with the default settings, created once per process
+_PROTOTYPE_LOCK = threading.Lock()
+
+
+def _prototype():
+    """ Returns the drawing with the default settings, which is the source of
+    the default header variables and tables of new drawings.
+    """
+    global _PROTOTYPE
+    if _PROTOTYPE is None:
+        with _PROTOTYPE_LOCK:
+            if _PROTOTYPE is None:
+                prototype = Drawing.__new__(Drawing)
+                prototype.header = create_section('HEADER')
+                prototype.tables = create_section('TABLES')
+                prototype.entities = create_section('ENTITIES')
+                prototype.paperspace = PaperSpaceProxy(prototype.entities)
+                prototype.default_settings()
+                # store the values like the default input mode, also if the
+                # prototype is created in the trusted input mode
+                for table in vars(prototype.tables).values():
+                    for entry in table._shared_values():
+                        _cast_values(entry)
+                for viewport in prototype.entities.entities:
+                    _cast_values(viewport)
+                _PROTOTYPE = prototype
+    return _PROTOTYPE
+
+
+def _cast_values(obj):
+    get_attrib_layout(obj.__class__).cast(obj._values)
+
+
+def _copy_viewport(viewport):
+    """ Returns an independent copy of the paper space VIEWPORT entity, the
+    attribute values and the extended DXF tags are immutable values.
+    """
+    viewport = copy.copy(viewport)
+    viewport._values = list(viewport._values)
+    viewport.extended_dxf_tags = copy.copy(viewport.extended_dxf_tags)
+    return viewport
+
 
 class Drawing(object):
     """ The Drawing object manages all the necessary sections, like header, tables
@@ -24,13 +78,22 @@ class Drawing(object):
     
     """
     ENCODING = 'cp1252'
+    CHUNK_SIZE = DEFAULT_CHUNK_SIZE
 
-    def __init__(self, name='noname.dxf'):
+    def __init__(self, name='noname.dxf', dxfformat=None, dialect='R12'):
         """ Drawing constructor.
 
         :param str name: filename of drawing
+        :param dxfformat: :class:`~dxfwrite.base.DXFFormat` object, formatting
+            policy of the DXF output, `None` for full float precision
+        :param str dialect: 'R12' or 'R2000' for the DXF R2000 output with
+            LWPOLYLINE entities, see :mod:`dxfwrite.r2000`
         """
+        if dialect not in DIALECTS:
+            raise ValueError("invalid dialect '%s', use 'R12' or 'R2000'." % str(dialect))
         self.filename = name
+        self.dxfformat = dxfformat
+        self.dialect = dialect
         self.header = create_section('HEADER')
         self.tables = create_section('TABLES')
         self.blocks = create_section('BLOCKS')
@@ -38,7 +101,28 @@ class Drawing(object):
         self.modelspace = ModelSpaceProxy(self.entities)
         self.paperspace = PaperSpaceProxy(self.entities)
         self._anonymous_counter = 0
-        self.default_settings()
+        self.xrefs = []  # paths of the drawings referenced by add_xref()
+        if self._has_std_settings():
+            self._copy_prototype(_prototype())
+        else:
+            self.default_settings()
+
+    def _has_std_settings(self):
+        """ True if the default settings are not customized by a subclass.
+        """
+        cls = self.__class__
+        return cls is Drawing or all(getattr(cls, name) is getattr(Drawing, name)
+                                     for name in _SETTINGS_METHODS)
+
+    def _copy_prototype(self, prototype):
+        """ Setup the default settings by a copy of the drawing `prototype`,
+        the header and the tables share their values and entries with the
+        prototype until they are accessed.
+        """
+        self.header = prototype.header.copy_on_write()
+        self.tables = prototype.tables.copy_on_write()
+        for viewport in prototype.entities.entities:
+            self.entities.add(_copy_viewport(viewport))
 
     @property
     def linetypes(self):
@@ -67,7 +151,9 @@ class Drawing(object):
     def __dxf__(self):
         """ Returns the drawing DXF content as string.
         """
-        return tags2str(self)
+        if self.dialect == 'R2000':
+            return "".join(iterchunks_r2000(self, self.CHUNK_SIZE, None, self.dxfformat))
+        return tags2str(self, self.dxfformat)
 
     def __dxftags__(self):
         dxftags = DXFList()
@@ -78,6 +164,31 @@ class Drawing(object):
         dxftags.append(DXFAtom('EOF'))
         return dxftags
 
+    def fork(self, name=None):
+        """ Returns a variant of the drawing, which shares the current
+        entities and blocks with this drawing. The shared entities and blocks
+        are serialized once and written by their cached DXF string, the fork
+        stores only the added entities and blocks and the modified tables.
+
+        Don't modify shared entities and blocks after forking, blocks got by
+        ``blocks.find()`` are copied before. Both drawings share the header
+        variables and table entries until they are modified.
+
+        :param str name: filename of the fork, `None` for the filename of this
+            drawing
+        """
+        fork = copy.copy(self)
+        if name is not None:
+            fork.filename = name
+        fork.header = self.header.copy_on_write()
+        fork.tables = self.tables.copy_on_write()
+        fork.blocks = self.blocks.copy_on_write()
+        fork.entities = self.entities.copy_on_write()
+        fork.modelspace = ModelSpaceProxy(fork.entities)
+        fork.paperspace = PaperSpaceProxy(fork.entities)
+        fork.xrefs = list(self.xrefs)
+        return fork
+
     def add(self, entity):
         """ Add an entity to drawing.
 
@@ -86,6 +197,30 @@ class Drawing(object):
         self.entities.add(entity)
         return entity
 
+    def add_lines(self, starts, ends, **kwargs):
+        """ Add a batch of LINE entities, see :meth:`DXFEngine.lines`. """
+        return self.add(DXFEngine.lines(starts, ends, **kwargs))
+
+    def add_points(self, points, **kwargs):
+        """ Add a batch of POINT entities, see :meth:`DXFEngine.points`. """
+        return self.add(DXFEngine.points(points, **kwargs))
+
+    def add_circles(self, centers, radii, **kwargs):
+        """ Add a batch of CIRCLE entities, see :meth:`DXFEngine.circles`. """
+        return self.add(DXFEngine.circles(centers, radii, **kwargs))
+
+    def add_arcs(self, centers, radii, startangles, endangles, **kwargs):
+        """ Add a batch of ARC entities, see :meth:`DXFEngine.arcs`. """
+        return self.add(DXFEngine.arcs(centers, radii, startangles, endangles, **kwargs))
+
+    def add_texts(self, inserts, texts, height=1., **kwargs):
+        """ Add a batch of TEXT entities, see :meth:`DXFEngine.texts`. """
+        return self.add(DXFEngine.texts(inserts, texts, height, **kwargs))
+
+    def add_solids(self, points, **kwargs):
+        """ Add a batch of SOLID entities, see :meth:`DXFEngine.solids`. """
+        return self.add(DXFEngine.solids(points, **kwargs))
+
     def anonymous_blockname(self, typechar):
         """ Create an anonymous block name.
 
@@ -143,20 +278,219 @@ class Drawing(object):
         # important, except status=1 and id=1.
         self.paperspace.add(DXFEngine.viewport((0, 0), 1, 1, status=1, id=1))
 
-    def save(self):
+    def save(self, chunk_size=None, workers=None, executor='process', pipeline=False,
+             format='ascii', compression=None, compresslevel=None):
         """ Write DXF data to file-system (Drawing.filename).
+
+        :param int chunk_size: size of the encoded chunks written to the file,
+            default is :attr:`CHUNK_SIZE`
+        :param int workers: serialize the drawing by a pool of `workers`
+            processes or threads, `None` for the sequential output, see
+            :mod:`dxfwrite.parallel`
+        :param str executor: 'process' for a process pool or 'thread' for a
+            thread pool
+        :param bool pipeline: write the chunks by a writer thread while the
+            next chunks are formatted, returns the
+            :class:`~dxfwrite.pipeline.PipelineStats`, see
+            :mod:`dxfwrite.pipeline`
+        :param str format: 'ascii' for the DXF text format or 'binary' for
+            the binary DXF format, which writes float values as 8 byte doubles
+            with full precision, :attr:`dxfformat` does not apply
+        :param str compression: 'gzip', 'bz2', 'xz' or 'zip', compress the DXF
+            data while it is written, `None` for an uncompressed file, see
+            :mod:`dxfwrite.compression`
+        :param int compresslevel: 1 (fastest) to 9 (smallest), `None` for the
+            default level of the compression
+
+        Uncompressed ASCII files have the line endings of the platform
+        (os.linesep) like files written in text mode.
         """
+        linesep = os.linesep if compression is None and format == 'ascii' else '\n'
+        with open_compressed(self.filename, compression, compresslevel) as fileobj:
+            return self._save_to_fileobj(fileobj, chunk_size, workers, executor, pipeline, format, linesep)
+
+    def save_bundle(self, filename, ctbs=None, compresslevel=None, format='ascii'):
+        """ Write a zip file with the drawing, the drawings referenced by
+        :meth:`add_xref` and plot style tables, see
+        :func:`dxfwrite.compression.save_bundle`.
+
+        :param ctbs: dict of name -> :class:`~dxfwrite.acadctb.UserStyles`
+            object or filename of an existing `.ctb` file
+        """
+        save_bundle(self, filename, ctbs, compresslevel, format=format)
+
+    def _open_file(self):
         if PYTHON3:
-            fileobj = open(self.filename, 'w', encoding=self.ENCODING, errors="replace")
+            return open(self.filename, 'w', encoding=self.ENCODING, errors="replace")
         else:
-            fileobj = open(self.filename, 'w')
-        self.save_to_fileobj(fileobj)
-        fileobj.close()
+            return open(self.filename, 'w')
 
-    def save_to_fileobj(self, fileobj):
+    def save_to_fileobj(self, fileobj, chunk_size=None, workers=None, executor='process',
+                        pipeline=False, format='ascii'):
         """ Write DXF data to a file-like object. (i.e. StringIO)
+
+        Writes encoded bytes if `fileobj` is a binary stream (i.e. BytesIO or
+        a file opened in binary mode), else writes strings, the binary DXF
+        format requires a binary stream. For the other arguments see
+        :meth:`save`.
+        """
+        return self._save_to_fileobj(fileobj, chunk_size, workers, executor, pipeline, format)
+
+    def _save_to_fileobj(self, fileobj, chunk_size, workers, executor, pipeline, format, linesep='\n'):
+        encoding = self.ENCODING if is_binary_file(fileobj) else None
+        chunks = self._iter_chunks(chunk_size, workers, executor, encoding, format)
+        if linesep != '\n':  # encoded chunks, see save()
+            newline = linesep.encode(encoding)
+            chunks = (chunk.replace(b'\n', newline) for chunk in chunks)
+        if pipeline:
+            return writechunks_pipelined(fileobj, chunks)
+        write = fileobj.write
+        for chunk in chunks:
+            write(chunk)
+
+    def _iter_chunks(self, chunk_size, workers, executor, encoding, format):
+        if self.dialect == 'R2000':
+            if format != 'ascii':
+                raise ValueError("DXF R2000 dialect supports only the 'ascii' format.")
+            if workers:
+                raise ValueError("DXF R2000 dialect does not support parallel serialization.")
+            return iterchunks_r2000(self, chunk_size or self.CHUNK_SIZE, encoding, self.dxfformat)
+        if format == 'ascii':
+            if workers:
+                return iterchunks_parallel(self, workers, executor, encoding, self.dxfformat)
+            return iterchunks(self, chunk_size or self.CHUNK_SIZE, encoding, self.dxfformat)
+        elif format == 'binary':
+            if encoding is None:
+                raise ValueError("binary DXF format requires a binary stream.")
+            if workers:
+                chunks = iterchunks_parallel(self, workers, executor, encoding, binary=True)
+            else:
+                chunks = iterbinchunks(self, chunk_size or self.CHUNK_SIZE, encoding)
+            return _binary_chunks(chunks)
+        else:
+            raise ValueError("invalid format '%s', use 'ascii' or 'binary'." % str(format))
+
+    async def save_async(self, target=None, chunk_size=None, offload=False, format='ascii'):
+        """ Write DXF data from an asyncio event loop without blocking the loop,
+        see :mod:`dxfwrite.aio`.
+
+        :param target: filename, :class:`asyncio.StreamWriter` or file-like
+            object, default is :attr:`filename`; a stream writer is not
+            closed
+        :param int chunk_size: size of the chunks, default is
+            :attr:`CHUNK_SIZE`
+        :param bool offload: format the chunks in the default executor of the
+            loop, else in the loop between the writes
+        :param str format: 'ascii' or 'binary', see :meth:`save`
+        """
+        import asyncio  # imported on demand, asyncio slows down the import of dxfwrite
+        from .aio import writechunks_async, is_stream_writer
+
+        if target is None:
+            target = self.filename
+        if isinstance(target, (str, os.PathLike)):
+            chunks = self._iter_chunks(chunk_size, None, None, self.ENCODING, format)
+            loop = asyncio.get_event_loop()  # running loop, get_running_loop() is Python 3.7+
+            fileobj = await loop.run_in_executor(None, open, target, 'wb')
+            try:
+                await writechunks_async(fileobj, chunks, offload)
+            finally:
+                await loop.run_in_executor(None, fileobj.close)
+        else:
+            encoding = self.ENCODING if is_stream_writer(target) or is_binary_file(target) else None
+            await writechunks_async(target, self._iter_chunks(chunk_size, None, None, encoding, format),
+                                    offload)
+
+    def set_float_format(self, precision=None, strip_zeros=True,
+                         shorten_integers=True):
+        """ Set the formatting of float values for the DXF output.
+
+        :param int precision: count of decimal places, `None` for full precision
+        :param bool strip_zeros: strip trailing zeros of decimal places
+        :param bool shorten_integers: write integer-valued floats without
+            decimal places
         """
-        writetags(fileobj, self.__dxftags__(), self.ENCODING)
+        self._update_format(precision=precision, strip_zeros=strip_zeros,
+                            shorten_integers=shorten_integers)
+
+    def set_omit_defaults(self, status=True):
+        """ Omit entity attributes equal to their default value of the DXF
+        reference in the ASCII output, like layer '0', color BYLAYER, scale
+        1.0 and the layer of polyline vertices equal to the layer of the
+        polyline. The meaning of the drawing in CAD applications does not
+        change, see :class:`~dxfwrite.base.DXFFormat`.
+
+        :param bool status: True to omit defaults, False to write all
+            attributes
+        """
+        self._update_format(omit_defaults=status)
+
+    def set_2d_mode(self, status=True):
+        """ 2D output of planar drawings: write entity locations with z-axis
+        0 as 10/20 groups without the 30 group, and 3D polylines with all
+        vertices in the xy-plane as 2D polylines, see
+        :class:`~dxfwrite.base.DXFFormat`. Applies to the ASCII output.
+
+        :param bool status: True for the 2D output, False to write all
+            coordinates
+        """
+        self._update_format(drop_zero_z=status)
+
+    def _update_format(self, **kwargs):
+        fmt = self.dxfformat or DXFFormat()
+        attribs = {
+            'precision': fmt.precision,
+            'strip_zeros': fmt.strip_zeros,
+            'shorten_integers': fmt.shorten_integers,
+            'omit_defaults': fmt.omit_defaults,
+            'drop_zero_z': fmt.drop_zero_z,
+        }
+        attribs.update(kwargs)
+        self.dxfformat = DXFFormat(**attribs)
+
+    def to_bytes(self, chunk_size=None, workers=None, executor='process', format='ascii'):
+        """ Returns the DXF data as encoded bytes. """
+        return b"".join(self.iter_chunks(chunk_size, workers, executor, format))
+
+    def iter_chunks(self, chunk_size=None, workers=None, executor='process', format='ascii'):
+        """ Yields the DXF data as encoded bytes chunks of approximately
+        `chunk_size` bytes, the chunks are created while iterating.
+
+        If `workers` is not `None`, the chunks are the partitions serialized
+        by a pool of `workers` processes or threads, see :meth:`save`.
+        """
+        return self._iter_chunks(chunk_size, workers, executor, self.ENCODING, format)
+
+    def stream(self, fileobj=None, extents=True):
+        """ Write the drawing while it is built, for drawings which do not fit
+        into memory. Returns a :class:`~dxfwrite.streaming.DrawingStream`,
+        use it as context manager::
+
+            with drawing.stream():
+                drawing.add(dxf.line((0, 0), (1, 0)))
+
+        At entering the context the HEADER, TABLES and BLOCKS sections and all
+        previously added entities are written, after that each entity added by
+        :meth:`add`, :attr:`modelspace` or :attr:`paperspace` is written at once
+        and not stored. Tables and blocks have to be complete before entering
+        the context.
+
+        :param fileobj: file-like object, if `None` the file
+            :attr:`filename` will be created
+        :param bool extents: set $EXTMIN and $EXTMAX to the extents of all
+            written model space coordinates, requires a seekable `fileobj`
+        """
+        if self.dialect != 'R12':
+            raise ValueError("streaming output supports only the DXF R12 dialect.")
+        return DrawingStream(self, fileobj, extents)
+
+    def validate(self):
+        """ Validate the attribute values of all entities and table entries,
+        required for entities created in the trusted input mode, see
+        :meth:`DXFEngine.trusted_input`. Raises
+        :class:`~dxfwrite.base.DXFValidationError` for invalid values.
+        """
+        validatetags(self)
 
     def saveas(self, name):
         """ Set new filename and write DXF data to file-system.
@@ -209,7 +543,8 @@ class Drawing(object):
 
     def add_xref(self, filepath, insert=(0., 0., 0.), layer='0'):
         """ Create a simple XREF reference, `filepath` is the referenced
-        drawing and `insert` is the insertion point.
+        drawing and `insert` is the insertion point. The `filepath` is
+        recorded in :attr:`xrefs` for :meth:`save_bundle`.
 
         """
 
@@ -220,11 +555,19 @@ class Drawing(object):
 
         dirname, filename = os.path.split(filepath)
         blockname = normblockname(filename)
+        if filepath not in self.xrefs:
+            self.xrefs.append(filepath)
         xref = DXFEngine.block(name=blockname, flags=const.BLK_XREF, xref=filepath)
         self.blocks.add(xref)
         self.add(DXFEngine.insert(blockname, insert, layer=layer))
 
 
+def _binary_chunks(chunks):
+    """ Yields the binary DXF sentinel and the `chunks`. """
+    yield BINARY_SENTINEL
+    yield from chunks
+
+
 class ModelSpaceProxy(object):
     LAYOUT = 0
 
@@ -19,10 +19,13 @@ from .insert2 import Insert2
 from .rect import Rectangle
 from .table import Table
 from .curves import Ellipse, Spline, Bezier, Clothoid
+from .batches import LineBatch, PointBatch, CircleBatch, ArcBatch, TextBatch, SolidBatch
 
 from .tableentries import Linetype, Style, Layer
 from .tableentries import View, VPort, UCS, AppID
 
+from .base import trusted_input
+
 
 class DXFEngine(object):
     """ Factory, creates all the DXF entities.
@@ -33,16 +36,35 @@ class DXFEngine(object):
     """
 
     @staticmethod
-    def drawing(name='empty.dxf'):
+    def drawing(name='empty.dxf', dialect='R12'):
         """ Create a new drawing.
 
         The drawing-object contains all the sections, tables and entities, which
         are necessary for a valid dxf-drawing.
 
         For drawing methods see :class:`~dxfwrite.drawing.Drawing` class.
+
+        :param str dialect: 'R12' or 'R2000', see :mod:`dxfwrite.r2000`
         """
         from dxfwrite.drawing import Drawing
-        return Drawing(name)
+        return Drawing(name, dialect=dialect)
+
+    @staticmethod
+    def trusted_input():
+        """ Context manager for the trusted input mode, entities and table
+        entries created in this context store their attribute values without
+        checks and casts::
+
+            with DXFEngine.trusted_input():
+                for start, end in lines:
+                    drawing.add(DXFEngine.line(start, end, layer='LINES'))
+            drawing.validate()  # in tests or for a sample of the input data
+
+        All values have to be well-typed: floats for coordinates and float
+        attributes, ints for int attributes and strings without non-ASCII
+        chars. The trusted input mode is a global setting and not thread-safe.
+        """
+        return trusted_input()
 
 #--- Table Entries
     @staticmethod
@@ -454,6 +476,75 @@ class DXFEngine(object):
         """
         return Viewport(center_point, width, height, **kwargs)
 
+#--- entity batches
+
+    @staticmethod
+    def lines(starts, ends, **kwargs):
+        """ Create a batch of LINE entities, stored as columns in one object.
+
+        :param starts: sequence of start points (xy- or xyz-tuples)
+        :param ends: sequence of end points (xy- or xyz-tuples)
+        :param kwargs: DXF attributes of LINE, scalars for all lines or
+            sequences with one value per line
+        """
+        return LineBatch(starts, ends, **kwargs)
+
+    @staticmethod
+    def points(points, **kwargs):
+        """ Create a batch of POINT entities, stored as columns in one object.
+
+        :param points: sequence of locations (xy- or xyz-tuples)
+        :param kwargs: DXF attributes of POINT, scalars for all points or
+            sequences with one value per point
+        """
+        return PointBatch(points, **kwargs)
+
+    @staticmethod
+    def circles(centers, radii, **kwargs):
+        """ Create a batch of CIRCLE entities, stored as columns in one object.
+
+        :param centers: sequence of center points (xy- or xyz-tuples)
+        :param radii: radius for all circles or sequence of radii
+        :param kwargs: DXF attributes of CIRCLE, scalars for all circles or
+            sequences with one value per circle
+        """
+        return CircleBatch(centers, radii, **kwargs)
+
+    @staticmethod
+    def arcs(centers, radii, startangles, endangles, **kwargs):
+        """ Create a batch of ARC entities, stored as columns in one object.
+
+        :param centers: sequence of center points (xy- or xyz-tuples)
+        :param radii: radius for all arcs or sequence of radii
+        :param startangles: start angle in degree or sequence of start angles
+        :param endangles: end angle in degree or sequence of end angles
+        :param kwargs: DXF attributes of ARC, scalars for all arcs or
+            sequences with one value per arc
+        """
+        return ArcBatch(centers, radii, startangles, endangles, **kwargs)
+
+    @staticmethod
+    def texts(inserts, texts, height=1., **kwargs):
+        """ Create a batch of TEXT entities, stored as columns in one object.
+
+        :param inserts: sequence of insert points (xy- or xyz-tuples)
+        :param texts: sequence of strings
+        :param height: text height or sequence of text heights
+        :param kwargs: DXF attributes of TEXT, scalars for all texts or
+            sequences with one value per text
+        """
+        return TextBatch(inserts, texts, height, **kwargs)
+
+    @staticmethod
+    def solids(points, **kwargs):
+        """ Create a batch of SOLID entities, stored as columns in one object.
+
+        :param points: sequence of 3 or 4 points for each solid
+        :param kwargs: DXF attributes of SOLID, scalars for all solids or
+            sequences with one value per solid
+        """
+        return SolidBatch(points, **kwargs)
+
 #--- composite entities
 
     @staticmethod
@@ -9,9 +9,11 @@
 __author__ = "mozman <mozman@gmx.at>"
 
 import math
+from array import array
+from itertools import chain, groupby, repeat
 
 from .base import *
-from .util import iterflatlist, set_flag
+from .util import iterflatlist, set_flag, izip, is_string
 from .mixins import SubscriptAttributes
 
 import dxfwrite.const as const
@@ -23,7 +25,7 @@ _DXF12_ENTITY_ATTRIBUTE_DEFINITION = {
     },
     'POINT': {
         'point': AttribDef(DXFPoint3D, 0, priority=100),
-        'orientation': AttribDef(DXFAngle, 50, 101),
+        'orientation': AttribDef(DXFAngle, 50, 101, default=0.),
     },
     'CIRCLE': {
         'center': AttribDef(DXFPoint3D, 0, priority=100),
@@ -38,9 +40,9 @@ _DXF12_ENTITY_ATTRIBUTE_DEFINITION = {
     'SHAPE': {
         'insert': AttribDef(DXFPoint3D, 0, 100),
         'name': AttribDef(DXFString, 2, 110),
-        'rotation': AttribDef(DXFAngle, 50, 115),
-        'xscale': AttribDef(DXFFloat, 41, 120),
-        'oblique': AttribDef(DXFAngle, 51, 125),
+        'rotation': AttribDef(DXFAngle, 50, 115, default=0.),
+        'xscale': AttribDef(DXFFloat, 41, 120, default=1.),
+        'oblique': AttribDef(DXFAngle, 51, 125, default=0.),
     },
     'SOLID': {  # drawing order 0->1->2->3->0
                 0: AttribDef(DXFPoint3D, 0, priority=100),
@@ -58,13 +60,13 @@ _DXF12_ENTITY_ATTRIBUTE_DEFINITION = {
         'insert': AttribDef(DXFPoint3D, 0, priority=100),
         'height': AttribDef(DXFFloat, 40, 105),
         'text': AttribDef(DXFString, 1, 110),
-        'rotation': AttribDef(DXFAngle, 50, 115),
-        'xscale': AttribDef(DXFFloat, 41, 120),
-        'oblique': AttribDef(DXFAngle, 51, 125),
-        'style': AttribDef(DXFString, 7, 130),
-        'mirror': AttribDef(DXFInt, 71, 135),
-        'halign': AttribDef(DXFInt, 72, 140),
-        'valign': AttribDef(DXFInt, 73, 145),
+        'rotation': AttribDef(DXFAngle, 50, 115, default=0.),
+        'xscale': AttribDef(DXFFloat, 41, 120, default=1.),
+        'oblique': AttribDef(DXFAngle, 51, 125, default=0.),
+        'style': AttribDef(DXFString, 7, 130, default='STANDARD'),
+        'mirror': AttribDef(DXFInt, 71, 135, default=0),
+        'halign': AttribDef(DXFInt, 72, 140, default=0),
+        'valign': AttribDef(DXFInt, 73, 145, default=0),
         'alignpoint': AttribDef(DXFPoint3D, 1, 150),
     },
     'BLOCK': {
@@ -75,32 +77,32 @@ _DXF12_ENTITY_ATTRIBUTE_DEFINITION = {
         'xref': AttribDef(DXFString, 1, 120),
     },
     'INSERT': {
-        'attribs_follow': AttribDef(DXFInt, 66, priority=100),
+        'attribs_follow': AttribDef(DXFInt, 66, priority=100, default=0),
         'blockname': AttribDef(DXFName, 2, 105),
         'insert': AttribDef(DXFPoint3D, 0, 110),
-        'xscale': AttribDef(DXFFloat, 41, 115),
-        'yscale': AttribDef(DXFFloat, 42, 120),
-        'zscale': AttribDef(DXFFloat, 43, 125),
-        'rotation': AttribDef(DXFAngle, 50, 130),
-        'columns': AttribDef(DXFInt, 70, 135),
-        'rows': AttribDef(DXFInt, 71, 140),
-        'colspacing': AttribDef(DXFFloat, 44, 145),
-        'rowspacing': AttribDef(DXFFloat, 45, 150),
+        'xscale': AttribDef(DXFFloat, 41, 115, default=1.),
+        'yscale': AttribDef(DXFFloat, 42, 120, default=1.),
+        'zscale': AttribDef(DXFFloat, 43, 125, default=1.),
+        'rotation': AttribDef(DXFAngle, 50, 130, default=0.),
+        'columns': AttribDef(DXFInt, 70, 135, default=1),
+        'rows': AttribDef(DXFInt, 71, 140, default=1),
+        'colspacing': AttribDef(DXFFloat, 44, 145, default=0.),
+        'rowspacing': AttribDef(DXFFloat, 45, 150, default=0.),
     },
     'ATTRIB': {
         'insert': AttribDef(DXFPoint3D, 0, priority=100),
         'height': AttribDef(DXFFloat, 40, 105),
         'text': AttribDef(DXFString, 1, 107),
         'tag': AttribDef(DXFString, 2, 112),
-        'flags': AttribDef(DXFInt, 70, 115),
-        'length': AttribDef(DXFInt, 73, 120),
-        'rotation': AttribDef(DXFAngle, 50, 125),
-        'xscale': AttribDef(DXFFloat, 41, 130),
-        'oblique': AttribDef(DXFFloat, 51, 135),
-        'style': AttribDef(DXFString, 7, 140),
-        'mirror': AttribDef(DXFInt, 71, 145),
-        'halign': AttribDef(DXFInt, 72, 150),
-        'valign': AttribDef(DXFInt, 74, 155),
+        'flags': AttribDef(DXFInt, 70, 115, default=0),
+        'length': AttribDef(DXFInt, 73, 120, default=0),
+        'rotation': AttribDef(DXFAngle, 50, 125, default=0.),
+        'xscale': AttribDef(DXFFloat, 41, 130, default=1.),
+        'oblique': AttribDef(DXFFloat, 51, 135, default=0.),
+        'style': AttribDef(DXFString, 7, 140, default='STANDARD'),
+        'mirror': AttribDef(DXFInt, 71, 145, default=0),
+        'halign': AttribDef(DXFInt, 72, 150, default=0),
+        'valign': AttribDef(DXFInt, 74, 155, default=0),
         'alignpoint': AttribDef(DXFPoint3D, 1, 160),
     },
     'ATTDEF': {
@@ -109,15 +111,15 @@ _DXF12_ENTITY_ATTRIBUTE_DEFINITION = {
         'text': AttribDef(DXFString, 1, 107),
         'prompt': AttribDef(DXFString, 3, 111),
         'tag': AttribDef(DXFString, 2, 113),
-        'flags': AttribDef(DXFInt, 70, 115),
-        'length': AttribDef(DXFInt, 73, 120),
-        'rotation': AttribDef(DXFAngle, 50, 125),
-        'xscale': AttribDef(DXFFloat, 41, 130),
-        'oblique': AttribDef(DXFFloat, 51, 135),
-        'style': AttribDef(DXFString, 7, 140),
-        'mirror': AttribDef(DXFInt, 71, 145),
-        'halign': AttribDef(DXFInt, 72, 150),
-        'valign': AttribDef(DXFInt, 74, 155),
+        'flags': AttribDef(DXFInt, 70, 115, default=0),
+        'length': AttribDef(DXFInt, 73, 120, default=0),
+        'rotation': AttribDef(DXFAngle, 50, 125, default=0.),
+        'xscale': AttribDef(DXFFloat, 41, 130, default=1.),
+        'oblique': AttribDef(DXFFloat, 51, 135, default=0.),
+        'style': AttribDef(DXFString, 7, 140, default='STANDARD'),
+        'mirror': AttribDef(DXFInt, 71, 145, default=0),
+        'halign': AttribDef(DXFInt, 72, 150, default=0),
+        'valign': AttribDef(DXFInt, 74, 155, default=0),
         'alignpoint': AttribDef(DXFPoint3D, 1, 160),
     },
     '3DFACE': {  # drawing order 0->1->2->3->0
@@ -125,27 +127,27 @@ _DXF12_ENTITY_ATTRIBUTE_DEFINITION = {
                  1: AttribDef(DXFPoint3D, 1, 101),
                  2: AttribDef(DXFPoint3D, 2, 102),
                  3: AttribDef(DXFPoint3D, 3, 103),
-                 'flags': AttribDef(DXFInt, 70, 110),
+                 'flags': AttribDef(DXFInt, 70, 110, default=0),
     },
     'POLYLINE': {
         'vertices_follow': AttribDef(DXFInt, 66, priority=100),  # always 1
         'polyline_elevation': AttribDef(DXFPoint3D, 0, priority=105),  # there is also a common attrib elevation!!
-        'flags': AttribDef(DXFInt, 70, priority=110),
-        'startwidth': AttribDef(DXFFloat, 40, priority=115),
-        'endwidth': AttribDef(DXFFloat, 41, priority=120),
-        'mcount': AttribDef(DXFInt, 71, priority=125),
-        'ncount': AttribDef(DXFInt, 72, priority=130),
-        'msmooth_density': AttribDef(DXFInt, 73, priority=135),
-        'nsmooth_density': AttribDef(DXFInt, 74, priority=140),
-        'smooth_surface': AttribDef(DXFInt, 75, priority=145),
+        'flags': AttribDef(DXFInt, 70, priority=110, default=0),
+        'startwidth': AttribDef(DXFFloat, 40, priority=115, default=0.),
+        'endwidth': AttribDef(DXFFloat, 41, priority=120, default=0.),
+        'mcount': AttribDef(DXFInt, 71, priority=125, default=0),
+        'ncount': AttribDef(DXFInt, 72, priority=130, default=0),
+        'msmooth_density': AttribDef(DXFInt, 73, priority=135, default=0),
+        'nsmooth_density': AttribDef(DXFInt, 74, priority=140, default=0),
+        'smooth_surface': AttribDef(DXFInt, 75, priority=145, default=0),
     },
     'VERTEX': {
         'location': AttribDef(DXFPoint3D, 0, priority=100),
         'startwidth': AttribDef(DXFFloat, 40, priority=105),
         'endwidth': AttribDef(DXFFloat, 41, priority=110),
-        'bulge': AttribDef(DXFFloat, 42, priority=115),
-        'flags': AttribDef(DXFFloat, 70, priority=120),
-        'curve_fit_tangent_direction': AttribDef(DXFAngle, 50, priority=125),
+        'bulge': AttribDef(DXFFloat, 42, priority=115, default=0.),
+        'flags': AttribDef(DXFFloat, 70, priority=120, default=0),
+        'curve_fit_tangent_direction': AttribDef(DXFAngle, 50, priority=125, default=0.),
         # vertex used to describe a face, face is drawn in order 0->1->2->3:
         0: AttribDef(DXFFloat, 71, priority=130),  # face[0] .. first vertex
         1: AttribDef(DXFFloat, 72, priority=131),  # face[1] .. second vertex
@@ -165,13 +167,13 @@ _DXF12_ENTITY_ATTRIBUTE_DEFINITION = {
 
 def _add_common_attribs(attribute_definition):
     common_attribs = {
-        'linetype': AttribDef(DXFString, 6, priority=20),
-        'elevation': AttribDef(DXFFloat, 38, priority=30),
-        'thickness': AttribDef(DXFFloat, 39, priority=35),
-        'color': AttribDef(DXFInt, 62, priority=40),
-        'layer': AttribDef(DXFString, 8, priority=45),
-        'paper_space': AttribDef(DXFInt, 67, priority=50),
-        'extrusion_direction': AttribDef(DXFPoint, 200, priority=55),
+        'linetype': AttribDef(DXFString, 6, priority=20, default='BYLAYER'),
+        'elevation': AttribDef(DXFFloat, 38, priority=30, default=0.),
+        'thickness': AttribDef(DXFFloat, 39, priority=35, default=0.),
+        'color': AttribDef(DXFInt, 62, priority=40, default=256),
+        'layer': AttribDef(DXFString, 8, priority=45, default='0'),
+        'paper_space': AttribDef(DXFInt, 67, priority=50, default=0),
+        'extrusion_direction': AttribDef(DXFPoint, 200, priority=55, default=(0., 0., 1.)),
     }
     for entry in attribute_definition.values():
         entry.update(common_attribs)
@@ -179,13 +181,43 @@ def _add_common_attribs(attribute_definition):
 
 _add_common_attribs(_DXF12_ENTITY_ATTRIBUTE_DEFINITION)
 
+# sub-entities write the layer always, readers place sub-entities without
+# layer on layer '0' and not on the layer of the owner entity
+_DXF12_ENTITY_ATTRIBUTE_DEFINITION['ATTRIB']['layer'] = AttribDef(DXFString, 8, priority=45)
+_DXF12_ENTITY_ATTRIBUTE_DEFINITION['VERTEX']['layer'] = AttribDef(DXFString, 8, priority=45)
+
+
+_DEFAULT_LAYER = {'layer': '0'}
+
+# cache: entity class -> True if entities are written as one DXF tag
+_LEAF_ENTITY_TYPES = {}
+
+
+class _AttribsView(dict):
+    """ Read-only dict of the DXF tag objects of an entity, see
+    :attr:`_Entity.attribs`.
+    """
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("attribs is read-only, set attributes by entity[key] = value.")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+
 
 class _Entity(object):
     DXF_ENTITY_NAME = 'ABSTRACT'
     DXF_ATTRIBUTES = {}
 
     def __init__(self, **kwargs):
-        self.attribs = {}
+        cls = self.__class__
+        layout = get_attrib_layout(cls)
+        self._values = layout.new_values()
+        if layout.trusted and cls.__setitem__ is _Entity.__setitem__:
+            try:  # store values without checks and casts, ignores None values
+                layout.update_trusted(self._values, _DEFAULT_LAYER)
+                layout.update_trusted(self._values, kwargs)
+            except KeyError as error:
+                raise KeyError("Invalid attribute '%s' for Entity '%s'." % (str(error.args[0]), cls.__name__))
+            return
         self['layer'] = '0'  # set default layer
         # set attribs from kwargs
         for key, value in kwargs.items():
@@ -200,34 +232,49 @@ class _Entity(object):
 
     def __setitem__(self, key, value):
         if self.is_valid_attribute_name(key):
-            self.attribs[key] = self._get_dxf_atom(key, value)  # factory is called
+            # store the raw value, DXF tags are created at output
+            get_attrib_layout(self.__class__).set_value(self._values, key, value)
         else:
             raise KeyError("Invalid attribute '%s' for Entity '%s'." % (str(key), self.__class__.__name__))
 
     def __getitem__(self, key):
         if self.is_valid_attribute_name(key):
-            element = self.attribs[key]
-            try:
-                return element.value  # DXFAtom
-            except AttributeError:
-                return element  # DXFList or list or tuple or DXFPoint
+            return get_attrib_layout(self.__class__).get_value(self._values, key)
         else:
             raise KeyError("Invalid attribute '%s' for Entity '%s'." % (str(key), self.__class__.__name__))
 
-    def _get_dxf_atom(self, attribname, value):
-        """ create an object for attribname by factory from attribute_definition """
-        attrib = self.DXF_ATTRIBUTES[attribname]
-        return attrib.factory(value, attrib.group_code)
+    def __contains__(self, key):
+        """ True if attribute `key` is present. """
+        layout = get_attrib_layout(self.__class__)
+        try:
+            return self._values[layout.index[key]] is not None
+        except KeyError:
+            return False
 
-    def _priority(self, key):
-        """ get priority of attribute key """
-        return self.DXF_ATTRIBUTES[key].priority
+    def keys(self):
+        """ Keys of the present attributes. """
+        return get_attrib_layout(self.__class__).present_keys(self._values)
+
+    def get(self, key, default=None):
+        """ Get attribute `key` or `default` if attribute is not present. """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    @property
+    def attribs(self):
+        """ Present attributes as read-only dict of DXF tag objects, for
+        compatibility only, raises TypeError for changes.
+        """
+        layout = get_attrib_layout(self.__class__)
+        return _AttribsView((key, layout.create_tag(index, value))
+                            for index, (key, value) in enumerate(izip(layout.keys, self._values))
+                            if value is not None)
 
     def get_attribs(self):
         """ get attribs sorted by priority """
-        priority_attribs = [(self._priority(key), value)
-                            for key, value in self.attribs.items()]
-        return [value for priority, value in sorted(priority_attribs)]
+        return get_attrib_layout(self.__class__).get_tags(self._values)
 
     def get_data(self):  # abstract
         # example: block->content, polyline->vertices, faces, insert->attribs
@@ -237,21 +284,73 @@ class _Entity(object):
         """ Validate object before dxf output. """
         return True
 
+    def validate(self):
+        """ Validate the attribute values, required for entities created in
+        the trusted input mode, see :func:`~dxfwrite.base.trusted_input`.
+        Raises :class:`DXFValidationError` for invalid values.
+        """
+        get_attrib_layout(self.__class__).validate(self.DXF_ENTITY_NAME, self._values)
+
     def extension_point(self):  # abstract
         """ general extension point, first call in __dxftags__.
         """
         pass
 
-    def __dxf__(self):
-        """ Create the dxf string. """
-        return dxfstr(self.__dxftags__())
+    @classmethod
+    def __dxfleaf__(cls):
+        """ Entities without data are written as one DXF tag by __dxf__(). """
+        return cls.get_data is _Entity.get_data and \
+            cls.__dxftags__ is _Entity.__dxftags__ and \
+            cls.__dxf__ is _Entity.__dxf__
+
+    def __dxf__(self, fmt=None):
+        """ Create the dxf string.
+
+        :param fmt: :class:`DXFFormat` object or `None` for the default format
+        """
+        cls = self.__class__
+        is_leaf = _LEAF_ENTITY_TYPES.get(cls)
+        if is_leaf is None:
+            is_leaf = _LEAF_ENTITY_TYPES[cls] = cls.__dxfleaf__()
+        if is_leaf:
+            self.extension_point()  # last chance to manipulate the entity
+            if self.valid():
+                return get_attrib_layout(cls).serialize(self.DXF_ENTITY_NAME, self._values, fmt)
+            else:
+                raise DXFValidationError("invalid or missing attributes in object '%s'." % self.__class__.__name__)
+        return tags2str(self.__dxftags__(), fmt)
+
+    def __dxfbin__(self, encoding=BINARY_ENCODING):
+        """ Create the binary DXF data. """
+        cls = self.__class__
+        is_leaf = _LEAF_ENTITY_TYPES.get(cls)
+        if is_leaf is None:
+            is_leaf = _LEAF_ENTITY_TYPES[cls] = cls.__dxfleaf__()
+        if is_leaf:
+            self.extension_point()  # last chance to manipulate the entity
+            if self.valid():
+                return get_attrib_layout(cls).serialize_binary(self.DXF_ENTITY_NAME, self._values, encoding)
+            else:
+                raise DXFValidationError("invalid or missing attributes in object '%s'." % self.__class__.__name__)
+        return tags2bin(self.__dxftags__(), encoding)
+
+    def iterpoints(self):
+        """ Yields (index_shift, coords) of the present point attributes. """
+        return get_attrib_layout(self.__class__).iterpoints(self._values)
+
+    def iterentities(self):
+        """ Yields (entity name, :class:`AttribLayout`, values). """
+        yield self.DXF_ENTITY_NAME, get_attrib_layout(self.__class__), self._values
+
+    def _attrib_tags(self):
+        return AttribTags(self.DXF_ENTITY_NAME, get_attrib_layout(self.__class__), self._values)
 
     def __dxftags__(self):
         self.extension_point()  # last chance to manipulate the entity
         if self.valid():
             dxftags = DXFList()
-            dxftags.append(DXFAtom(self.DXF_ENTITY_NAME))
-            dxftags.extend(self.get_attribs())  # attribs sorted by priority
+            # entity name and attribs, written by a compiled serializer
+            dxftags.append(self._attrib_tags())
             dxftags.extend(self.get_data())  # example: block->content, polyline->vertices, faces, insert->attribs
             return dxftags
         else:
@@ -264,8 +363,8 @@ class Line(_Entity):
 
     def __init__(self, **kwargs):
         default = {
-            'start': (0, 0),
-            'end': (0, 0),
+            'start': (0., 0.),
+            'end': (0., 0.),
         }
         default.update(kwargs)
         super(Line, self).__init__(**default)
@@ -277,7 +376,7 @@ class Point(_Entity):
 
     def __init__(self, **kwargs):
         default = {
-            'point': (0, 0),
+            'point': (0., 0.),
         }
         default.update(kwargs)
         super(Point, self).__init__(**default)
@@ -296,7 +395,7 @@ class Solid(_Entity):
             self[key] = point
 
     def extension_point(self):
-        if 3 not in self.attribs:
+        if 3 not in self:
             try:  # set point self[3] equal to point self[2]
                 self[3] = self[2]['xyz']  # has to be a tuple
             except KeyError:  # valid() fails if self[2] does not exist
@@ -304,7 +403,7 @@ class Solid(_Entity):
 
     def valid(self):
         for key in (0, 1, 2, 3):
-            if key not in self.attribs:
+            if key not in self:
                 return False
         return True
 
@@ -325,7 +424,7 @@ class Shape(_Entity):
 
     def __init__(self, **kwargs):
         default = {
-            'insert': (0, 0),
+            'insert': (0., 0.),
         }
         default.update(kwargs)
         super(Shape, self).__init__(**default)
@@ -337,8 +436,8 @@ class Text(_Entity):
 
     def __init__(self, **kwargs):
         default = {
-            'insert': (0, 0),
-            'height': 1,
+            'insert': (0., 0.),
+            'height': 1.,
             'text': 'Text',
         }
         default.update(kwargs)
@@ -351,10 +450,10 @@ class Arc(_Entity):
 
     def __init__(self, **kwargs):
         default = {
-            'center': (0, 0),
-            'radius': 1,
-            'startangle': 0,
-            'endangle': 360,
+            'center': (0., 0.),
+            'radius': 1.,
+            'startangle': 0.,
+            'endangle': 360.,
         }
         default.update(kwargs)
         super(Arc, self).__init__(**default)
@@ -366,8 +465,8 @@ class Circle(_Entity):
 
     def __init__(self, **kwargs):
         default = {
-            'center': (0, 0),
-            'radius': 1,
+            'center': (0., 0.),
+            'radius': 1.,
         }
         default.update(kwargs)
         super(Circle, self).__init__(**default)
@@ -383,7 +482,7 @@ class Insert(_Entity):
 
     def __init__(self, **kwargs):
         default = {
-            'insert': (0, 0),  # the default location
+            'insert': (0., 0.),  # the default location
         }
         default.update(kwargs)
         super(Insert, self).__init__(**default)
@@ -408,8 +507,7 @@ class Insert(_Entity):
                           for axis in range(len(attrib_insert))))
 
         def get_scale_values():
-            scale1 = DXFFloat(1.)
-            return [self.attribs.get(value_name, scale1).value for value_name in ('xscale', 'yscale', 'zscale')]
+            return [self.get(value_name, 1.) for value_name in ('xscale', 'yscale', 'zscale')]
 
         def scale():
             scale_values = get_scale_values()
@@ -436,11 +534,10 @@ class Insert(_Entity):
                           for axis in range(len(insert_insert))))
 
         if relative is True:
-            angel0 = DXFAngle(0.)
             attrib_insert = attrib['insert']['xyz']
-            attrib_angle = attrib.attribs.get('rotation', angel0).value
+            attrib_angle = attrib.get('rotation', 0.)
             insert_insert = self['insert']['xyz']
-            insert_angle = self.attribs.get('rotation', angel0).value
+            insert_angle = self.get('rotation', 0.)
 
             attrib_insert = move_attrib_insert_point_to_basepoint()
             attrib_insert = scale()
@@ -476,8 +573,8 @@ class Attdef(_Entity):
 
     def __init__(self, **kwargs):
         default = {
-            'insert': (0, 0),
-            'height': 1,
+            'insert': (0., 0.),
+            'height': 1.,
             'text': 'Attrib',
             'prompt': 'Input:',
             'tag': 'ATTRIB',
@@ -491,14 +588,14 @@ class Attdef(_Entity):
 
         :param kwargs: override the ATTDEF default values.
         """
-        for key in self.attribs.keys():
+        for key in self.keys():
             if key not in ('prompt', 'tag', 'insert', 'alignpoint'):  # insert here attribs to ignore
                 kwargs.setdefault(key, self[key])  # set key only if not present
         kwargs['tag'] = self['tag']  # has to be the same tag
         # special case for dxfpoints
         for pointname in ('insert', 'alignpoint'):
             if (pointname not in kwargs) and \
-                    (pointname in self.attribs):
+                    (pointname in self):
                 kwargs[pointname] = self[pointname]['xyz']  # get the tuple(x,y,z)
         return Attrib(**kwargs)
 
@@ -515,8 +612,8 @@ class Attrib(_Entity):
 
     def __init__(self, **kwargs):
         default = {
-            'insert': (0, 0),
-            'height': 1,
+            'insert': (0., 0.),
+            'height': 1.,
             'text': 'Attrib',
             'tag': 'ATTRIB',
             'flags': 0,
@@ -539,7 +636,7 @@ class Block(_Entity):
         default = {
             'name': 'empty',
             'flags': 0,
-            'basepoint': (0, 0),
+            'basepoint': (0., 0.),
         }
         default.update(kwargs)
         super(Block, self).__init__(**default)
@@ -589,6 +686,8 @@ class Polyline(_Entity):
 
     .. attribute:: vertices
 
+        :class:`VertexBuffer` of the polyline vertices
+
     """
     DXF_ENTITY_NAME = 'POLYLINE'
     DXF_ATTRIBUTES = _DXF12_ENTITY_ATTRIBUTE_DEFINITION['POLYLINE']
@@ -602,12 +701,13 @@ class Polyline(_Entity):
             points = []
         default = {
             'vertices_follow': 1,
-            'polyline_elevation': (0, 0, 0),
+            'polyline_elevation': (0., 0., 0.),
             'flags': const.POLYLINE_3D_POLYLINE,
         }
         default.update(kwargs)
         super(Polyline, self).__init__(**default)
-        self.vertices = DXFList()
+        self.vertices = VertexBuffer()
+        self._seqend = False  # True after the first output, SEQEND is written by get_data()
         self.add_vertices(points)
 
     def close(self, status=True):
@@ -622,36 +722,80 @@ class Polyline(_Entity):
 
         :param point: is a (x, y) or (x, y, z) tuple, z-value of a 2D point is 0.
         """
-        if not kwargs.get('layer'):
-            kwargs['layer'] = self['layer']
-        self.vertices.append(Vertex(location=point, **kwargs))
+        layer = kwargs.pop('layer', None) or self['layer']
+        self.vertices.append(point, layer, kwargs)
 
-    def add_vertices(self, points):
+    def add_vertices(self, points, **kwargs):
         """ Add a list of vertices.
 
         :param points: list of points, 2D or 3D points, z-value of 2D points is 0.
+        :param kwargs: vertex attributes like startwidth, endwidth and bulge,
+            scalars for all vertices or sequences with one value per vertex
         """
-        for point in points:
-            self.add_vertex(point)
+        self.vertices.extend(points, self['layer'], kwargs)
 
     def extension_point(self):
-        if not self.valid():
-            self.vertices.append(DXFAtom('SEQEND'))
+        self._seqend = True
 
     def valid(self):
-        if len(self.vertices) == 0:
-            return False
-        else:
-            return self.vertices.endswith('SEQEND')
+        # like a vertex list ending with SEQEND, a polyline without vertices is
+        # written as POLYLINE and SEQEND
+        return self._seqend
+
+    def _attrib_tags(self):
+        return PolylineTags(self.DXF_ENTITY_NAME, get_attrib_layout(self.__class__), self._values, self.vertices)
 
     def get_data(self):
-        return self.vertices
+        return DXFList((self.vertices, DXFAtom('SEQEND')))
+
+
+class PolylineTags(AttribTags):
+    """ POLYLINE entity name and attributes, a 3D polyline with all vertices
+    in the xy-plane is written as 2D polyline, if the :class:`DXFFormat`
+    drops zero z-axis. Polylines with widths, bulges or an extrusion
+    direction remain 3D polylines, because 3D polylines ignore these
+    attributes.
+    """
+    __slots__ = ('vertices', )
+
+    def __init__(self, name, layout, values, vertices):
+        super(PolylineTags, self).__init__(name, layout, values)
+        self.vertices = vertices
+
+    def __dxf__(self, fmt=None):
+        values = self.values
+        if fmt is not None and fmt.drop_zero_z and self.is_planar():
+            values = list(values)
+            values[self.layout.index['flags']] &= ~const.POLYLINE_3D_POLYLINE
+        return self.layout.serialize(self.name, values, fmt)
+
+    def is_planar(self):
+        """ True if the polyline is a 3D polyline, which is identical to a 2D
+        polyline.
+        """
+        layout = self.layout
+        values = self.values
+        flags = values[layout.index['flags']]
+        if flags is None or flags & (const.POLYLINE_3D_POLYLINE | const.POLYLINE_3D_POLYMESH |
+                                     const.POLYLINE_POLYFACE) != const.POLYLINE_3D_POLYLINE:
+            return False
+        for key in ('startwidth', 'endwidth'):
+            if values[layout.index[key]]:
+                return False
+        extrusion = values[layout.index['extrusion_direction']]
+        if extrusion is not None and tuple(extrusion) != (0., 0., 1.):
+            return False
+        vertices = self.vertices
+        return not (vertices.entities or vertices.columns or any(vertices.coords[2::3]))
 
 
 class Polymesh(_Entity):
     """ Special case of POLYLINE, creates a m(rows) x n(cols) Polymesh, each
     column has m vertices and each row has n vertices. All mesh indices are
     zero based.
+
+    The vertex locations are stored as dense m x n x 3 coordinate buffer, see
+    :class:`VertexBuffer`, unset vertices are located at (0, 0, 0).
     """
     DXF_ENTITY_NAME = 'POLYLINE'  # a polymesh is also a polyline
     DXF_ATTRIBUTES = _DXF12_ENTITY_ATTRIBUTE_DEFINITION['POLYLINE']
@@ -671,7 +815,10 @@ class Polymesh(_Entity):
         }
         default.update(kwargs)
         super(Polymesh, self).__init__(**default)
-        self.vertices = {}
+        self.nrows = int(nrows)
+        self.ncols = int(ncols)
+        self.vertices = VertexBuffer(flags=const.VTX_3D_POLYGON_MESH_VERTEX)
+        self.vertices.coords = array('d', (0., )) * (self.nrows * self.ncols * 3)
 
     def set_mclosed(self, status):
         flags = self['flags']
@@ -683,10 +830,6 @@ class Polymesh(_Entity):
         self['flags'] = set_flag(flags, const.POLYLINE_MESH_CLOSED_N_DIRECTION,
                                  status)
 
-    def _build_vertex(self, point):
-        return Vertex(location=point, flags=const.VTX_3D_POLYGON_MESH_VERTEX,
-                      layer=self['layer'])
-
     def set_vertex(self, row, col, point):
         """ Set location of vertex (row, col).
 
@@ -694,24 +837,51 @@ class Polymesh(_Entity):
         :param in col: zero based mesh index
         :param point: vertex location as (x, y, z) tuple
         """
-        self.vertices[(row, col)] = self._build_vertex(point)
+        if not (0 <= row < self.nrows and 0 <= col < self.ncols):
+            raise IndexError("Mesh index (%d, %d) out of range." % (row, col))
+        self.vertices.set_location(row * self.ncols + col, point)
+
+    def set_vertices(self, grid, origin=(0., 0.), spacing=(1., 1.)):
+        """ Set the locations of all vertices.
+
+        :param grid: `nrows` rows of `ncols` (x, y, z) tuples, or a heightfield
+            of `nrows` rows of `ncols` z-values, also NumPy arrays of shape
+            (nrows, ncols, 3) or (nrows, ncols)
+        :param origin: (x, y) location of vertex (0, 0) of a heightfield
+        :param spacing: (row, col) distance of the heightfield vertices in
+            x- and y-direction
+        """
+        grid = list(grid)
+        if len(grid) != self.nrows:
+            raise ValueError("Polymesh requires %d rows of vertices." % self.nrows)
+        ncols = self.ncols
+        ys = [origin[1] + col * float(spacing[1]) for col in xrange(ncols)]
+        coords = array('d')
+        for index, row in enumerate(grid):
+            if len(row) != ncols:
+                raise ValueError("Polymesh requires %d vertices per row." % ncols)
+            if hasattr(row[0], '__len__'):  # (x, y, z) tuples
+                coords.extend(coords_array(row, 3)[0])
+            else:  # heightfield
+                x = origin[0] + index * float(spacing[0])
+                coords.extend(chain.from_iterable(izip(repeat(x), ys, map(float, row))))
+        self.vertices.coords = coords
 
     def get_vertices(self):
-        vertex0 = Vertex(location=(0, 0, 0))  # default point
-        return ( self.vertices.get((row, col), vertex0)
-                 for row in xrange(self['mcount'])
-                 for col in xrange(self['ncount'])
-        )
+        self.vertices.layer = self['layer']
+        return iter(self.vertices)
 
     def get_data(self):
-        data = DXFList(self.get_vertices())
-        data.append(DXFAtom('SEQEND'))
-        return data
+        self.vertices.layer = self['layer']
+        return DXFList((self.vertices, DXFAtom('SEQEND')))
 
 
 class Polyface(_Entity):
     """ Another special case of POLYLINE, to create a freeform 3D object,
     which consist of arbitrary count of faces.
+
+    The vertices are stored in a :class:`VertexBuffer` and the face records
+    in a :class:`FaceBuffer`, both are written on the layer of the polyface.
     """
     DXF_ENTITY_NAME = 'POLYLINE'  # a polyface is also a polyline
     DXF_ATTRIBUTES = _DXF12_ENTITY_ATTRIBUTE_DEFINITION['POLYLINE']
@@ -726,20 +896,10 @@ class Polyface(_Entity):
         default.update(kwargs)
         super(Polyface, self).__init__(**default)
         self.precision = precision
-        self.vertices = DXFList()
-        self.faces = DXFList()
+        self.vertices = VertexBuffer(flags=const.VTX_3D_POLYGON_MESH_VERTEX + const.VTX_3D_POLYFACE_MESH_VERTEX)
+        self.faces = FaceBuffer()
         self.point2index = {}
 
-    def _build_vertex(self, point):
-        return Vertex(location=point,
-                      layer=self['layer'],
-                      flags=const.VTX_3D_POLYGON_MESH_VERTEX + \
-                            const.VTX_3D_POLYFACE_MESH_VERTEX)
-
-    def _build_face(self, color):
-        return Vertex(flags=const.VTX_3D_POLYFACE_MESH_VERTEX, color=color,
-                      layer=self['layer'])
-
     # do not delete 'location' for the face-vertex, it is needed,
     # even though it is always (0,0,0), tested with AutoCAD
 
@@ -752,7 +912,7 @@ class Polyface(_Entity):
         # len-check prevents usage of generators!
         # if len(vertices) not in (3, 4): raise ValueError
         self.add_face_by_indices(
-            (self.add_vertex(point) for point in vertices),
+            [self.add_vertex(point) for point in vertices],
             color)
 
     def add_vertex(self, point):
@@ -760,39 +920,74 @@ class Polyface(_Entity):
 
         :param point: vertex location as (x, y, z) tuple
         """
+        coords, count = coords_array((point, ), 3)
+        return self._add_locations(coords, self.precision)[0]
 
-        def key(point):
-            """ Vertex key with reduced floating point precision, near points
-            will reference the same vertex. This reduces the vertices count, but
-            it also reduces the accuracy of the model, use this wisely. You can
-            control the function by the parameter self.precision, which determines
-            the floating point precision.
+    def _add_locations(self, coords, precision):
+        """ Add the vertices of the flat xyz-coordinates `coords`, returns the
+        vertex indices as array('l').
 
-            remember: only the key has reduced precision not the point itself. !!!
-            """
-            return tuple([round(coord, self.precision) for coord in point])
+        Vertex keys have reduced floating point precision, near points will
+        reference the same vertex. This reduces the vertices count, but it
+        also reduces the accuracy of the model, use this wisely. You can
+        control the function by the parameter `precision`, which determines
+        the floating point precision.
 
-        try:
-            index = self.point2index[key(point)]  # use existing vertex
-        except KeyError:  # add new point
-            index = len(self.vertices)
-            self.vertices.append(self._build_vertex(point))
-            self.point2index[key(point)] = index
-        return index
+        remember: only the key has reduced precision not the point itself. !!!
+        """
+        point2index = self.point2index
+        start = len(point2index)
+        rounded = iter(map(round, coords, repeat(precision)))
+        keys = izip(rounded, rounded, rounded)
+        # one pass: existing vertices get their index, new vertices the next index
+        setdefault = point2index.setdefault
+        indices = array('l', [setdefault(key, len(point2index)) for key in keys])
+        new_vertices = array('d')
+        next_index = start
+        for row, index in enumerate(indices):
+            if index == next_index:  # first occurrence of a new vertex
+                new_vertices.extend(coords[row * 3:row * 3 + 3])
+                next_index += 1
+        self.vertices.coords.extend(new_vertices)
+        return indices
 
     def add_face_by_indices(self, indices, color=0):
         """ indices is a list or tuple of vertex indices (got from add_vertex).
         """
-        face = self._build_face(color)
-        for (key, vertex_index) in enumerate(indices):
-            face[key] = vertex_index + 1  # dxf index is 1 based
-        self.faces.append(face)
+        self.faces.append([index + 1 for index in indices], color)  # dxf index is 1 based
+
+    def add_mesh(self, vertices, faces, colors=0, precision=None):
+        """ Add a mesh of `vertices` and `faces`, near vertices are merged
+        with each other and with the existing vertices.
+
+        :param vertices: sequence of (x, y, z) tuples or NumPy array of
+            shape (n, 3)
+        :param faces: sequence of 3 or 4 indices into `vertices` for each
+            face, or NumPy array of shape (m, 3) or (m, 4)
+        :param colors: color of all faces or sequence of face colors
+        :param precision: vertex-coords will be rounded to precision places
+            for the comparison of the vertices, default is the precision of
+            the polyface
+        """
+        if precision is None:
+            precision = self.precision
+        coords, count = coords_array(vertices, 3)
+        indices = self._add_locations(coords, precision)
+        if not _is_column(colors):
+            colors = repeat(colors)
+        elif len(colors) != len(faces):
+            raise ValueError("One color per face required.")
+        append_face = self.faces.append
+        for face, color in izip(faces, colors):
+            append_face([indices[index] + 1 for index in face], color)  # dxf index is 1 based
 
     def extension_point(self):
         self['mcount'] = len(self.vertices)
         self['ncount'] = len(self.faces)
 
     def get_data(self):
+        layer = self['layer']
+        self.vertices.layer = self.faces.layer = layer
         return DXFList([self.vertices, self.faces, DXFAtom('SEQEND')])
 
 
@@ -805,12 +1000,378 @@ class Vertex(_Entity):
 
     def __init__(self, **kwargs):
         default = {
-            'location': (0, 0, 0),
+            'location': (0., 0., 0.),
         }
         default.update(kwargs)
         super(Vertex, self).__init__(**default)
 
 
+# vertex attributes stored as columns by the VertexBuffer, in output order
+_VERTEX_COLUMNS = ('startwidth', 'endwidth', 'bulge')
+_ABSENT = float('nan')  # value of absent attributes in columns
+
+
+def _is_column(value):
+    return not is_string(value) and hasattr(value, '__len__')
+
+
+def _vertex_template(scalars, columns, fmt, planar=False):
+    """ Returns the format string of one VERTEX entity, `scalars` is a dict
+    of the attribute values of all rows, `columns` are the names of the
+    attributes with one value per row, in output order. The location column
+    has 2 coordinates if `planar`, else 3 coordinates.
+
+    If `fmt` omits defaults, scalars equal to their default value are
+    omitted, the layer has no default value.
+    """
+    layout = get_attrib_layout(Vertex)
+    omit_defaults = fmt is not None and fmt.omit_defaults
+    template = ["  0\nVERTEX\n"]
+    for index, (key, attribdef) in enumerate(izip(layout.keys, layout.definitions)):
+        if key in columns:
+            if key == 'location':
+                template.append(" 10\n%s\n 20\n%s\n" if planar else " 10\n%s\n 20\n%s\n 30\n%s\n")
+            else:
+                template.append("%3d\n%%s\n" % attribdef.group_code)
+        elif scalars.get(key) is not None:
+            if omit_defaults and layout.is_default(index, scalars[key]):
+                continue
+            tag = layout.create_tag(index, scalars[key])
+            template.append(tags2str(tag, fmt).replace('%', '%%'))
+    return "".join(template)
+
+
+def _runs(start, stop, key):
+    """ Yields (key, first, last) of the runs of rows `start` to `stop` with
+    equal key(row), `last` is exclusive.
+    """
+    for value, rows in groupby(xrange(start, stop), key):
+        first = last = next(rows)
+        for last in rows:
+            pass
+        yield value, first, last + 1
+
+
+class VertexBuffer(object):
+    """ Compact vertex storage of :class:`Polyline`: the locations as flat
+    array of xyz-coordinates and startwidth, endwidth and bulge as optional
+    columns, absent values are NaN. Vertices on another layer or with other
+    attributes are stored as :class:`Vertex` entities.
+
+    The VERTEX entities are written in chunks of rows by one string format
+    operation per chunk, the output is identical to single :class:`Vertex`
+    entities.
+
+    :param flags: vertex flags of all vertices or `None`
+    """
+    CHUNK_SIZE = 1000  # vertices per DXF tag in the output
+
+    def __init__(self, flags=None):
+        self.layer = None
+        self.flags = flags
+        self.coords = array('d')
+        self.columns = {}  # attribute name -> array('d')
+        self.entities = {}  # vertex index -> Vertex
+        self._templates = {}  # (present columns, planar, layer, DXFFormat or None) -> row template
+        self._packers = {}  # (present columns, layer, encoding) -> row packer
+
+    def __len__(self):
+        return len(self.coords) // 3
+
+    def __getitem__(self, index):
+        """ Get vertex `index` as :class:`Vertex` entity. """
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(index)
+        try:
+            return self.entities[index]
+        except KeyError:
+            attribs = dict((name, column[index]) for name, column in self.columns.items()
+                           if column[index] == column[index])  # NaN is absent
+            if self.flags is not None:
+                attribs['flags'] = self.flags
+            return Vertex(location=tuple(self.coords[index * 3:index * 3 + 3]), layer=self.layer, **attribs)
+
+    def __iter__(self):
+        for index in xrange(len(self)):
+            yield self[index]
+
+    def _buffered(self, layer, attribs):
+        """ True if vertices with `layer` and `attribs` can be stored as rows. """
+        if self.layer is None:
+            self.layer = layer
+        return layer == self.layer and all(name in _VERTEX_COLUMNS for name in attribs)
+
+    def _column(self, name):
+        try:
+            return self.columns[name]
+        except KeyError:
+            column = array('d', repeat(_ABSENT, len(self)))
+            self.columns[name] = column
+            return column
+
+    def append(self, point, layer, attribs):
+        """ Append a vertex located at `point`.
+
+        :param str layer: layer name
+        :param dict attribs: further vertex attributes
+        """
+        attribs = dict((key, value) for key, value in attribs.items() if value is not None)
+        if not self._buffered(layer, attribs):
+            if self.flags is not None:
+                attribs.setdefault('flags', self.flags)
+            self.entities[len(self)] = Vertex(location=point, layer=layer, **attribs)
+            attribs = {}
+        columns = [(self._column(name), float(value)) for name, value in attribs.items()]
+        self.coords.extend(coords_array((point,), 3)[0])
+        for column in self.columns.values():
+            column.append(_ABSENT)
+        for column, value in columns:
+            column[-1] = value
+
+    def extend(self, points, layer, attribs):
+        """ Append vertices located at `points`.
+
+        :param str layer: layer name
+        :param dict attribs: further vertex attributes, scalars for all
+            vertices or sequences with one value per vertex
+        """
+        attribs = dict((key, value) for key, value in attribs.items() if value is not None)
+        if not self._buffered(layer, attribs):
+            points = list(points)
+            values = [[(key, value[index] if _is_column(value) else value)
+                       for key, value in attribs.items()] for index in xrange(len(points))]
+            for point, vertex_attribs in izip(points, values):
+                self.append(point, layer, dict(vertex_attribs))
+            return
+        coords, dims = coords_array(points, 3)
+        count = len(coords) // 3
+        for name in _VERTEX_COLUMNS:
+            value = attribs.get(name)
+            if value is None:
+                if name in self.columns:
+                    self.columns[name].extend(repeat(_ABSENT, count))
+            elif _is_column(value):
+                if len(value) != count:
+                    raise ValueError("Attribute '%s' requires one value per vertex." % name)
+                self._column(name).extend(map(float, value))
+            else:
+                self._column(name).extend(repeat(float(value), count))
+        self.coords.extend(coords)
+
+    def __dxf__(self, fmt=None):
+        return tags2str(self, fmt)
+
+    def set_location(self, index, point):
+        """ Set location of vertex `index` to `point`. """
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        self.coords[index * 3:index * 3 + 3] = coords_array((point,), 3)[0]
+        if index in self.entities:
+            self.entities[index]['location'] = point
+
+    def __dxftags__(self):
+        tags = []
+        start = 0
+        for index in sorted(self.entities):
+            tags.extend(self._chunks(start, index))
+            tags.append(self.entities[index])
+            start = index + 1
+        tags.extend(self._chunks(start, len(self)))
+        return tags
+
+    def _chunks(self, start, stop):
+        chunk_size = self.CHUNK_SIZE
+        return [BatchChunk(self, first, min(first + chunk_size, stop))
+                for first in xrange(start, stop, chunk_size)]
+
+    def _present_columns(self, row):
+        return tuple(name for name in _VERTEX_COLUMNS
+                     if name in self.columns and self.columns[name][row] == self.columns[name][row])
+
+    def rows2str(self, start, stop, fmt=None):
+        """ Create the DXF string for the vertices `start` to `stop`.
+
+        :param fmt: :class:`DXFFormat` object or `None` for the default format
+        """
+        if not self.columns:
+            return self._run2str((), start, stop, fmt)
+        return "".join(self._run2str(present, first, last, fmt)
+                       for present, first, last in _runs(start, stop, self._present_columns))
+
+    def _template(self, present, fmt, planar=False):
+        key = (present, planar, self.layer, fmt)
+        try:
+            return self._templates[key]
+        except KeyError:
+            scalars = {'layer': self.layer, 'flags': self.flags}
+            template = _vertex_template(scalars, ('location', ) + present, fmt, planar)
+            self._templates[key] = template
+            return template
+
+    def _values(self, present, start, stop, planar=False):
+        coords = self.coords
+        values = [coords[start * 3 + axis:stop * 3:3] for axis in ((0, 1) if planar else (0, 1, 2))]
+        values.extend(self.columns[name][start:stop] for name in present)
+        return values
+
+    def _run2str(self, present, start, stop, fmt):
+        # 2D output, if the DXFFormat drops the z-axis and all vertices of the run have z-axis 0
+        planar = fmt is not None and fmt.drop_zero_z and not any(self.coords[start * 3 + 2:stop * 3:3])
+        template = self._template(present, fmt, planar)
+        values = self._values(present, start, stop, planar)
+        if fmt is not None and fmt.formats_floats:
+            values = [map(fmt.float2str, column) for column in values]
+        return (template * (stop - start)) % tuple(chain.from_iterable(izip(*values)))
+
+    def rows2bin(self, start, stop, encoding=BINARY_ENCODING):
+        """ Create the binary DXF data for the vertices `start` to `stop`. """
+        if not self.columns:
+            return self._run2bin((), start, stop, encoding)
+        return b"".join(self._run2bin(present, first, last, encoding)
+                        for present, first, last in _runs(start, stop, self._present_columns))
+
+    def _run2bin(self, present, start, stop, encoding):
+        key = (present, self.layer, encoding)
+        try:
+            pack = self._packers[key]
+        except KeyError:
+            pack = compile_row_packer(self._template(present, None), encoding)
+            self._packers[key] = pack
+        return b"".join(map(pack, *self._values(present, start, stop)))
+
+    def iterpoints(self, start=0, stop=None):
+        """ Yields (index_shift, coords) of the vertex locations `start` to
+        `stop`.
+        """
+        if stop is None:
+            stop = len(self)
+        coords = self.coords
+        for row in xrange(start, stop):
+            yield 0, tuple(coords[row * 3:row * 3 + 3])
+
+
+class FaceBuffer(object):
+    """ Compact storage of the face records of :class:`Polyface`: four
+    1-based vertex indices per face as array('l'), 0 for absent indices of
+    faces with less than four vertices, and the face colors as array('l').
+    """
+    CHUNK_SIZE = 1000  # faces per DXF tag in the output
+
+    def __init__(self):
+        self.layer = None
+        self.indices = array('l')
+        self.colors = array('l')
+        self._templates = {}  # (index count, layer, DXFFormat or None) -> row template
+        self._packers = {}  # (index count, layer, encoding) -> row packer
+
+    def __len__(self):
+        return len(self.colors)
+
+    def __getitem__(self, index):
+        """ Get face `index` as :class:`Vertex` entity. """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        face = Vertex(flags=const.VTX_3D_POLYFACE_MESH_VERTEX, color=self.colors[index], layer=self.layer)
+        for key in xrange(self._count(index)):
+            face[key] = self.indices[index * 4 + key]
+        return face
+
+    def __iter__(self):
+        for index in xrange(len(self)):
+            yield self[index]
+
+    def append(self, indices, color):
+        """ Append a face.
+
+        :param indices: 1 to 4 1-based vertex indices
+        :param int color: face color
+        """
+        indices = [int(index) for index in indices]
+        if not 1 <= len(indices) <= 4:
+            raise ValueError("1 to 4 vertex indices per face required.")
+        self.indices.extend(indices)
+        self.indices.extend(repeat(0, 4 - len(indices)))
+        self.colors.append(int(color))
+
+    def _count(self, row):
+        """ Count of vertex indices of face `row`. """
+        indices = self.indices
+        index = row * 4 + 3
+        while indices[index] == 0:
+            index -= 1
+        return index - row * 4 + 1
+
+    def __dxf__(self, fmt=None):
+        return tags2str(self, fmt)
+
+    def __dxftags__(self):
+        chunk_size = self.CHUNK_SIZE
+        nrows = len(self)
+        return [BatchChunk(self, start, min(start + chunk_size, nrows))
+                for start in xrange(0, nrows, chunk_size)]
+
+    def rows2str(self, start, stop, fmt=None):
+        """ Create the DXF string for the faces `start` to `stop`.
+
+        :param fmt: :class:`DXFFormat` object or `None` for the default format
+        """
+        return "".join(self._run2str(count, first, last, fmt)
+                       for count, first, last in _runs(start, stop, self._count))
+
+    def _template(self, count, fmt):
+        key = (count, self.layer, fmt)
+        try:
+            return self._templates[key]
+        except KeyError:
+            scalars = {
+                'layer': self.layer,
+                'flags': const.VTX_3D_POLYFACE_MESH_VERTEX,
+                'location': (0., 0., 0.),  # is needed, tested with AutoCAD
+            }
+            template = _vertex_template(scalars, ('color', ) + tuple(xrange(count)), fmt)
+            self._templates[key] = template
+            return template
+
+    def _values(self, count, start, stop):
+        indices = self.indices
+        values = [self.colors[start:stop]]
+        values.extend(indices[start * 4 + key:stop * 4:4] for key in xrange(count))
+        return values
+
+    def _run2str(self, count, start, stop, fmt):
+        template = self._template(count, fmt)
+        values = self._values(count, start, stop)
+        return (template * (stop - start)) % tuple(chain.from_iterable(izip(*values)))
+
+    def rows2bin(self, start, stop, encoding=BINARY_ENCODING):
+        """ Create the binary DXF data for the faces `start` to `stop`. """
+        return b"".join(self._run2bin(count, first, last, encoding)
+                        for count, first, last in _runs(start, stop, self._count))
+
+    def _run2bin(self, count, start, stop, encoding):
+        key = (count, self.layer, encoding)
+        try:
+            pack = self._packers[key]
+        except KeyError:
+            pack = compile_row_packer(self._template(count, None), encoding)
+            self._packers[key] = pack
+        return b"".join(map(pack, *self._values(count, start, stop)))
+
+    def iterpoints(self, start=0, stop=None):
+        """ Yields (index_shift, coords) of the face record locations, which
+        are always (0, 0, 0).
+        """
+        if stop is None:
+            stop = len(self)
+        for row in xrange(start, stop):
+            yield 0, (0., 0., 0.)
+
+
 class Viewport(_Entity):
     """ The VIEWPORT entity creates viewports in paper space, this viewports
     shows a part of the model space. It is a tool to design the drawing layout.
@@ -57,7 +57,7 @@ class Insert2(object):
         self.color = color
         self.linetype = linetype
 
-    def _build(self):
+    def _build(self, fmt=None):
         def set_tags(insert_entity):
             basepoint = self.blockdef['basepoint']['xyz']
             for tag, text in self.attribs.items():
@@ -79,7 +79,7 @@ class Insert2(object):
                 insert[key] = value
 
         set_tags(insert)
-        return insert.__dxf__()
+        return insert.__dxf__(fmt)
 
-    def __dxf__(self):
-        return self._build()
+    def __dxf__(self, fmt=None):
+        return self._build(fmt)
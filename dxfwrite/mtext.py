@@ -19,7 +19,7 @@ __author__ = "mozman <mozman@gmx.at>"
 import math
 
 import dxfwrite
-from .base import DXFList, dxfstr
+from .base import DXFList, tags2str
 from .entities import Text
 from .mixins import SubscriptAttributes
 
@@ -126,10 +126,10 @@ class MText(SubscriptAttributes):
             'valign': self.valign,
         }
 
-    def __dxf__(self):
+    def __dxf__(self, fmt=None):
         """ Get the DXF string. 
         """
-        return dxfstr(self.__dxftags__())
+        return tags2str(self, fmt)
 
     def __dxftags__(self):
         return self._build_dxf_entities()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Purpose: parallel serialization of drawings
+# module belongs to package: dxfwrite.py
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+"""
+Parallel serialization of drawings: large lists of DXF tags, like the
+entities of the ENTITIES section and the content of large BLOCK definitions,
+are split into ordered partitions, the partitions are serialized by a pool of
+worker processes or threads and the results are written in order. The output
+is identical to the sequential output.
+
+The process pool passes the partitions to the workers at their start, the
+workers get only the indices of their partitions. The 'fork' start method is
+used on Linux while no other threads are running, the workers inherit the
+partitions and DXF entities are not pickled. Otherwise the 'forkserver' or
+'spawn' start method is used and the partitions are pickled once per worker,
+which requires the ``if __name__ == '__main__':`` guard of the main module.
+Python 3.6 has no pool initializer: the pool uses the default start method
+and each task gets its pickled partition.
+"""
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import multiprocessing
+import os
+import sys
+import threading
+from collections import deque
+from concurrent import futures
+
+from .base import DXFList, tags2str, tags2bin, _is_container_type, _CONTAINER_TYPES
+
+PARTITION_SIZE = 1000  # DXF tags per partition
+
+# (lists of DXF tags, DXFFormat, encoding, binary) of the parallel save, set only in worker processes
+_SHARED = None
+
+# process pools with initializer and start method, Python 3.7+
+POOL_INITIALIZER = sys.version_info >= (3, 7)
+
+
+def _is_container(tag):
+    cls = tag.__class__
+    is_container = _CONTAINER_TYPES.get(cls)
+    if is_container is None:
+        is_container = _is_container_type(cls)
+    return is_container
+
+
+def partitions(dxfobj, partition_size=PARTITION_SIZE):
+    """ Returns the ordered partitions of `dxfobj` as list of (tags, start,
+    stop) tuples, where `tags` is a list of DXF tags or containers.
+
+    Containers with at least `partition_size` tags are split into partitions
+    of their tags, smaller containers are flattened and consecutive DXF tags
+    are collected into partitions of `partition_size` tags.
+    """
+    result = []
+    collected = []
+
+    def flush():
+        if collected:
+            result.append((list(collected), 0, len(collected)))
+            del collected[:]
+
+    def split(tag):
+        if not _is_container(tag):
+            collected.append(tag)
+            if len(collected) >= partition_size:
+                flush()
+            return
+        tags = tag.__dxftags__()
+        if not isinstance(tags, (list, tuple)):
+            tags = list(tags)
+        if len(tags) >= partition_size:
+            flush()
+            result.extend((tags, start, min(start + partition_size, len(tags)))
+                          for start in range(0, len(tags), partition_size))
+        else:
+            for subtag in tags:
+                split(subtag)
+
+    split(dxfobj)
+    flush()
+    return result
+
+
+def _serialize(shared, job):
+    lists, fmt, encoding, binary = shared
+    index, start, stop = job
+    if binary:
+        return tags2bin(DXFList(lists[index][start:stop]), encoding)
+    string = tags2str(DXFList(lists[index][start:stop]), fmt)
+    return string if encoding is None else string.encode(encoding, 'replace')
+
+
+def _init_worker(shared):
+    global _SHARED
+    _SHARED = shared
+
+
+def _serialize_shared(job):
+    return _serialize(_SHARED, job)
+
+
+def start_method():
+    """ Returns the start method of the worker processes: 'fork' on Linux
+    while no other threads are running, because forking a process with
+    running threads is unsafe, and 'fork' is unsafe on macOS and not
+    available on Windows. Otherwise 'forkserver' if available or 'spawn'.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if sys.platform.startswith('linux') and 'fork' in methods and threading.active_count() == 1:
+        return 'fork'
+    return 'forkserver' if 'forkserver' in methods else 'spawn'
+
+
+def _create_executor(workers, executor, shared):
+    if executor == 'process':
+        if not POOL_INITIALIZER:
+            return futures.ProcessPoolExecutor(workers)
+        return futures.ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context(start_method()),
+                                           initializer=_init_worker, initargs=(shared, ))
+    elif executor == 'thread':
+        return futures.ThreadPoolExecutor(workers)
+    else:
+        raise ValueError("invalid executor '%s', use 'process' or 'thread'." % str(executor))
+
+
+def iterchunks_parallel(dxfobj, workers=None, executor='process', encoding=None, fmt=None,
+                        partition_size=PARTITION_SIZE, binary=False):
+    """ Yields the DXF string of `dxfobj` as serialized partitions in order,
+    the partitions are serialized by a pool of `workers` processes or
+    threads. Yields encoded bytes if `encoding` is not `None`, characters
+    which can not be encoded are replaced by '?'. Yields binary DXF data
+    without the binary DXF sentinel if `binary` is `True`, which requires an
+    `encoding`.
+
+    :param int workers: count of workers, `None` for the count of CPUs
+    :param str executor: 'process' for a process pool or 'thread' for a
+        thread pool
+    :param int partition_size: DXF tags per partition
+    """
+    workers = workers or os.cpu_count() or 1
+    parts = partitions(dxfobj, partition_size)
+    lists = []
+    list_index = {}  # id(tags) -> index in lists
+    jobs = []
+    for tags, start, stop in parts:
+        index = list_index.get(id(tags))
+        if index is None:
+            index = list_index[id(tags)] = len(lists)
+            lists.append(tags)
+        jobs.append((index, start, stop))
+    shared = (lists, fmt, encoding, binary)
+    if executor != 'process':
+        tasks = ((_serialize, shared, job) for job in jobs)
+    elif POOL_INITIALIZER:
+        tasks = ((_serialize_shared, job) for job in jobs)
+    else:  # each task gets its partition
+        tasks = ((_serialize, ([lists[index][start:stop]], fmt, encoding, binary), (0, 0, stop - start))
+                 for index, start, stop in jobs)
+
+    pool = _create_executor(workers, executor, shared)
+    try:
+        pending = deque()  # bounded count of submitted partitions
+        try:
+            for task in tasks:
+                pending.append(pool.submit(*task))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+    finally:
+        pool.shutdown(wait=True)
+
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Purpose: pipelined output, overlap formatting and writing
+# module belongs to package: dxfwrite.py
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+"""
+Pipelined output: the calling thread formats the DXF chunks into a bounded
+queue, while a writer thread writes the chunks to the file object, which
+overlaps the formatting with the latency of disks or networks.
+"""
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import threading
+from queue import Queue
+from time import perf_counter
+
+QUEUE_SIZE = 8  # chunks in the queue between formatter and writer
+
+_END = object()  # end of output marker
+
+
+class PipelineStats(object):
+    """ Statistics of a pipelined output.
+
+    .. attribute:: chunks
+
+        count of written chunks
+
+    .. attribute:: size
+
+        count of written bytes or chars
+
+    .. attribute:: producer_stalls
+
+        count of chunks, the formatter had to wait for a free place in the
+        queue, because the writer was too slow
+
+    .. attribute:: producer_stall_time
+
+        time in seconds, the formatter waited for the writer
+
+    .. attribute:: writer_stalls
+
+        count of chunks, the writer had to wait for, because the formatter
+        was too slow
+
+    .. attribute:: writer_stall_time
+
+        time in seconds, the writer waited for the formatter
+
+    .. attribute:: elapsed
+
+        total time of the output in seconds
+    """
+    def __init__(self):
+        self.chunks = 0
+        self.size = 0
+        self.producer_stalls = 0
+        self.producer_stall_time = 0.
+        self.writer_stalls = 0
+        self.writer_stall_time = 0.
+        self.elapsed = 0.
+
+    def __repr__(self):
+        return "PipelineStats(chunks=%d, size=%d, producer_stalls=%d (%.3fs), " \
+               "writer_stalls=%d (%.3fs), elapsed=%.3fs)" % (
+                   self.chunks, self.size, self.producer_stalls, self.producer_stall_time,
+                   self.writer_stalls, self.writer_stall_time, self.elapsed)
+
+
+class _Writer(threading.Thread):
+    """ Writes the chunks of `queue` to `fileobj`, after a write error the
+    remaining chunks are discarded, so the formatter never blocks.
+    """
+    def __init__(self, fileobj, queue, stats):
+        super(_Writer, self).__init__(name='dxfwrite-writer')
+        self.daemon = True
+        self.fileobj = fileobj
+        self.queue = queue
+        self.stats = stats
+        self.error = None
+
+    def run(self):
+        write = self.fileobj.write
+        get = self.queue.get
+        stats = self.stats
+        while True:
+            stalled = self.queue.empty()
+            start = perf_counter()
+            chunk = get()
+            if chunk is _END:
+                break
+            if stalled:
+                stats.writer_stalls += 1
+                stats.writer_stall_time += perf_counter() - start
+            if self.error is None:
+                try:
+                    write(chunk)
+                except BaseException as error:
+                    self.error = error
+                else:
+                    stats.chunks += 1
+                    stats.size += len(chunk)
+
+
+def writechunks_pipelined(fileobj, chunks, queue_size=QUEUE_SIZE):
+    """ Write the iterable `chunks` to `fileobj` by a writer thread, the
+    chunks are created in the calling thread. Returns a :class:`PipelineStats`
+    object.
+
+    A write error stops the formatting and is raised in the calling thread,
+    the chunks written before the error remain in `fileobj`.
+
+    :param int queue_size: max count of formatted chunks waiting for the writer
+    """
+    stats = PipelineStats()
+    queue = Queue(maxsize=queue_size)
+    writer = _Writer(fileobj, queue, stats)
+    put = queue.put
+    start = perf_counter()
+    writer.start()
+    try:
+        for chunk in chunks:
+            if queue.full():
+                stats.producer_stalls += 1
+                stall_start = perf_counter()
+                put(chunk)
+                stats.producer_stall_time += perf_counter() - stall_start
+            else:
+                put(chunk)
+            if writer.error is not None:
+                break
+    finally:
+        if hasattr(chunks, 'close'):  # stop a generator of chunks
+            chunks.close()
+        put(_END)  # the writer consumes all chunks, also after an error
+        writer.join()
+        stats.elapsed = perf_counter() - start
+    if writer.error is not None:
+        raise writer.error
+    return stats
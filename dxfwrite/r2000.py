@@ -0,0 +1,494 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Purpose: DXF R2000 dialect with LWPOLYLINE output
+# module belongs to package: dxfwrite.py
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+"""
+DXF R2000 dialect: writes a drawing as DXF R2000 (AC1015), which stores 2D
+polylines as compact LWPOLYLINE entities with packed 10/20 coordinate pairs
+instead of a POLYLINE entity and one VERTEX entity per point.
+
+The drawing is built by the R12 entities and tables, the R2000 writer adds
+the R2000 scaffolding at output:
+
+- handles (group code 5) and owner handles (group code 330) for all
+  entities, tables and table entries, and the $HANDSEED header variable
+- subclass markers (group code 100) of the entities and table entries
+- CLASSES section, DIMSTYLE and BLOCK_RECORD tables, required table entries
+  (LTYPE BYBLOCK, BYLAYER and CONTINUOUS, LAYER 0, APPID ACAD), the
+  *Model_Space and *Paper_Space blocks and the OBJECTS section with the root
+  dictionary
+
+POLYLINE entities are written as LWPOLYLINE, if all vertices are buffered
+rows of the :class:`~dxfwrite.entities.VertexBuffer` and the polyline is
+planar: 2D polylines, and 3D polylines without widths and bulges and with
+equal z-axis of all vertices, which is the elevation of the LWPOLYLINE.
+Curve or spline fitted polylines, polymeshes and polyfaces are written as
+POLYLINE and VERTEX entities.
+
+The handles are assigned while the sections are written, so the sections
+after the HEADER are spooled to a temporary file, see :data:`SPOOL_SIZE`,
+before the HEADER with the final $HANDSEED is written.
+"""
+
+__author__ = "mozman <mozman@gmx.at>"
+
+from itertools import chain, count
+from tempfile import SpooledTemporaryFile
+
+from .base import DXFList, DXFAtom, AttribTags, SerializedTags, tags2str, _dxf_method, _is_container_type
+from .base import _CONTAINER_TYPES
+from .entities import VertexBuffer
+from .util import izip, to_string
+from . import const
+
+SPOOL_SIZE = 1 << 24  # chars of the spooled sections in memory, more chars are spooled to disk
+CHUNK_SIZE = 1000  # LWPOLYLINE vertices per string format operation
+
+# group codes of the AcDbEntity subclass
+_ENTITY_CODES = frozenset((6, 8, 48, 60, 62, 67, 370))
+
+# entity name -> subclass markers as list of (marker, group codes), group codes
+# `None` for all other group codes
+_SUBCLASSES = {
+    'LINE': [('AcDbLine', None)],
+    'POINT': [('AcDbPoint', None)],
+    'CIRCLE': [('AcDbCircle', None)],
+    'ARC': [('AcDbCircle', None), ('AcDbArc', frozenset((50, 51)))],
+    'SOLID': [('AcDbTrace', None)],
+    'TRACE': [('AcDbTrace', None)],
+    '3DFACE': [('AcDbFace', None)],
+    'SHAPE': [('AcDbShape', None)],
+    'TEXT': [('AcDbText', None), ('AcDbText', frozenset((73, )))],
+    'ATTDEF': [('AcDbText', None), ('AcDbAttributeDefinition', frozenset((2, 3, 70, 73, 74)))],
+    'ATTRIB': [('AcDbText', None), ('AcDbAttribute', frozenset((2, 70, 73, 74)))],
+    'INSERT': [('AcDbBlockReference', None)],
+    'VIEWPORT': [('AcDbViewport', None)],
+    'BLOCK': [('AcDbBlockBegin', None)],
+    'ENDBLK': [('AcDbBlockEnd', None)],
+    'SEQEND': [],
+}
+
+# table name -> subclass marker of the table entries
+_TABLE_ENTRY_SUBCLASSES = {
+    'VPORT': 'AcDbViewportTableRecord',
+    'LTYPE': 'AcDbLinetypeTableRecord',
+    'LAYER': 'AcDbLayerTableRecord',
+    'STYLE': 'AcDbTextStyleTableRecord',
+    'VIEW': 'AcDbViewTableRecord',
+    'UCS': 'AcDbUCSTableRecord',
+    'APPID': 'AcDbRegAppTableRecord',
+    'DIMSTYLE': 'AcDbDimStyleTableRecord',
+    'BLOCK_RECORD': 'AcDbBlockTableRecord',
+}
+
+# POLYLINE flags, which prevent the LWPOLYLINE output
+_NOT_LWPOLYLINE = const.POLYLINE_CURVE_FIT_VERTICES_ADDED | const.POLYLINE_SPLINE_FIT_VERTICES_ADDED | \
+    const.POLYLINE_3D_POLYMESH | const.POLYLINE_MESH_CLOSED_N_DIRECTION | const.POLYLINE_POLYFACE
+# POLYLINE flags, which are LWPOLYLINE flags too
+_LWPOLYLINE_FLAGS = const.POLYLINE_CLOSED | const.POLYLINE_GENERATE_LINETYPE_PATTERN
+
+
+def _polyline_subclass(flags):
+    if flags & const.POLYLINE_POLYFACE:
+        return 'AcDbPolyFaceMesh'
+    elif flags & const.POLYLINE_3D_POLYMESH:
+        return 'AcDbPolygonMesh'
+    elif flags & const.POLYLINE_3D_POLYLINE:
+        return 'AcDb3dPolyline'
+    return 'AcDb2dPolyline'
+
+
+def _vertex_subclasses(flags, polyline_flags):
+    if flags & 128:
+        if flags & const.VTX_3D_POLYGON_MESH_VERTEX:
+            return ['AcDbVertex', 'AcDbPolyFaceMeshVertex']
+        return ['AcDbFaceRecord']  # face record of a polyface mesh
+    elif flags & const.VTX_3D_POLYGON_MESH_VERTEX or polyline_flags & const.POLYLINE_3D_POLYMESH:
+        return ['AcDbVertex', 'AcDbPolygonMeshVertex']
+    elif flags & const.VTX_3D_POLYLINE_VERTEX or polyline_flags & const.POLYLINE_3D_POLYLINE:
+        return ['AcDbVertex', 'AcDb3dPolylineVertex']
+    return ['AcDbVertex', 'AcDb2dVertex']
+
+
+def _itertags(string):
+    """ Yields (group_code, group code string, value string) of the DXF
+    string `string`.
+    """
+    lines = string.split('\n')
+    for code, value in izip(lines[0:-1:2], lines[1::2]):
+        yield int(code), code, value
+
+
+def _tag(code, value):
+    return "%3d\n%s\n" % (code, value)
+
+
+def _iterleaves(dxfobj):
+    """ Like :func:`~dxfwrite.base.iterdxftags`, but yields
+    :class:`~dxfwrite.entities.VertexBuffer` objects as DXF tags, and the
+    entities of :class:`~dxfwrite.base.SerializedTags` objects, because the
+    cached DXF R12 strings can not be used.
+    """
+    stack = [iter((dxfobj, ))]
+    container_types = _CONTAINER_TYPES
+    while stack:
+        for tag in stack[-1]:
+            cls = tag.__class__
+            if cls is VertexBuffer:
+                yield tag
+                continue
+            if cls is SerializedTags:
+                stack.append(iter((tag.dxfobj, )))
+                break
+            is_container = container_types.get(cls)
+            if is_container is None:
+                is_container = _is_container_type(cls)
+            if is_container:
+                stack.append(iter(tag.__dxftags__()))
+                break
+            yield tag
+        else:
+            stack.pop()
+
+
+class R2000Writer(object):
+    """ Writes the sections of `drawing` as DXF R2000 strings.
+
+    :param fmt: :class:`~dxfwrite.base.DXFFormat` object or `None` for the
+        default format
+    """
+    def __init__(self, drawing, fmt=None):
+        self.drawing = drawing
+        self.fmt = fmt
+        self.dxf = _dxf_method(fmt)
+        self._handles = count(1)
+        self.block_records = dict((name, self.new_handle()) for name in chain(
+            ('*Model_Space', '*Paper_Space'), (to_string(name) for name in drawing.blocks.blocks)))
+        self.root_dict = self.new_handle()
+        self.owner = None  # owner handle of the next entities
+        self.sequence = None  # (owner handle, layer, flags) of VERTEX, ATTRIB and SEQEND entities
+        self.polyline = None  # AttribTags of a POLYLINE, which could be written as LWPOLYLINE
+        self.skip_seqend = False
+
+    def new_handle(self):
+        return "%X" % next(self._handles)
+
+    def handseed(self):
+        """ Next free handle, valid after writing the sections. """
+        return "%X" % next(self._handles)
+
+    def header(self):
+        """ Returns the HEADER section, requires the final handle seed. """
+        variables = dict(self.drawing.header.variables)
+        variables['$ACADVER'] = DXFAtom('AC1015', 1)
+        variables['$HANDSEED'] = DXFAtom(self.handseed(), 5)
+        variables.setdefault('$DWGCODEPAGE', DXFAtom('ANSI_1252', 3))
+        varlist = [DXFList((DXFAtom(key, 9), value)) for key, value in variables.items()]
+        return "  0\nSECTION\n  2\nHEADER\n" + tags2str(DXFList(varlist), self.fmt) + "  0\nENDSEC\n"
+
+    def sections(self):
+        """ Yields the DXF strings of the sections after the HEADER section. """
+        yield "  0\nSECTION\n  2\nCLASSES\n  0\nENDSEC\n"
+        yield "  0\nSECTION\n  2\nTABLES\n"
+        for string in self.tables():
+            yield string
+        yield "  0\nENDSEC\n  0\nSECTION\n  2\nBLOCKS\n"
+        for string in self.blocks():
+            yield string
+        yield "  0\nENDSEC\n  0\nSECTION\n  2\nENTITIES\n"
+        self.owner = self.block_records['*Model_Space']
+        for string in self.entities(self.drawing.entities.entities):
+            yield string
+        yield "  0\nENDSEC\n  0\nSECTION\n  2\nOBJECTS\n"
+        yield self.objects()
+        yield "  0\nENDSEC\n  0\nEOF\n"
+
+    def tables(self):
+        from .engine import DXFEngine
+        tables = self.drawing.tables
+        required = {
+            'VPORT': [DXFEngine.vport('*ACTIVE')],
+            'LTYPE': [DXFEngine.linetype(name, pattern=DXFEngine.linepattern([0.]))
+                      for name in ('BYBLOCK', 'BYLAYER', 'CONTINUOUS')],
+            'LAYER': [DXFEngine.layer('0')],
+            'APPID': [DXFEngine.appid('ACAD')],
+        }
+        for table in (tables.viewports, tables.linetypes, tables.layers, tables.styles,
+                      tables.views, tables.ucs, tables.appids):
+            names = set(entry['name'] for entry in table._shared_values())
+            entries = [entry for entry in required.get(table.tablename, []) if entry['name'] not in names]
+            entries.extend(table._shared_values())
+            yield self.table(table.tablename, [tags2str(entry, self.fmt) for entry in entries])
+        yield self.table('DIMSTYLE', ["  0\nDIMSTYLE\n  2\nSTANDARD\n 70\n0\n"])
+        records = sorted(self.block_records.items(), key=lambda item: int(item[1], 16))
+        yield self.table('BLOCK_RECORD', ["  0\nBLOCK_RECORD\n  2\n%s\n" % name for name, handle in records],
+                         [handle for name, handle in records])
+
+    def table(self, name, entries, handles=None):
+        """ Returns the table `name` with the R12 DXF strings of the table
+        `entries`.
+        """
+        table_handle = self.new_handle()
+        strings = [
+            "  0\nTABLE\n  2\n%s\n  5\n%s\n330\n0\n100\nAcDbSymbolTable\n 70\n%d\n" % (name, table_handle, len(entries))
+        ]
+        if name == 'DIMSTYLE':
+            strings.append("100\nAcDbDimStyleTable\n")
+        handle_code = 105 if name == 'DIMSTYLE' else 5
+        subclass = _TABLE_ENTRY_SUBCLASSES[name]
+        for index, entry in enumerate(entries):
+            tags = list(_itertags(entry))
+            handle = self.new_handle() if handles is None else handles[index]
+            strings.append("  0\n%s\n%3d\n%s\n330\n%s\n100\nAcDbSymbolTableRecord\n100\n%s\n" % (
+                name, handle_code, handle, table_handle, subclass))
+            for code, code_str, value in tags[1:]:
+                strings.append("%s\n%s\n" % (code_str, value))
+                if code == 49 and name == 'LTYPE':
+                    strings.append(" 74\n0\n")  # simple linetype element
+        strings.append("  0\nENDTAB\n")
+        return "".join(strings)
+
+    def blocks(self):
+        for name, paper_space in (('*Model_Space', 0), ('*Paper_Space', 1)):
+            handle = self.block_records[name]
+            paper = " 67\n1\n" if paper_space else ""
+            yield "  0\nBLOCK\n  5\n%s\n330\n%s\n100\nAcDbEntity\n%s  8\n0\n100\nAcDbBlockBegin\n" \
+                  "  2\n%s\n 70\n0\n 10\n0.0\n 20\n0.0\n 30\n0.0\n  3\n%s\n  1\n\n" % (
+                      self.new_handle(), handle, paper, name, name)
+            yield "  0\nENDBLK\n  5\n%s\n330\n%s\n100\nAcDbEntity\n%s  8\n0\n100\nAcDbBlockEnd\n" % (
+                self.new_handle(), handle, paper)
+        for block in self.drawing.blocks.blocks.values():
+            for string in self.entities(block):
+                yield string
+
+    def objects(self):
+        groups = self.new_handle()
+        return "  0\nDICTIONARY\n  5\n%s\n330\n0\n100\nAcDbDictionary\n281\n1\n  3\nACAD_GROUP\n350\n%s\n" \
+               "  0\nDICTIONARY\n  5\n%s\n330\n%s\n100\nAcDbDictionary\n281\n1\n" % (
+                   self.root_dict, groups, groups, self.root_dict)
+
+    def entities(self, dxfobj):
+        """ Yields the DXF R2000 strings of the entities of `dxfobj`. """
+        dxf = self.dxf
+        pending = []  # tags of the current entity
+        for tag in _iterleaves(dxfobj):
+            if self.polyline is not None:
+                polyline = self.polyline
+                self.polyline = None
+                if tag.__class__ is VertexBuffer:
+                    string = self.lwpolyline(polyline, tag)
+                    if string is not None:
+                        self.skip_seqend = True
+                        yield string
+                        continue
+                for string in self._rewrite_tags(dxf(polyline), pending):
+                    yield string
+            if isinstance(tag, AttribTags) and tag.name == 'POLYLINE':
+                for string in self._flush(pending):
+                    yield string
+                self.polyline = tag
+                continue
+            if tag.__class__ is VertexBuffer:
+                string = tags2str(tag, self.fmt)
+            else:
+                string = dxf(tag)
+            for string in self._rewrite_tags(string, pending):
+                yield string
+        if self.polyline is not None:  # POLYLINE without vertices
+            polyline = self.polyline
+            self.polyline = None
+            for string in self._rewrite_tags(dxf(polyline), pending):
+                yield string
+        for string in self._flush(pending):
+            yield string
+
+    def _rewrite_tags(self, string, pending):
+        """ Collect the tags of `string` in `pending`, yields the completed
+        entities as DXF R2000 strings.
+        """
+        for tag in _itertags(string):
+            if tag[0] == 0:
+                for result in self._flush(pending):
+                    yield result
+            pending.append(tag)
+
+    def _flush(self, pending):
+        if pending:
+            string = self.entity(pending)
+            del pending[:]
+            if string:
+                yield string
+
+    def entity(self, tags):
+        """ Returns the DXF R2000 string of the entity `tags`, a list of
+        (group_code, group code string, value string) tuples.
+        """
+        name = tags[0][2]
+        if name == 'SEQEND' and self.skip_seqend:
+            self.skip_seqend = False
+            return ""
+        common = []
+        data = []
+        xdata = []
+        values = {}
+        for tag in tags[1:]:
+            code = tag[0]
+            values.setdefault(code, tag[2])
+            if code in _ENTITY_CODES:
+                common.append(tag)
+            elif code >= 1000:
+                xdata.append(tag)
+            else:
+                data.append(tag)
+
+        handle = self.new_handle()
+        layer = values.get(8)
+        sequence = self.sequence
+        if name == 'BLOCK':
+            self.owner = self.block_records.get(values.get(2), '0')
+        if name in ('VERTEX', 'ATTRIB', 'SEQEND') and sequence is not None:
+            owner = sequence[0]
+            if layer is None:
+                layer = sequence[1]
+            if name == 'SEQEND':
+                self.sequence = None
+        elif values.get(67) == '1' and self.owner == self.block_records['*Model_Space']:
+            owner = self.block_records['*Paper_Space']
+        else:
+            owner = self.owner
+        if name in ('POLYLINE', 'INSERT') and values.get(66) == '1':
+            self.sequence = (handle, layer or '0', int(values.get(70, 0)) if name == 'POLYLINE' else 0)
+
+        strings = ["  0\n%s\n  5\n%s\n330\n%s\n100\nAcDbEntity\n" % (name, handle, owner)]
+        strings.extend("%s\n%s\n" % (code_str, value) for code, code_str, value in common)
+        if 8 not in values:
+            strings.append("  8\n%s\n" % (layer or '0'))
+        if name == 'POLYLINE':
+            subclasses = [(_polyline_subclass(int(values.get(70, 0))), None)]
+        elif name == 'VERTEX':
+            markers = _vertex_subclasses(int(values.get(70, 0)), sequence[2] if sequence else 0)
+            subclasses = [(marker, ()) for marker in markers[:-1]] + [(markers[-1], None)]
+        else:
+            subclasses = _SUBCLASSES.get(name, [])
+        if subclasses:
+            claimed = set()
+            for marker, codes in subclasses:
+                if codes is not None:
+                    claimed.update(codes)
+            for marker, codes in subclasses:
+                strings.append("100\n%s\n" % marker)
+                if codes is None:
+                    strings.extend("%s\n%s\n" % (code_str, value) for code, code_str, value in data
+                                   if code not in claimed)
+                else:
+                    strings.extend("%s\n%s\n" % (code_str, value) for code, code_str, value in data
+                                   if code in codes)
+        else:
+            strings.extend("%s\n%s\n" % (code_str, value) for code, code_str, value in data)
+        strings.extend("%s\n%s\n" % (code_str, value) for code, code_str, value in xdata)
+        if name == 'ENDBLK':
+            self.owner = None
+        return "".join(strings)
+
+    def lwpolyline(self, polyline, vertices):
+        """ Returns the LWPOLYLINE string of the POLYLINE `polyline` and its
+        `vertices`, or `None` if the polyline is not a planar polyline.
+        """
+        layout = polyline.layout
+        values = dict((key, value) for key, value in izip(layout.keys, polyline.values) if value is not None)
+        flags = values.get('flags', 0)
+        if flags & _NOT_LWPOLYLINE or vertices.entities or len(vertices) == 0:
+            return None
+        coords = vertices.coords
+        columns = vertices.columns
+        if flags & const.POLYLINE_3D_POLYLINE:
+            zaxis = coords[2::3]
+            if columns or 'extrusion_direction' in values or min(zaxis) != max(zaxis):
+                return None
+            elevation = zaxis[0]
+        else:
+            elevation = values.get('polyline_elevation', (0., 0., 0.))[2]
+
+        fmt = self.fmt
+        float2str = str if fmt is None else fmt.float2str
+        owner = self.owner
+        if values.get('paper_space') == 1 and owner == self.block_records['*Model_Space']:
+            owner = self.block_records['*Paper_Space']
+        strings = ["  0\nLWPOLYLINE\n  5\n%s\n330\n%s\n100\nAcDbEntity\n" % (self.new_handle(), owner)]
+        if fmt is not None and fmt.omit_defaults:  # the layer is always written
+            values = dict((key, value) for key, value in values.items()
+                          if key == 'layer' or not layout.is_default(layout.index[key], value))
+        for key, code in (('paper_space', 67), ('layer', 8), ('linetype', 6), ('color', 62)):
+            if key in values:
+                strings.append(_tag(code, values[key]))
+        strings.append("100\nAcDbPolyline\n 90\n%d\n 70\n%d\n" % (len(vertices), flags & _LWPOLYLINE_FLAGS))
+        startwidth = values.get('startwidth', 0.)
+        endwidth = values.get('endwidth', 0.)
+        widths = 'startwidth' in columns or 'endwidth' in columns or startwidth != endwidth
+        if not widths and startwidth:
+            strings.append(_tag(43, float2str(startwidth)))
+        if elevation:
+            strings.append(_tag(38, float2str(elevation)))
+        if 'thickness' in values:
+            strings.append(_tag(39, float2str(values['thickness'])))
+
+        template = " 10\n%s\n 20\n%s\n"
+        names = []
+        defaults = []
+        if widths:
+            template += " 40\n%s\n 41\n%s\n"
+            names.extend(('startwidth', 'endwidth'))
+            defaults.extend((startwidth, endwidth))
+        if 'bulge' in columns:
+            template += " 42\n%s\n"
+            names.append('bulge')
+            defaults.append(0.)
+        for start in range(0, len(vertices), CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, len(vertices))
+            rows = [coords[start * 3:stop * 3:3], coords[start * 3 + 1:stop * 3:3]]
+            for name, default in izip(names, defaults):
+                column = columns.get(name)
+                if column is None:
+                    rows.append([default] * (stop - start))
+                else:  # NaN is absent
+                    rows.append([value if value == value else default for value in column[start:stop]])
+            if fmt is not None and fmt.formats_floats:
+                rows = [map(float2str, column) for column in rows]
+            strings.append((template * (stop - start)) % tuple(chain.from_iterable(izip(*rows))))
+        if 'extrusion_direction' in values:
+            strings.append("".join(_tag(code, float2str(value)) for code, value in izip(
+                (210, 220, 230), values['extrusion_direction'])))
+        return "".join(strings)
+
+
+def iterchunks_r2000(drawing, chunk_size, encoding=None, fmt=None):
+    """ Yields the DXF R2000 string of `drawing` in chunks of approximately
+    `chunk_size` chars. Yields encoded bytes if `encoding` is not `None`,
+    characters which can not be encoded are replaced by '?'.
+    """
+    def encoded(chunk):
+        return chunk if encoding is None else chunk.encode(encoding, 'replace')
+
+    writer = R2000Writer(drawing, fmt)
+    with SpooledTemporaryFile(max_size=SPOOL_SIZE, mode='w+', encoding='utf-8', newline='') as spool:
+        buffer = []
+        size = 0
+        for string in writer.sections():
+            buffer.append(string)
+            size += len(string)
+            if size >= chunk_size:
+                spool.write("".join(buffer))
+                del buffer[:]
+                size = 0
+        yield encoded(writer.header())
+        spool.seek(0)
+        while True:
+            chunk = spool.read(chunk_size)
+            if not chunk:
+                break
+            yield encoded(chunk)
+        if buffer:
+            yield encoded("".join(buffer))
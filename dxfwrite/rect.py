@@ -16,7 +16,7 @@ import math
 from . import const
 from .vector2d import *
 from .algebra import rotate_2d
-from .base import DXFList, dxfstr
+from .base import DXFList, tags2str
 from .entities import Polyline, Solid
 from .mixins import SubscriptAttributes
 
@@ -89,9 +89,9 @@ class Rectangle(SubscriptAttributes):
         """ build the background solid """
         return Solid(self.points, color=self.bgcolor, layer=self.layer)
 
-    def __dxf__(self):
+    def __dxf__(self, fmt=None):
         """ get the dxf string """
-        return dxfstr(self.__dxftags__())
+        return tags2str(self, fmt)
 
     def __dxftags__(self):
         return self._build_rect()
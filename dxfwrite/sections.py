@@ -9,7 +9,9 @@ __author__ = "mozman <mozman@gmx.at>"
 
 __all__ = ['create_section']
 
-from .base import DXFAtom, DXFList, DXFName, dxfstr
+import copy
+
+from .base import DXFAtom, DXFList, DXFName, SerializedTags, tags2str
 from .tables import create_table
 from . import hdrvars
 
@@ -30,8 +32,8 @@ def create_section(name):
 
 
 class _Section(object):
-    def __dxf__(self):
-        return dxfstr(self.__dxftags__())
+    def __dxf__(self, fmt=None):
+        return tags2str(self, fmt)
 
     def __dxftags__(self):
         return DXFList((
@@ -47,6 +49,7 @@ class _Section(object):
 class Header(_Section):
     def __init__(self, default_vars=None):
         self.variables = {}
+        self._shared = set()  # names of variables shared with other headers
         if default_vars:
             self.add_vars(default_vars)
 
@@ -61,16 +64,33 @@ class Header(_Section):
         """ Get a header var by the subscript operator::
 
                 value = drawing.header[varname]
+
+        Variables shared with other headers are copied before.
         """
-        return self.variables[key]
+        value = self.variables[key]
+        if key in self._shared:
+            self._shared.discard(key)
+            value = self.variables[key] = copy.deepcopy(value)
+        return value
 
     def __setitem__(self, key, value):
         """ Set a header var by the subscript operator::
 
                 drawing.header[varname] = value
         """
+        self._shared.discard(key)
         self.variables[key] = hdrvars.Factory[key](value)
 
+    def copy_on_write(self):
+        """ Returns a copy of the header, both headers share the current
+        variables, until they are got by the subscript operator.
+        """
+        self._shared = set(self.variables)
+        header = copy.copy(self)
+        header.variables = dict(self.variables)
+        header._shared = set(self.variables)
+        return header
+
 
 class TablesSection(_Section):
     def __init__(self):
@@ -93,38 +113,74 @@ class TablesSection(_Section):
                         self.ucs,
         ))
 
+    def copy_on_write(self):
+        """ Returns a copy of the tables section, the tables share their
+        entries with the tables of this section until they are modified.
+        """
+        section = TablesSection.__new__(TablesSection)
+        for name, table in vars(self).items():
+            setattr(section, name, table.copy_on_write())
+        return section
+
 
 class Blocks(_Section):
     def __init__(self):
         self.blocks = {}
+        self._shared = {}  # blocks shared with copies of the section, name -> block
+        self._serialized = None  # SerializedTags of the shared blocks, None if a shared block was replaced
 
     def _get_body(self):
         body = DXFList()
         body.append(DXFName('BLOCKS'))
-        body.extend(self.blocks.values())
+        if self._serialized is None:
+            body.extend(self.blocks.values())
+        else:
+            body.append(self._serialized)
+            body.extend(block for name, block in self.blocks.items() if name not in self._shared)
         return body
 
     def add(self, block):
         """ Add a BLOCK definition entity to the blocks section.
         """
         blockname = block['name']
+        if blockname in self._shared:
+            self._serialized = None
         self.blocks[blockname] = block
 
     def find(self, blockname):
-        """ Get BLOCK definition entity by name.
+        """ Get BLOCK definition entity by name, a block shared with a copy of
+        the section is copied before.
         """
-        return self.blocks[blockname]
+        block = self.blocks[blockname]
+        if self._shared.get(blockname) is block:
+            block = copy.deepcopy(block)
+            self.add(block)
+        return block
 
     def find_attdef(self, tag, blockname):
         """ Get ATTDEF entity by tag.
         """
-        block = self.find(blockname)
+        block = self.blocks[blockname]
         return block.find_attdef(tag)
 
+    def copy_on_write(self):
+        """ Returns a copy of the blocks section, both sections share the
+        current blocks and write them by one cached DXF string. Blocks got by
+        :meth:`find` are copied before, don't modify the shared blocks
+        otherwise.
+        """
+        if self._serialized is None or len(self._shared) != len(self.blocks):
+            self._shared = dict(self.blocks)
+            self._serialized = SerializedTags(DXFList(self.blocks.values()))
+        section = copy.copy(self)
+        section.blocks = dict(self.blocks)
+        return section
+
 
 class Entities(_Section):
     def __init__(self):
         self.entities = DXFList()
+        self.stream = None  # DrawingStream, if entities are written immediately
 
     def _get_body(self):
         return DXFList((DXFName('ENTITIES'), self.entities))
@@ -132,4 +188,21 @@ class Entities(_Section):
     def add(self, entity):
         """ Add a DXF entity to the entities section.
         """
-        self.entities.append(entity)
+        if self.stream is None:
+            self.entities.append(entity)
+        else:
+            self.stream.write(entity)
+
+    def copy_on_write(self):
+        """ Returns a copy of the entities section, both sections share the
+        current entities as one :class:`SerializedTags` object, which writes
+        them by a cached DXF string. Don't modify the shared entities.
+        """
+        if self.stream is not None:
+            raise ValueError("can not copy the entities of a streamed drawing.")
+        entities = self.entities
+        if len(entities) != 1 or entities[0].__class__ is not SerializedTags:
+            self.entities = DXFList((SerializedTags(entities), ))
+        section = copy.copy(self)
+        section.entities = DXFList(self.entities)
+        return section
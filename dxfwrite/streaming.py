@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Purpose: write entities of a drawing immediately to a file
+# module belongs to package: dxfwrite.py
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+"""
+Streaming output of very large drawings.
+
+The HEADER, TABLES and BLOCKS sections are written at the beginning of the
+stream, after that every entity added to the drawing is written at once to the
+file and is not stored in the drawing. Header variables, which are only known at
+the end ($EXTMIN, $EXTMAX) are written as fixed width placeholders and patched
+at closing time.
+"""
+
+__author__ = "mozman <mozman@gmx.at>"
+
+__all__ = ['DrawingStream']
+
+import math
+
+from .base import DXFAtom, DXFList, DXFName, DXFPoint, SerializedTags, iterdxftags, get_OCS, _dxf_method
+from .util import izip, is_binary_file
+
+# width of the placeholder value lines for deferred header variables, wide
+# enough for the repr() of any float value, wider values of a DXFFormat raise
+# ValueError. DXF readers accept leading spaces for numeric values.
+VALUE_WIDTH = 24
+
+
+class DrawingStream(object):
+    """ Writes the drawing `drawing` to `fileobj`, entities added to the
+    drawing between :meth:`open` and :meth:`close` are written immediately.
+
+    Usage::
+
+        with drawing.stream() as stream:
+            drawing.add(dxf.line((0, 0), (1, 0)))
+
+    """
+    DEFERRED_VARS = ('$EXTMIN', '$EXTMAX')
+
+    def __init__(self, drawing, fileobj=None, extents=True):
+        """ DrawingStream constructor.
+
+        :param drawing: the :class:`Drawing` to write
+        :param fileobj: text or binary file-like object, if `None` the file
+            `drawing.filename` will be created; strings are encoded for binary
+            file-like objects
+        :param bool extents: calculate $EXTMIN and $EXTMAX from the coordinates
+            of all written model space entities, requires a seekable `fileobj`
+        """
+        self.drawing = drawing
+        self.fileobj = fileobj
+        self.extents = extents
+        self.count = 0  # count of written entities
+        self._close_file = fileobj is None
+        self._encoding = None  # encoding of binary file-like objects
+        self._placeholders = {}  # var name -> file position
+        self._extmin = None
+        self._extmax = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    @property
+    def is_open(self):
+        return self.drawing.entities.stream is self
+
+    def open(self):
+        """ Write the HEADER, TABLES and BLOCKS sections and all entities
+        already added to the drawing.
+        """
+        drawing = self.drawing
+        if self.fileobj is None:
+            self.fileobj = drawing._open_file()
+        if is_binary_file(self.fileobj):
+            self._encoding = drawing.ENCODING
+        if self.extents and not _seekable(self.fileobj):
+            self.extents = False
+        self._write_header()
+        fmt = drawing.dxfformat
+        self._writetags(drawing.tables, fmt)
+        self._writetags(drawing.blocks, fmt)
+        self._writetags(DXFList((DXFAtom('SECTION'), DXFName('ENTITIES'))))
+        entities = drawing.entities
+        existing_entities = list(entities.entities)
+        del entities.entities[:]
+        entities.stream = self
+        for entity in existing_entities:
+            self.write(entity)
+
+    def write(self, entity):
+        """ Write `entity` to the stream, the entity is not stored. """
+        if entity.__class__ is SerializedTags:  # shared entities of a forked drawing
+            self._write_serialized(entity)
+            return
+        if self.extents and not _in_paperspace(entity):
+            tags = self._track_extents(entity)
+        else:
+            tags = iterdxftags(entity)
+        fmt = self.drawing.dxfformat
+        if fmt is None:
+            self._write("".join([tag.__dxf__() for tag in tags]))
+        else:
+            self._write("".join([tag.__dxf__(fmt) for tag in tags]))
+        self.count += 1
+
+    def _write_serialized(self, serialized):
+        entities = list(_shared_entities(serialized))
+        if self.extents:
+            for entity in entities:
+                if not _in_paperspace(entity):
+                    for tag in self._track_extents(entity):
+                        pass
+        self._write(serialized.__dxf__(self.drawing.dxfformat))
+        self.count += len(entities)
+
+    def close(self):
+        """ Write the end of the ENTITIES section, patch the deferred header
+        variables and close the file if it was opened by the stream.
+        """
+        if not self.is_open:
+            return
+        self.drawing.entities.stream = None
+        self._writetags(DXFList((DXFAtom('ENDSEC'), DXFAtom('EOF'))))
+        try:
+            if self.extents:
+                self._patch_header()
+        finally:
+            if self._close_file:
+                self.fileobj.close()
+
+    def abort(self):
+        """ Stop streaming without finalizing the DXF data: the end of the
+        ENTITIES section and the EOF tag are not written and the header is
+        not patched, an incomplete file is never mistaken for a valid drawing.
+        Closes the file if it was opened by the stream.
+        """
+        if not self.is_open:
+            return
+        self.drawing.entities.stream = None
+        if self._close_file:
+            self.fileobj.close()
+
+    def _write_header(self):
+        header = self.drawing.header
+        deferred = {}
+        if self.extents:
+            deferred = dict((id(header.variables[name]), name)
+                            for name in self.DEFERRED_VARS
+                            if name in header.variables)
+        fmt = self.drawing.dxfformat
+        for tag in iterdxftags(header):
+            name = deferred.get(id(tag))
+            if name is not None:
+                self._placeholders[name] = self.fileobj.tell()
+                self._write(_fixed_width_point(tag, fmt))
+            elif fmt is None:
+                self._write(tag.__dxf__())
+            else:
+                self._write(tag.__dxf__(fmt))
+
+    def _patch_header(self):
+        if self._extmin is None:  # no model space coordinates written
+            return
+        header = self.drawing.header
+        header['$EXTMIN'] = self._extmin
+        header['$EXTMAX'] = self._extmax
+        # format all values before patching, a too wide value raises ValueError
+        patches = [(position, _fixed_width_point(header[name], self.drawing.dxfformat))
+                   for name, position in self._placeholders.items()]
+        end_of_file = self.fileobj.tell()
+        for position, string in patches:
+            self.fileobj.seek(position)
+            self._write(string)
+        self.fileobj.seek(end_of_file)
+
+    def _track_extents(self, entity):
+        for tag in iterdxftags(entity):
+            if isinstance(tag, DXFPoint) and 0 <= tag.get_index_shift() < 10:
+                self._update_extents(tag.tuple)
+            elif hasattr(tag, 'iterentities'):  # AttribTags, entity without data or batch rows
+                for name, layout, values in tag.iterentities():
+                    for coords in entity_bounds(name, layout, values):
+                        self._update_extents(coords)
+            elif hasattr(tag, 'iterpoints'):  # vertex buffers
+                for index_shift, coords in tag.iterpoints():
+                    if 0 <= index_shift < 10:
+                        self._update_extents(coords)
+            yield tag
+
+    def _update_extents(self, coords):
+        if len(coords) == 2:
+            coords = (coords[0], coords[1], 0.)
+        if self._extmin is None:
+            self._extmin = coords
+            self._extmax = coords
+        else:
+            self._extmin = tuple(map(min, self._extmin, coords))
+            self._extmax = tuple(map(max, self._extmax, coords))
+
+    def _write(self, string):
+        if self._encoding is None:
+            self.fileobj.write(string)
+        else:
+            self.fileobj.write(string.encode(self._encoding, 'replace'))
+
+    def _writetags(self, dxfobj, fmt=None):
+        dxf = _dxf_method(fmt)
+        for tag in iterdxftags(dxfobj):
+            self._write(dxf(tag))
+
+
+# entities with locations in the OCS defined by their extrusion direction
+_OCS_ENTITIES = frozenset(('CIRCLE', 'ARC', 'SHAPE', 'SOLID', 'TRACE', 'TEXT', 'INSERT', 'ATTRIB', 'ATTDEF'))
+_TEXT_ENTITIES = frozenset(('TEXT', 'ATTRIB', 'ATTDEF'))
+
+
+def entity_bounds(name, layout, values):
+    """ Yields WCS points, which enclose the entity `name` with the raw
+    attribute `values` stored in the :class:`~dxfwrite.base.AttribLayout`
+    `layout`.
+
+    Circles and arcs are enclosed by their radius, text boxes are estimated
+    by the text height, the width factor and the count of chars, other
+    entities by their locations; the content of blocks is not included.
+    """
+    def get(key, default=None):
+        index = layout.index.get(key)
+        value = None if index is None else values[index]
+        return default if value is None else value
+
+    if name in ('CIRCLE', 'ARC'):
+        points = _arc_bounds(get('center', (0., 0.)), get('radius', 0.),
+                             get('startangle', 0.), get('endangle', 360.) if name == 'ARC' else 360.)
+    elif name in _TEXT_ENTITIES:
+        points = _text_bounds(get('insert', (0., 0.)), get('alignpoint'), get('height', 0.),
+                              get('xscale', 1.), get('rotation', 0.), len(get('text', '')))
+    else:
+        points = [values[index] for index in layout.locations if values[index] is not None]
+    extrusion = get('extrusion_direction') if name in _OCS_ENTITIES else None
+    if extrusion is not None and tuple(extrusion) != (0., 0., 1.):
+        ucs = get_OCS(extrusion)
+        points = [_ocs_to_wcs(ucs, point) for point in points]
+    return points
+
+
+def _arc_bounds(center, radius, startangle, endangle):
+    """ Start point, end point and the quadrant points of the arc. """
+    cx, cy = center[0], center[1]
+    z = center[2] if len(center) > 2 else 0.
+    startangle %= 360.
+    span = (endangle - startangle) % 360. or 360.
+    angles = [startangle, startangle + span]
+    angles.extend(quadrant for quadrant in range(0, 720, 90) if startangle < quadrant < startangle + span)
+    return [(cx + radius * math.cos(math.radians(angle)), cy + radius * math.sin(math.radians(angle)), z)
+            for angle in angles]
+
+
+def _text_bounds(insert, alignpoint, height, xscale, rotation, count):
+    """ Corners of the estimated text box, the box is placed around the
+    align point of aligned texts.
+    """
+    width = height * xscale * count
+    if alignpoint is None:
+        origin, corners = insert, ((0., 0.), (width, 0.), (0., height), (width, height))
+    else:
+        origin, corners = alignpoint, ((-width, -height), (width, -height), (-width, height), (width, height))
+    z = origin[2] if len(origin) > 2 else 0.
+    cos, sin = math.cos(math.radians(rotation)), math.sin(math.radians(rotation))
+    return [(origin[0] + x * cos - y * sin, origin[1] + x * sin + y * cos, z) for x, y in corners]
+
+
+def _ocs_to_wcs(ucs, point):
+    ax, ay, az = ucs
+    x, y = point[0], point[1]
+    z = point[2] if len(point) > 2 else 0.
+    return tuple(x * ux + y * uy + z * uz for ux, uy, uz in izip(ax, ay, az))
+
+
+def _fixed_width_point(point, fmt=None):
+    float2str = repr if fmt is None else fmt.float2str
+    shift = point.get_index_shift()
+    values = [float2str(value) for value in point.tuple]
+    for value in values:
+        if len(value) > VALUE_WIDTH:
+            raise ValueError("value '%s' is wider than the %d chars of the header placeholder, "
+                             "reduce the float precision." % (value, VALUE_WIDTH))
+    return "".join("%3d\n%*s\n" % ((axis + 1) * 10 + shift, VALUE_WIDTH, value)
+                   for axis, value in enumerate(values))
+
+
+def _shared_entities(serialized):
+    """ Yields the entities of the :class:`SerializedTags` object
+    `serialized`, nested shared entities are flattened.
+    """
+    for entity in serialized.dxfobj:
+        if entity.__class__ is SerializedTags:
+            for shared in _shared_entities(entity):
+                yield shared
+        else:
+            yield entity
+
+
+def _in_paperspace(entity):
+    try:
+        return entity['paper_space'] == 1
+    except (KeyError, TypeError):
+        return False
+
+
+def _seekable(fileobj):
+    try:
+        return fileobj.seekable()
+    except AttributeError:
+        return hasattr(fileobj, 'seek') and hasattr(fileobj, 'tell')
@@ -28,7 +28,7 @@ if sys.version_info[0] > 2:
 from copy import deepcopy
 
 from . import const
-from .base import DXFList, dxfstr
+from .base import DXFList, tags2str
 from .entities import Line, Solid, Insert
 from .mtext import MText
 
@@ -221,8 +221,8 @@ class Table(object):
         return ((row, col, self.get_cell(row, col))
                 for row, col in self.visibility_map)
 
-    def __dxf__(self):
-        return dxfstr(self.__dxftags__())
+    def __dxf__(self, fmt=None):
+        return tags2str(self, fmt)
 
     def __dxftags__(self):
         self._build_table()
@@ -100,7 +100,7 @@ class _TableEntry(object):
     DXF_ATTRIBUTES = {}
 
     def __init__(self, name, **kwargs):
-        self.attribs = {}
+        self._values = get_attrib_layout(self.__class__).new_values()
         # set attribs from kwargs
         self['name'] = name
         for key, value in kwargs.items():
@@ -113,45 +113,45 @@ class _TableEntry(object):
 
     def __setitem__(self, key, value):
         if self.is_valid_attribute_name(key):
-            self.attribs[key] = self._get_dxf_atom(key, value)  # factory is called
+            # store the raw value, DXF tags are created at output
+            get_attrib_layout(self.__class__).set_value(self._values, key, value)
         else:
             raise KeyError("Invalid attribute '%s' for TableEntry '%s'." % (str(key), self.__class__.__name__))
 
     def __getitem__(self, key):
         if self.is_valid_attribute_name(key):
-            element = self.attribs[key]
-            try:
-                return element.value  # DXFAtom
-            except AttributeError:
-                return element  # DXFList or list or tuple
+            return get_attrib_layout(self.__class__).get_value(self._values, key)
         else:
             raise KeyError("Invalid attribute '%s' for TableEntry '%s'." % (str(key), self.__class__.__name__))
 
-    def _get_dxf_atom(self, attribname, value):
-        """ Create an object for attribname by factory from attribute_definition.
+    def __contains__(self, key):
+        """ True if DXF attribute `key` is present.
         """
-        attrib = self.DXF_ATTRIBUTES[attribname]
-        return attrib.factory(value, attrib.group_code)
-
-    def _priority(self, key):
-        """ Get priority of DXF attribute referenced by key.
+        layout = get_attrib_layout(self.__class__)
+        try:
+            return self._values[layout.index[key]] is not None
+        except KeyError:
+            return False
+
+    def validate(self):
+        """ Validate the attribute values, required for table entries created
+        in the trusted input mode, see :func:`~dxfwrite.base.trusted_input`.
+        Raises :class:`DXFValidationError` for invalid values.
         """
-        return self.DXF_ATTRIBUTES[key].priority
+        get_attrib_layout(self.__class__).validate(self.TABLE_NAME, self._values)
 
     def get_attribs(self):
         """ Get DXF attributes sorted by priority.
         """
-        priority_attribs = ( (self._priority(key), value)
-                             for key, value in self.attribs.items() )
-        return ( value for priority, value in sorted(priority_attribs) )
+        return get_attrib_layout(self.__class__).get_tags(self._values)
 
-    def __dxf__(self):
-        return dxfstr(self.__dxftags__())
+    def __dxf__(self, fmt=None):
+        return tags2str(self, fmt)
 
     def __dxftags__(self):
         dxf = DXFList()
-        dxf.append(DXFAtom(self.TABLE_NAME))
-        dxf.extend(self.get_attribs())  # sorted attribs
+        # table name and attribs, written by a compiled serializer
+        dxf.append(AttribTags(self.TABLE_NAME, get_attrib_layout(self.__class__), self._values))
         return dxf
 
 
@@ -10,6 +10,8 @@ __author__ = "mozman <mozman@gmx.at>"
 
 __all__ = ['create_table']
 
+import copy
+
 from .base import *
 
 
@@ -26,41 +28,111 @@ def create_table(name):
 
 class _Table(object):
     """ Base table class.
+
+    A table created by :meth:`copy_on_write` shares the entries of the
+    source table and writes the cached DXF string of the source table, until
+    the table is modified. Entries got by the subscript operator are copied
+    before, because the caller may modify them.
     """
 
     def __init__(self, tablename):
         self.tablename = tablename
         self._entries = {}  # use only add() for adding objects
+        self._prototype = None  # source table of shared entries
+        self._serialized_tags = None  # SerializedTags of this table as prototype
 
-    def __dxf__(self):
-        return dxfstr(self.__dxftags__())
+    def __dxf__(self, fmt=None):
+        return tags2str(self, fmt)
 
     def __dxftags__(self):
+        if self._serialized is not None:
+            return (self._serialized, )
         return DXFList((
             DXFAtom('TABLE'),
             DXFName(self.tablename),
             DXFInt(len(self._entries)),
-            DXFList(self._get_values()),
+            DXFList(self._shared_values()),
             DXFAtom('ENDTAB')
         ))
 
+    @property
+    def _serialized(self):
+        """ :class:`SerializedTags` of the source table or `None` if the table
+        is modified.
+        """
+        if not self._is_shared():
+            return None
+        prototype = self._prototype
+        if prototype._serialized_tags is None:
+            prototype._serialized_tags = SerializedTags(prototype)
+        return prototype._serialized_tags
+
+    def copy_on_write(self):
+        """ Returns a copy of the table, both tables share the current entries
+        until they are modified.
+        """
+        if not self._is_shared():
+            # freeze the current entries, this table gets also a copy-on-write
+            # view of them, because references to this table may exist
+            snapshot = copy.copy(self)
+            snapshot._prototype = None
+            snapshot._serialized_tags = None
+            self._prototype = snapshot
+        table = copy.copy(self)
+        table._serialized_tags = None
+        return table
+
+    def _is_shared(self):
+        prototype = self._prototype
+        return prototype is not None and self._entries is prototype._entries
+
+    def _unshare(self):
+        """ Copy the shared entries before modifying them. """
+        if self._is_shared():
+            self._entries = copy.copy(self._entries)
+
+    def _private_entry(self, entry):
+        """ Returns a private copy of the shared `entry`. """
+        self._unshare()
+        if self._prototype is not None and self._prototype._is_shared_entry(entry):
+            return copy.deepcopy(entry)
+        return entry
+
+    def _is_shared_entry(self, entry):
+        return self._entries.get(entry['name']) is entry
+
     def __contains__(self, name):
         return name in self._entries
 
     def __getitem__(self, name):
         """ Get table entry by `name` -> TableEntry.
         """
-        return self._entries[name]
+        entry = self._private_entry(self._entries[name])
+        self._entries[name] = entry
+        return entry
 
     def clear(self):
+        self._unshare()
         self._entries.clear()
 
-    def _get_values(self):
+    def _shared_values(self):
+        """ Table entries for the output, they may be shared with other
+        tables, don't modify them.
+        """
         return self._entries.values()
 
+    def _get_values(self):
+        """ Table entries, shared entries are copied before. """
+        self._unshare()
+        entries = self._entries
+        for name, entry in entries.items():
+            entries[name] = self._private_entry(entry)
+        return entries.values()
+
     def add(self, entry):
         """ Add a table entry.
         """
+        self._unshare()
         self._entries[entry['name']] = entry
 
 
@@ -74,14 +146,29 @@ class Viewports(_Table):
     def __getitem__(self, name):
         """ Get all table entries `name`, because multiple entries are possible -> list
         """
-        return [entry for entry in self._entries if entry['name'] == name]
+        self._unshare()
+        entries = self._entries
+        for index, entry in enumerate(entries):
+            if entry['name'] == name:
+                entries[index] = self._private_entry(entry)
+        return [entry for entry in entries if entry['name'] == name]
 
-    def _get_values(self):
+    def _is_shared_entry(self, entry):
+        return any(shared is entry for shared in self._entries)
+
+    def _shared_values(self):
         return self._entries
 
+    def _get_values(self):
+        self._unshare()
+        entries = self._entries
+        for index, entry in enumerate(entries):
+            entries[index] = self._private_entry(entry)
+        return entries
+
     def add(self, viewport):
+        self._unshare()
         self._entries.append(viewport)
 
     def clear(self):
         self._entries = []
-
@@ -8,12 +8,42 @@
 
 __author__ = "mozman <mozman@gmx.at>"
 
+import io
 import sys
 PYTHON3 = sys.version_info[0] > 2
 
+
+class _EscapeTable(dict):
+    """ Translation table for str.translate(), DXF escapes unicode chars
+    greater than 0xFF as '\\U+XXXX', translations are created on demand.
+    """
+    def __missing__(self, code):
+        if 0xFF < code <= 0xFFFF:
+            char = u'\\U+%04x' % code
+        else:
+            char = unichr(code)
+        self[code] = char
+        return char
+
+_ESCAPE_TABLE = _EscapeTable()
+_ESCAPED_STRINGS = {}  # cache for escaped strings
+_MAX_CACHED_STRINGS = 50000
+
+
+def _escape(value):
+    try:
+        return _ESCAPED_STRINGS[value]
+    except KeyError:
+        if len(_ESCAPED_STRINGS) >= _MAX_CACHED_STRINGS:
+            _ESCAPED_STRINGS.clear()
+        escaped_value = value.translate(_ESCAPE_TABLE)
+        _ESCAPED_STRINGS[value] = escaped_value
+        return escaped_value
+
 if PYTHON3:
     from io import StringIO
     izip = zip
+    unichr = chr
 
     def is_string(value):
         return isinstance(value, str)
@@ -21,15 +51,23 @@ if PYTHON3:
     def to_unicode(value):
         return str(value)
 
+    if hasattr(str, 'isascii'):  # Python 3.7+
+        is_ascii = str.isascii
+    else:
+        def is_ascii(value):
+            try:
+                value.encode('ascii')
+            except UnicodeEncodeError:
+                return False
+            return True
+
     def to_string(value):
         if not isinstance(value, str):
             return str(value)
+        elif is_ascii(value):
+            return value
         else:
-            escaped_value = value.encode("raw_unicode_escape")
-            if b'\\u' in escaped_value:
-                return str(escaped_value.replace(b'\\u', b'\\U+'), 'utf-8')
-            else:
-                return value
+            return _escape(value)
 else:  # PYTHON2
     from itertools import izip
     from StringIO import StringIO
@@ -40,15 +78,20 @@ else:  # PYTHON2
     def to_unicode(value):
         return str(value).decode('utf-8')
 
+    def is_ascii(value):
+        try:
+            value.encode('ascii')
+        except UnicodeError:
+            return False
+        return True
+
     def to_string(value):
         if not isinstance(value, basestring):
             return str(value)
+        elif isinstance(value, str) or is_ascii(value):
+            return value
         else:
-            escaped_value = value.encode("raw_unicode_escape")
-            if '\\u' in escaped_value:
-                return escaped_value.replace('\\u', '\\U+')
-            else:
-                return value
+            return _escape(value)
 
 # end of Python 2/3 adaption
 
@@ -68,6 +111,17 @@ def set_flag(value, bitmask, switch_on=True):
         return value & ~bitmask
 
 
+def is_binary_file(fileobj):
+    """ True if `fileobj` expects bytes. """
+    if not PYTHON3:
+        return True
+    if isinstance(fileobj, io.TextIOBase):
+        return False
+    if isinstance(fileobj, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return 'b' in getattr(fileobj, 'mode', '')
+
+
 def iterflatlist(alist):
     for element in alist:
         if hasattr(element, "__iter__") and not is_string(element):
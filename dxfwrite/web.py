@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Purpose: send drawings as HTTP response
+# module belongs to package: dxfwrite.py
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+"""
+Send drawings as HTTP response by WSGI or ASGI web services, the DXF data is
+created chunk by chunk while sending (requires Python 3.6+).
+
+WSGI usage::
+
+    def application(environ, start_response):
+        drawing = create_drawing()
+        return DXFResponse(drawing, 'plan.dxf').wsgi(environ, start_response)
+
+ASGI usage::
+
+    async def application(scope, receive, send):
+        drawing = create_drawing()
+        await DXFResponse(drawing, 'plan.dxf').asgi(scope, receive, send)
+
+DXFResponse is also an iterable and an asynchronous iterable of bytes chunks,
+which can be passed to the streaming responses of web frameworks.
+"""
+
+__author__ = "mozman <mozman@gmx.at>"
+
+__all__ = ['DXFResponse']
+
+import asyncio
+import posixpath
+import re
+from urllib.parse import quote
+
+CONTENT_TYPE = 'image/vnd.dxf'
+
+# quotes, backslashes and all chars except printable ASCII chars
+_UNSAFE_CHARS = re.compile(r'["\\]|[^\x20-\x7e]')
+
+
+def _content_disposition(filename):
+    """ Returns the Content-Disposition header value for `filename`, without
+    the path of the file. The `filename` parameter contains an ASCII
+    replacement of the name, the `filename*` parameter (RFC 6266) the UTF-8
+    encoded name.
+    """
+    # remove POSIX and Windows paths
+    filename = posixpath.basename(filename.replace('\\', '/'))
+    filename = ''.join(char for char in filename if char >= ' ' and char != '\x7f')
+    if not filename:
+        filename = 'noname.dxf'
+    return "attachment; filename=\"%s\"; filename*=UTF-8''%s" % (
+        _UNSAFE_CHARS.sub('_', filename), quote(filename, safe=''))
+
+
+class DXFResponse(object):
+    def __init__(self, drawing, filename=None, chunk_size=None):
+        """ DXFResponse constructor.
+
+        :param drawing: the :class:`Drawing` to send
+        :param str filename: filename for the Content-Disposition header,
+            default is `drawing.filename`, a path is removed
+        :param int chunk_size: size of the bytes chunks, default is
+            `drawing.CHUNK_SIZE`
+        """
+        self.drawing = drawing
+        self.filename = filename or drawing.filename
+        self.chunk_size = chunk_size
+
+    @property
+    def headers(self):
+        """ HTTP response headers as list of (name, value) tuples. """
+        return [
+            ('Content-Type', CONTENT_TYPE),
+            ('Content-Disposition', _content_disposition(self.filename)),
+        ]
+
+    def __iter__(self):
+        return self.drawing.iter_chunks(self.chunk_size)
+
+    async def __aiter__(self):
+        for chunk in self.drawing.iter_chunks(self.chunk_size):
+            yield chunk
+            await asyncio.sleep(0)  # let other tasks run between chunks
+
+    def wsgi(self, environ, start_response):
+        """ WSGI application, returns the response body as iterable. """
+        start_response('200 OK', self.headers)
+        return iter(self)
+
+    async def asgi(self, scope, receive, send):
+        """ ASGI application, sends the response body chunk by chunk. """
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                        for name, value in self.headers],
+        })
+        async for chunk in self:
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: compare the ASCII and the binary DXF output
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import sys
+import os
+import random
+
+from timeit import Timer
+
+try:
+    import dxfwrite
+except ImportError:
+    # if dxfwrite is not 'installed' append parent dir of __file__ to sys.path
+    curdir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.abspath(os.path.join(curdir, os.path.pardir)))
+
+import dxfwrite
+from dxfwrite import DXFEngine as dxf
+
+
+def create_dxf_drawing():
+    random.seed(1)
+    points = [(random.random() * 1000., random.random() * 1000.) for _ in range(100000)]
+    dwg = dxf.drawing()
+    for start, end in zip(points[:20000:2], points[1:20000:2]):
+        dwg.add(dxf.line(start, end, color=7))
+    dwg.add_lines(points[::2], points[1::2], color=1)
+    dwg.add(dxf.polyline(points))
+    return dwg
+
+drawing = create_dxf_drawing()
+
+
+def profile_ascii():
+    return drawing.to_bytes()
+
+
+def profile_binary():
+    return drawing.to_bytes(format='binary')
+
+
+def print_result(time, text):
+    print("Operation: %s takes %.2f seconds" % (text, time))
+
+COUNT = 3
+
+
+def main():
+    print("Profiling DXF output of 10000 lines, 50000 batched lines and 100000 vertices")
+    print("Size of ASCII DXF: %d bytes" % len(profile_ascii()))
+    print("Size of binary DXF: %d bytes" % len(profile_binary()))
+    for name, text in [
+            ('profile_ascii', 'write ASCII DXF'),
+            ('profile_binary', 'write binary DXF')]:
+        t = Timer("%s()" % name, "from __main__ import %s" % name)
+        print_result(t.timeit(COUNT), text)
+
+if __name__ == '__main__':
+    main()
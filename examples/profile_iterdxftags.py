@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: compare recursive and iterative tag flattening
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import sys
+import os
+
+from timeit import Timer
+from random import random
+
+try:
+    import dxfwrite
+except ImportError:
+    # if dxfwrite is not 'installed' append parent dir of __file__ to sys.path
+    curdir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.abspath(os.path.join(curdir, os.path.pardir)))
+
+import dxfwrite
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.base import iterdxftags
+
+
+def recursive_iterdxftags(dxfobj):
+    """ The previous implementation of iterdxftags(), for comparison. """
+    if hasattr(dxfobj, '__dxftags__'):
+        for tag in dxfobj.__dxftags__():
+            for subtag in recursive_iterdxftags(tag):
+                yield subtag
+    else:
+        yield dxfobj
+
+
+def get_cube(basepoint, length):
+    def scale(point):
+        return ((basepoint[0]+point[0]*length),
+                (basepoint[1]+point[1]*length),
+                (basepoint[2]+point[2]*length))
+    pface = dxf.polyface()
+    # cube corner points
+    p1 = scale((0, 0, 0))
+    p2 = scale((0, 0, 1))
+    p3 = scale((0, 1, 0))
+    p4 = scale((0, 1, 1))
+    p5 = scale((1, 0, 0))
+    p6 = scale((1, 0, 1))
+    p7 = scale((1, 1, 0))
+    p8 = scale((1, 1, 1))
+
+    pface.add_face([p1, p5, p7, p3], color=1)  # base
+    pface.add_face([p1, p5, p6, p2], color=2)  # left
+    pface.add_face([p5, p7, p8, p6], color=3)  # front
+    pface.add_face([p7, p8, p4, p3], color=4)  # right
+    pface.add_face([p1, p3, p4, p2], color=5)  # back
+    pface.add_face([p2, p6, p8, p4], color=6)  # top
+    return pface
+
+
+def create_dxf_drawing():
+    dwg = dxf.drawing()
+    dwg.add_vport(
+        '*Active',
+        center_point=(0, 0),
+        height=30,
+        direction_point=(30, 30, 10)
+        )
+    for x in range(10):
+        for y in range(10):
+            dwg.add(get_cube((x, y, random()), random()))
+            dwg.add(dxf.polyline([(x, y), (x+1, y), (x+1, y+1), (x, y+1)]))
+    return dwg
+
+drawing = create_dxf_drawing()
+
+
+def profile_recursive():
+    return "".join([tag.__dxf__() for tag in recursive_iterdxftags(drawing)])
+
+
+def profile_iterative():
+    return "".join([tag.__dxf__() for tag in iterdxftags(drawing)])
+
+
+def count_recursive():
+    for tag in recursive_iterdxftags(drawing):
+        pass
+
+
+def count_iterative():
+    for tag in iterdxftags(drawing):
+        pass
+
+
+def print_result(time, text):
+    print("Operation: %s takes %.2f seconds" % (text, time))
+
+COUNT = 20
+
+
+def main():
+    print("Profiling tag flattening speed")
+    assert profile_recursive() == profile_iterative()
+    print("Sizeof DXF string: %d" % len(profile_iterative()))
+    for name, text in [
+            ('count_recursive', 'flatten tags with recursive generators'),
+            ('count_iterative', 'flatten tags with iterdxftags()'),
+            ('profile_recursive', 'tags2str() with recursive generators'),
+            ('profile_iterative', 'tags2str() with iterdxftags()')]:
+        t = Timer("%s()" % name, "from __main__ import %s" % name)
+        print_result(t.timeit(COUNT), text)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: scaling of the parallel serialization with the worker count
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import sys
+import os
+
+from timeit import Timer
+
+try:
+    import dxfwrite
+except ImportError:
+    # if dxfwrite is not 'installed' append parent dir of __file__ to sys.path
+    curdir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.abspath(os.path.join(curdir, os.path.pardir)))
+
+import dxfwrite
+from dxfwrite import DXFEngine as dxf
+
+
+def create_dxf_drawing():
+    dwg = dxf.drawing()
+    for y in range(200):
+        for x in range(500):
+            dwg.add(dxf.line((x, y), (x + 1, y + 1), color=x % 7))
+        dwg.add(dxf.polyline([(x, y, x*y) for x in range(500)]))
+    return dwg
+
+drawing = create_dxf_drawing()
+sequential = drawing.to_bytes()
+
+
+def profile(workers, executor):
+    result = drawing.to_bytes(workers=workers, executor=executor)
+    assert result == sequential
+
+
+def print_result(time, text):
+    print("Operation: %s takes %.2f seconds" % (text, time))
+
+COUNT = 3
+
+
+def main():
+    print("Profiling parallel DXF output of 100000 lines and 100000 vertices")
+    print("CPU count: %d" % (os.cpu_count() or 1))
+    t = Timer("drawing.to_bytes()", "from __main__ import drawing")
+    print_result(t.timeit(COUNT), 'sequential output')
+    for executor in ('process', 'thread'):
+        workers = 1
+        while workers <= max(os.cpu_count() or 1, 2):
+            t = Timer("profile(%d, '%s')" % (workers, executor), "from __main__ import profile")
+            print_result(t.timeit(COUNT), "output by %d %s workers" % (workers, executor))
+            workers *= 2
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: compare the DXF R12 and the DXF R2000 output of polylines
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import sys
+import os
+import random
+
+from timeit import Timer
+
+try:
+    import dxfwrite
+except ImportError:
+    # if dxfwrite is not 'installed' append parent dir of __file__ to sys.path
+    curdir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.abspath(os.path.join(curdir, os.path.pardir)))
+
+import dxfwrite
+from dxfwrite import DXFEngine as dxf
+
+
+def create_dxf_drawing(dialect):
+    random.seed(1)
+    dwg = dxf.drawing(dialect=dialect)
+    for _ in range(1000):
+        points = [(random.random() * 1000., random.random() * 1000.) for _ in range(100)]
+        dwg.add(dxf.polyline(points, color=1))
+    for _ in range(1000):
+        dwg.add(dxf.rectangle((random.random() * 1000., random.random() * 1000.), 10, 5))
+    return dwg
+
+r12 = create_dxf_drawing('R12')
+r2000 = create_dxf_drawing('R2000')
+
+
+def profile_r12():
+    return r12.to_bytes()
+
+
+def profile_r2000():
+    return r2000.to_bytes()
+
+
+def print_result(time, text):
+    print("Operation: %s takes %.2f seconds" % (text, time))
+
+COUNT = 3
+
+
+def main():
+    print("Profiling DXF output of 1000 polylines with 100 vertices and 1000 rectangles")
+    print("Size of DXF R12: %d bytes" % len(profile_r12()))
+    print("Size of DXF R2000: %d bytes" % len(profile_r2000()))
+    for name, text in [
+            ('profile_r12', 'write DXF R12'),
+            ('profile_r2000', 'write DXF R2000')]:
+        t = Timer("%s()" % name, "from __main__ import %s" % name)
+        print_result(t.timeit(COUNT), text)
+
+if __name__ == '__main__':
+    main()
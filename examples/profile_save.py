@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: compare compiled entity serializers and DXF atoms
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import sys
+import os
+
+from timeit import Timer
+
+try:
+    import dxfwrite
+except ImportError:
+    # if dxfwrite is not 'installed' append parent dir of __file__ to sys.path
+    curdir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.abspath(os.path.join(curdir, os.path.pardir)))
+
+import dxfwrite
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.base import DXFAtom, AttribTags, iterdxftags
+from dxfwrite.entities import _Entity
+
+
+def atom_tags(dxfobj):
+    """ Write entities as DXF atoms created by get_attribs(), the previous
+    implementation, for comparison.
+    """
+    for tag in iterdxftags(dxfobj):
+        if isinstance(tag, _Entity):  # entity without data
+            for subtag in atom_tags(tag.__dxftags__()):
+                yield subtag
+        elif isinstance(tag, AttribTags):
+            yield DXFAtom(tag.name)
+            for atom in tag.layout.get_tags(tag.values):
+                yield atom
+        else:
+            yield tag
+
+
+def create_dxf_drawing():
+    dwg = dxf.drawing()
+    for y in range(200):
+        dwg.add(dxf.polyline([(x, y, x*y) for x in range(500)]))
+    return dwg
+
+drawing = create_dxf_drawing()
+
+
+def profile_atoms():
+    return "".join([tag.__dxf__() for tag in atom_tags(drawing)])
+
+
+def profile_compiled():
+    return drawing.__dxf__()
+
+
+def print_result(time, text):
+    print("Operation: %s takes %.2f seconds" % (text, time))
+
+COUNT = 3
+
+
+def main():
+    print("Profiling DXF output of 100000 vertices")
+    assert profile_atoms() == profile_compiled()
+    print("Sizeof DXF string: %d" % len(profile_compiled()))
+    for name, text in [
+            ('profile_atoms', 'write DXF atoms'),
+            ('profile_compiled', 'write by compiled serializers')]:
+        t = Timer("%s()" % name, "from __main__ import %s" % name)
+        print_result(t.timeit(COUNT), text)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import unittest
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.base import DXFFormat, tags2str
+
+PLANAR = DXFFormat(drop_zero_z=True)
+
+
+def group_codes(string):
+    lines = string.split('\n')
+    return [int(code) for code in lines[0:-1:2]]
+
+
+class TestEntities(unittest.TestCase):
+    def test_line(self):
+        self.assertEqual(group_codes(tags2str(dxf.line((0, 0), (1, 1)), PLANAR)), [0, 8, 10, 20, 11, 21])
+
+    def test_nonzero_z(self):
+        codes = group_codes(tags2str(dxf.line((0, 0), (1, 1, 2)), PLANAR))
+        self.assertEqual(codes, [0, 8, 10, 20, 11, 21, 31])
+
+    def test_default_format(self):
+        self.assertIn(30, group_codes(tags2str(dxf.line((0, 0), (1, 1)))))
+
+    def test_extrusion_is_not_dropped(self):
+        circle = dxf.circle(1, (0, 0), extrusion_direction=(1, 0, 0))
+        self.assertEqual(group_codes(tags2str(circle, PLANAR)), [0, 8, 210, 220, 230, 10, 20, 40])
+
+    def test_text(self):
+        self.assertNotIn(30, group_codes(tags2str(dxf.text('Text', (0, 0), alignpoint=(1, 0)), PLANAR)))
+
+    def test_planar_polyline(self):
+        string = tags2str(dxf.polyline([(0, 0), (1, 1)]), PLANAR)
+        self.assertIn(' 70\n0\n', string)
+        self.assertNotIn(30, group_codes(string))
+        self.assertEqual(string.count('VERTEX'), 2)
+
+    def test_3d_polyline(self):
+        string = tags2str(dxf.polyline([(0, 0), (1, 1, 1)]), PLANAR)
+        self.assertIn(' 70\n8\n', string)
+        self.assertEqual(group_codes(string).count(30), 2)
+
+    def test_polyline_with_bulge(self):
+        polyline = dxf.polyline([(0, 0)])
+        polyline.add_vertex((1, 1), bulge=.5)
+        self.assertIn(' 70\n8\n', tags2str(polyline, PLANAR))
+
+    def test_polymesh_keeps_flags(self):
+        string = tags2str(dxf.polymesh(2, 2), PLANAR)
+        self.assertIn(' 70\n16\n', string)
+        self.assertNotIn(30, group_codes(string))
+
+    def test_batch(self):
+        batch = dxf.lines([(0, 0), (1, 0)], [(0, 1), (1, 1)])
+        expected = "".join(tags2str(dxf.line(start, end), PLANAR) for start, end in
+                           [((0, 0), (0, 1)), ((1, 0), (1, 1))])
+        self.assertEqual(tags2str(batch, PLANAR), expected)
+
+    def test_batch_with_nonzero_z(self):
+        batch = dxf.lines([(0, 0), (1, 0, 1)], [(0, 1), (1, 1)])
+        self.assertEqual(group_codes(tags2str(batch, PLANAR)).count(30), 2)
+
+
+class TestDrawing(unittest.TestCase):
+    def drawing(self):
+        dwg = dxf.drawing()
+        dwg.add(dxf.polyline([(x, x) for x in range(10)]))
+        dwg.add_lines([(0, 0)], [(1, 1)])
+        return dwg
+
+    def test_smaller_output(self):
+        dwg = self.drawing()
+        size = len(dwg.__dxf__())
+        dwg.set_2d_mode()
+        self.assertLess(len(dwg.__dxf__()), size)
+        dwg.set_2d_mode(False)
+        self.assertEqual(len(dwg.__dxf__()), size)
+
+    def test_keeps_format(self):
+        dwg = self.drawing()
+        dwg.set_float_format(precision=3)
+        dwg.set_omit_defaults()
+        dwg.set_2d_mode()
+        fmt = dwg.dxfformat
+        self.assertEqual((fmt.precision, fmt.omit_defaults, fmt.drop_zero_z), (3, True, True))
+        dwg.set_float_format(precision=2)
+        self.assertTrue(dwg.dxfformat.drop_zero_z)
+
+    def test_insert2(self):
+        dwg = dxf.drawing()
+        block = dxf.block('BLOCK')
+        block.add(dxf.attdef('TAG', (0, 0)))
+        dwg.blocks.add(block)
+        dwg.add(dxf.insert2(block, insert=(1, 1), attribs={'TAG': 'value'}))
+        dwg.set_2d_mode()
+        string = dwg.__dxf__()
+        insert = string[string.index('INSERT'):string.index('SEQEND')]
+        self.assertIn('ATTRIB\n', insert)
+        self.assertIn(' 10\n1.0\n 20\n1.0\n', insert)
+        self.assertNotIn(' 30\n', insert)
+
+    def test_r2000(self):
+        dwg = dxf.drawing(dialect='R2000')
+        dwg.set_2d_mode()
+        dwg.add(dxf.line((0, 0), (1, 1)))
+        dwg.add(dxf.polyline([(0, 0), (1, 1)]))
+        string = dwg.__dxf__()
+        self.assertIn('LWPOLYLINE', string)
+        self.assertIn('100\nAcDbLine\n 10\n0.0\n 20\n0.0\n 11\n', string)
+
+
+if __name__ == '__main__':
+    unittest.main()
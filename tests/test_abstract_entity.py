@@ -15,7 +15,8 @@ except ImportError:
     import unittest
 
 
-from dxfwrite.entities import _Entity, Line
+from dxfwrite.base import DXFFormat, iterdxftags, tags2str
+from dxfwrite.entities import _Entity, Line, Polyline
 
 class MockEntity(_Entity):
     DXF_ENTITY_NAME = Line.DXF_ENTITY_NAME
@@ -45,5 +46,73 @@ class TestEntity(unittest.TestCase):
         with self.assertRaises(KeyError):
             e['mozman'] = 'test'
 
+    def test_contains(self):
+        e = MockEntity(color=7)
+        self.assertTrue('color' in e)
+        self.assertFalse('linetype' in e)
+        self.assertFalse('mozman' in e)
+
+    def test_get(self):
+        e = MockEntity(color=7)
+        self.assertEqual(e.get('color'), 7)
+        self.assertEqual(e.get('thickness', 1.), 1.)
+
+    def test_keys_in_output_order(self):
+        e = MockEntity(start=(1, 2), color=7)
+        self.assertEqual(e.keys(), ['color', 'layer', 'start'])
+
+    def test_get_absent_point_error(self):
+        e = MockEntity()
+        with self.assertRaises(KeyError):
+            result = e['start']
+
+    def test_stores_raw_values(self):
+        e = MockEntity(start=(1, 2), thickness=2)
+        self.assertEqual(e['thickness'], 2.)
+        self.assertEqual(e['start']['xyz'], [1., 2., 0.])
+        e['thickness'] = 3
+        self.assertEqual(e['thickness'], 3.)
+
+    def test_attribs_compatibility(self):
+        e = MockEntity(start=(1, 2))
+        attribs = e.attribs
+        self.assertEqual(sorted(attribs.keys()), ['layer', 'start'])
+        self.assertEqual(attribs['layer'].value, '0')
+        self.assertEqual(attribs['start'].tuple, (1., 2., 0.))
+
+    def test_attribs_are_read_only(self):
+        e = MockEntity(start=(1, 2))
+        with self.assertRaises(TypeError):
+            e.attribs['layer'] = 'LAYER'
+        self.assertRaises(TypeError, e.attribs.update, {'color': 3})
+        self.assertEqual(e['layer'], '0')
+
+    def test_get_attribs_sorted_by_priority(self):
+        e = MockEntity(start=(1, 2), end=(3, 4), color=7)
+        result = "".join(tag.__dxf__() for tag in e.get_attribs())
+        self.assertEqual(result, ' 62\n7\n  8\n0\n 10\n1.0\n 20\n2.0\n 30\n0.0\n'
+                                 ' 11\n3.0\n 21\n4.0\n 31\n0.0\n')
+
+class TestEntityOutput(unittest.TestCase):
+    def test_entity_without_data_is_one_tag(self):
+        e = MockEntity(start=(1, 2))
+        self.assertEqual(list(iterdxftags(e)), [e])
+        self.assertEqual(tags2str(e), '  0\nLINE\n  8\n0\n 10\n1.0\n 20\n2.0\n 30\n0.0\n')
+
+    def test_format(self):
+        e = MockEntity(start=(1, 2), thickness=1.)
+        result = e.__dxf__(DXFFormat(precision=1, shorten_integers=True))
+        self.assertEqual(result, '  0\nLINE\n 39\n1\n  8\n0\n 10\n1\n 20\n2\n 30\n0\n')
+
+    def test_entity_with_data_is_container(self):
+        polyline = Polyline([(0, 0)])
+        tags = list(iterdxftags(polyline))
+        self.assertEqual(len(tags), 3)  # POLYLINE, VERTEX, SEQEND
+        self.assertEqual(tags2str(polyline), polyline.__dxf__())
+
+    def test_iterpoints(self):
+        e = MockEntity(start=(1, 2), end=(3, 4, 5))
+        self.assertEqual(list(e.iterpoints()), [(0, (1., 2., 0.)), (1, (3., 4., 5.))])
+
 if __name__=='__main__':
     unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from io import BytesIO, StringIO
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.aio import writechunks_async
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def create_drawing(count=200):
+    drawing = dxf.drawing()
+    for x in range(count):
+        drawing.add(dxf.line((x, 0), (x, 1)))
+    return drawing
+
+
+class StreamWriter(object):
+    """ Mimics the flow control of asyncio.StreamWriter. """
+    def __init__(self, log=None, name=None):
+        self.data = []
+        self.drains = 0
+        self.log = log
+        self.name = name
+
+    def write(self, data):
+        self.data.append(data)
+        if self.log is not None:
+            self.log.append(self.name)
+
+    async def drain(self):
+        self.drains += 1
+        await asyncio.sleep(0)
+
+
+class AsyncFile(object):
+    """ Like a binary file of aiofiles. """
+    mode = 'wb'
+
+    def __init__(self):
+        self.data = []
+
+    async def write(self, data):
+        self.data.append(data)
+
+
+class TestSaveAsync(unittest.TestCase):
+    def test_stream_writer(self):
+        drawing = create_drawing()
+        writer = StreamWriter()
+        run(drawing.save_async(writer, chunk_size=1000))
+        self.assertEqual(b"".join(writer.data), drawing.to_bytes())
+        self.assertEqual(writer.drains, len(writer.data))
+
+    def test_binary_file_object(self):
+        drawing = create_drawing()
+        stream = BytesIO()
+        run(drawing.save_async(stream, offload=True))
+        self.assertEqual(stream.getvalue(), drawing.to_bytes())
+
+    def test_text_file_object(self):
+        drawing = create_drawing()
+        stream = StringIO()
+        run(drawing.save_async(stream, chunk_size=1000))
+        self.assertEqual(stream.getvalue(), drawing.__dxf__())
+
+    def test_coroutine_write(self):
+        drawing = create_drawing()
+        stream = AsyncFile()
+        run(drawing.save_async(stream, chunk_size=1000))
+        self.assertEqual(b"".join(stream.data), drawing.to_bytes())
+
+    def test_filename(self):
+        drawing = create_drawing()
+        fd, filename = tempfile.mkstemp(suffix='.dxf')
+        os.close(fd)
+        try:
+            run(drawing.save_async(filename, offload=True))
+            with open(filename, 'rb') as fp:
+                self.assertEqual(fp.read(), drawing.to_bytes())
+        finally:
+            os.remove(filename)
+
+    def test_concurrent_saves(self):
+        log = []
+        drawing1 = create_drawing()
+        drawing2 = create_drawing()
+
+        async def save_both():
+            await asyncio.gather(drawing1.save_async(StreamWriter(log, 1), chunk_size=1000),
+                                 drawing2.save_async(StreamWriter(log, 2), chunk_size=1000))
+        run(save_both())
+        # the saves are interleaved chunk by chunk
+        self.assertEqual(log[:4], [1, 2, 1, 2])
+
+    def test_writechunks(self):
+        writer = StreamWriter()
+        run(writechunks_async(writer, iter([b'a', b'b'])))
+        self.assertEqual(writer.data, [b'a', b'b'])
+
+
+class TestImport(unittest.TestCase):
+    def test_asyncio_imported_on_demand(self):
+        code = "import sys, dxfwrite.drawing; print('asyncio' in sys.modules)"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=root)
+        self.assertEqual(output.strip(), b'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
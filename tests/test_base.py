@@ -120,6 +120,30 @@ class TestDXFType(unittest.TestCase):
         dxftype = _DXFType()
         self.assertRaises(ValueError, dxftype.check, '0', 7777)
 
+    def test_caster(self):
+        dxftype = _DXFType()
+        self.assertEqual(dxftype.caster(10), float)
+        self.assertEqual(dxftype.caster(70), int)
+        self.assertEqual(dxftype.caster(1071), int)
+        self.assertEqual(dxftype.caster(1)('text'), 'text')
+        self.assertEqual(dxftype.caster(290)('7'), 1)
+
+    def test_caster_unknown_group_code(self):
+        dxftype = _DXFType()
+        for code in (-1, 80, 1072, 7777):
+            self.assertRaises(KeyError, dxftype.caster, code)
+
+    def test_atom_unknown_group_code(self):
+        for code in (-1, 80, 1072):
+            self.assertRaises(KeyError, DXFAtom, '0', code)
+
+    def test_add_group_code_type(self):
+        dxftype = _DXFType()
+        dxftype.add_group_code_type('float', 80, 81)
+        self.assertEqual(dxftype.caster(81), float)
+        self.assertEqual(dxftype.group_code_type(80), 'float')
+        self.assertTrue(dxftype.check(1., 80))
+
 class TestDXFList(unittest.TestCase):
     def test_empty_DXFList(self):
         atoms = DXFList()
@@ -238,6 +262,166 @@ class TestDXFPoint(unittest.TestCase):
         p = DXFPoint( (1., 2., 3.) )
         self.assertEqual(p.tuple, (1., 2., 3.))
 
+    def test_coords_are_float_tuple(self):
+        p = DXFPoint(('1', 2))
+        self.assertEqual(p.coords, (1., 2.))
+        self.assertTrue(isinstance(p.coords[1], float))
+
+    def test_no_instance_dict(self):
+        for obj in (DXFPoint(), DXFPoint2D(), DXFPoint3D(), DXFFloat(1.),
+                    DXFAtom('TEXT')):
+            self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_extrusion_group_codes(self):
+        point = DXFPoint((0., 0., 1.), 200)
+        self.assertEqual(dxfstr(point), '210\n0.0\n220\n0.0\n230\n1.0\n')
+
+    def test_DXFPoint2D_output(self):
+        point = DXFPoint2D((1., 2., 3.), 1)
+        self.assertEqual(dxfstr(point), ' 11\n1.0\n 21\n2.0\n')
+
+
+class TestAttribLayout(unittest.TestCase):
+    def setUp(self):
+        self.layout = AttribLayout({
+            'point': AttribDef(DXFPoint3D, 0, priority=100),
+            'name': AttribDef(DXFString, 2, priority=10),
+            'flags': AttribDef(DXFFloat, 70, priority=20),
+            'pattern': AttribDef(PassThroughFactory, priority=200),
+        })
+
+    def test_slot_order(self):
+        self.assertEqual(self.layout.keys, ('name', 'flags', 'point', 'pattern'))
+
+    def test_raw_values(self):
+        values = self.layout.new_values()
+        self.layout.set_value(values, 'point', (1, 2))
+        self.layout.set_value(values, 'flags', 3.)
+        self.assertEqual(values, [None, 3, (1., 2., 0.), None])
+        self.assertEqual(self.layout.get_value(values, 'flags'), 3)
+        self.assertEqual(self.layout.get_value(values, 'point').tuple, (1., 2., 0.))
+
+    def test_get_absent_value(self):
+        values = self.layout.new_values()
+        self.assertRaises(KeyError, self.layout.get_value, values, 'name')
+
+    def test_invalid_point(self):
+        values = self.layout.new_values()
+        self.assertRaises(ValueError, self.layout.set_value, values, 'point', (1, ))
+
+    def test_get_tags(self):
+        pattern = DXFList([DXFAtom('PATTERN', 3)])
+        values = self.layout.new_values()
+        self.layout.set_value(values, 'pattern', pattern)
+        self.layout.set_value(values, 'name', 'NAME')
+        self.assertEqual(self.layout.present_keys(values), ['name', 'pattern'])
+        tags = self.layout.get_tags(values)
+        self.assertEqual(dxfstr(DXFList(tags)), '  2\nNAME\n  3\nPATTERN\n')
+        self.assertTrue(tags[1] is pattern)
+
+    def test_serialize(self):
+        values = self.layout.new_values()
+        self.layout.set_value(values, 'name', 'NAME')
+        self.layout.set_value(values, 'point', (1, 2))
+        self.assertEqual(self.layout.serialize('TEST', values),
+                         '  0\nTEST\n  2\nNAME\n 10\n1.0\n 20\n2.0\n 30\n0.0\n')
+
+    def test_serialize_with_format(self):
+        values = self.layout.new_values()
+        self.layout.set_value(values, 'flags', 7)
+        self.layout.set_value(values, 'point', (1.23456, 2))
+        fmt = DXFFormat(precision=2)
+        self.assertEqual(self.layout.serialize('TEST', values, fmt),
+                         '  0\nTEST\n 70\n7\n 10\n1.23\n 20\n2.00\n 30\n0.00\n')
+
+    def test_serialize_object(self):
+        values = self.layout.new_values()
+        self.layout.set_value(values, 'pattern', DXFList([DXFAtom('A', 3), DXFFloat(1.5, 49)]))
+        self.assertEqual(self.layout.serialize('TEST', values, DXFFormat(1)),
+                         '  0\nTEST\n  3\nA\n 49\n1.5\n')
+
+    def test_serialize_point_dimension(self):
+        layout = AttribLayout({'point': AttribDef(DXFPoint, 0)})
+        values = layout.new_values()
+        layout.set_value(values, 'point', (1, 2))
+        self.assertEqual(layout.serialize('TEST', values), '  0\nTEST\n 10\n1.0\n 20\n2.0\n')
+        layout.set_value(values, 'point', (1, 2, 3))
+        self.assertEqual(layout.serialize('TEST', values),
+                         '  0\nTEST\n 10\n1.0\n 20\n2.0\n 30\n3.0\n')
+
+    def test_serialize_equals_tags(self):
+        values = self.layout.new_values()
+        self.layout.set_value(values, 'name', u'\u20ac')
+        self.layout.set_value(values, 'flags', 3)
+        self.layout.set_value(values, 'point', (1, 2, 3))
+        expected = DXFAtom('TEST').__dxf__() + dxfstr(DXFList(self.layout.get_tags(values)))
+        self.assertEqual(AttribTags('TEST', self.layout, values).__dxf__(), expected)
+
+    def test_get_attrib_layout_is_cached(self):
+        class Entity(object):
+            DXF_ATTRIBUTES = {'name': AttribDef(DXFString, 2)}
+        self.assertTrue(get_attrib_layout(Entity) is get_attrib_layout(Entity))
+
+
+class TestDXFFormat(unittest.TestCase):
+    def test_default(self):
+        fmt = DXFFormat()
+        self.assertEqual(fmt.float2str(0.1 + 0.2), '0.30000000000000004')
+        self.assertEqual(fmt.float2str(5.), '5.0')
+
+    def test_precision(self):
+        fmt = DXFFormat(precision=3)
+        self.assertEqual(fmt.float2str(0.1 + 0.2), '0.300')
+        self.assertEqual(fmt.float2str(-0.0001), '0.000')
+        self.assertEqual(fmt.float2str(-0.0005), '-0.001')
+
+    def test_strip_zeros(self):
+        fmt = DXFFormat(precision=3, strip_zeros=True)
+        self.assertEqual(fmt.float2str(0.1 + 0.2), '0.3')
+        self.assertEqual(fmt.float2str(1.23456), '1.235')
+        self.assertEqual(fmt.float2str(-0.0001), '0.0')
+        self.assertEqual(fmt.float2str(0.00001), '0.0')
+        self.assertEqual(fmt.float2str(0.0012), '0.001')
+        self.assertEqual(fmt.float2str(1e16), '10000000000000000.0')
+        self.assertEqual(fmt.float2str(-20.), '-20.0')
+
+    def test_strip_zeros_without_decimal_places(self):
+        fmt = DXFFormat(precision=0, strip_zeros=True)
+        self.assertEqual(fmt.float2str(10.), '10')
+        self.assertEqual(fmt.float2str(-0.4), '0')
+
+    def test_shorten_integers(self):
+        fmt = DXFFormat(shorten_integers=True)
+        self.assertEqual(fmt.float2str(5.), '5')
+        self.assertEqual(fmt.float2str(-5.), '-5')
+        self.assertEqual(fmt.float2str(5.5), '5.5')
+        self.assertEqual(fmt.float2str(1e300), '1e+300')
+
+    def test_all_options(self):
+        fmt = DXFFormat(precision=3, strip_zeros=True, shorten_integers=True)
+        self.assertEqual(fmt.float2str(0.1 + 0.2), '0.3')
+        self.assertEqual(fmt.float2str(4.9999), '5')
+        self.assertEqual(fmt.float2str(-0.0001), '0')
+
+    def test_atoms(self):
+        fmt = DXFFormat(precision=2, strip_zeros=True, shorten_integers=True)
+        self.assertEqual(DXFFloat(1.234).__dxf__(fmt), ' 40\n1.23\n')
+        self.assertEqual(DXFAngle(90.).__dxf__(fmt), ' 50\n90\n')
+        self.assertEqual(DXFInt(7).__dxf__(fmt), ' 70\n7\n')
+        self.assertEqual(DXFString('1.2345').__dxf__(fmt), '  1\n1.2345\n')
+
+    def test_points(self):
+        fmt = DXFFormat(precision=2, strip_zeros=True, shorten_integers=True)
+        point = DXFPoint3D((1.234, 2.))
+        self.assertEqual(point.__dxf__(fmt), ' 10\n1.23\n 20\n2\n 30\n0\n')
+        point = DXFPoint2D((1.234, 2., 3.))
+        self.assertEqual(point.__dxf__(fmt), ' 10\n1.23\n 20\n2\n')
+
+    def test_tags2str(self):
+        fmt = DXFFormat(precision=1)
+        tags = DXFList([DXFAtom('LINE'), DXFPoint((0.12, 0.17))])
+        self.assertEqual(tags2str(tags, fmt), '  0\nLINE\n 10\n0.1\n 20\n0.2\n')
+
 
 if __name__=='__main__':
     unittest.main()
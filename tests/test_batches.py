@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import unittest
+from io import StringIO
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.base import DXFFormat, dxfstr, tags2str
+from dxfwrite.batches import LineBatch, CircleBatch
+
+
+def joined(entities, fmt=None):
+    return "".join(tags2str(entity, fmt) for entity in entities)
+
+
+class TestBatchOutput(unittest.TestCase):
+    def test_lines(self):
+        starts = [(x, 0) for x in range(10)]
+        ends = [(x, 1., 2) for x in range(10)]
+        colors = [x % 7 for x in range(10)]
+        batch = dxf.lines(starts, ends, color=colors, layer='LINES')
+        self.assertEqual(len(batch), 10)
+        expected = joined(dxf.line(start, end, color=color, layer='LINES')
+                          for start, end, color in zip(starts, ends, colors))
+        self.assertEqual(dxfstr(batch), expected)
+
+    def test_points(self):
+        batch = dxf.points([(0, 0), (1, 1, 1)])
+        self.assertEqual(dxfstr(batch), dxfstr(dxf.point((0, 0))) + dxfstr(dxf.point((1, 1, 1))))
+
+    def test_circles_with_scalar_radius(self):
+        batch = dxf.circles([(0, 0), (1, 1)], 2.5, layer='CIRCLES')
+        expected = joined(dxf.circle(2.5, center, layer='CIRCLES') for center in [(0, 0), (1, 1)])
+        self.assertEqual(dxfstr(batch), expected)
+
+    def test_arcs(self):
+        batch = dxf.arcs([(0, 0), (1, 1)], [1, 2], [0, 10], 90)
+        expected = dxfstr(dxf.arc(1, (0, 0), 0, 90)) + dxfstr(dxf.arc(2, (1, 1), 10, 90))
+        self.assertEqual(dxfstr(batch), expected)
+
+    def test_texts(self):
+        batch = dxf.texts([(0, 0), (1, 1)], ['Text', u'100% €'], height=.5,
+                          style=['STANDARD', 'ARIAL'])
+        expected = dxfstr(dxf.text('Text', (0, 0), height=.5, style='STANDARD')) + \
+            dxfstr(dxf.text(u'100% €', (1, 1), height=.5, style='ARIAL'))
+        self.assertEqual(dxfstr(batch), expected)
+
+    def test_solids(self):
+        solids = [[(0, 0), (1, 0), (1, 1)], [(0, 0), (1, 0), (1, 1), (0, 1)]]
+        batch = dxf.solids(solids, color=1)
+        self.assertEqual(dxfstr(batch), joined(dxf.solid(points, color=1) for points in solids))
+
+    def test_scalar_point_attribute(self):
+        batch = dxf.circles([(0, 0)], 1., extrusion_direction=(0, 0, -1))
+        self.assertEqual(dxfstr(batch), dxfstr(dxf.circle(1., (0, 0), extrusion_direction=(0, 0, -1))))
+
+    def test_format(self):
+        fmt = DXFFormat(precision=2, shorten_integers=True)
+        batch = dxf.circles([(0, 0.123), (1.5, 1)], [1, 2.345], thickness=.5)
+        expected = joined([dxf.circle(1, (0, 0.123), thickness=.5),
+                           dxf.circle(2.345, (1.5, 1), thickness=.5)], fmt)
+        self.assertEqual(tags2str(batch, fmt), expected)
+
+    def test_chunks(self):
+        batch = LineBatch([(x, 0) for x in range(25)], [(x, 1) for x in range(25)])
+        batch.CHUNK_SIZE = 10
+        self.assertEqual(len(batch.__dxftags__()), 3)
+        expected = joined(dxf.line((x, 0), (x, 1)) for x in range(25))
+        self.assertEqual(dxfstr(batch), expected)
+
+    def test_empty_batch(self):
+        batch = dxf.lines([], [])
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(dxfstr(batch), '')
+
+
+class TestBatchErrors(unittest.TestCase):
+    def test_different_column_lengths(self):
+        self.assertRaises(ValueError, dxf.lines, [(0, 0)], [(1, 1), (2, 2)])
+
+    def test_invalid_point(self):
+        self.assertRaises(ValueError, dxf.points, [(0, 0), (1, )])
+
+    def test_invalid_attribute(self):
+        self.assertRaises(KeyError, dxf.points, [(0, 0)], mozman=1)
+
+    def test_requires_column(self):
+        self.assertRaises(ValueError, CircleBatch, (0, 0), 1.)
+
+    def test_invalid_solid(self):
+        self.assertRaises(ValueError, dxf.solids, [[(0, 0), (1, 0)]])
+
+
+class TestDrawing(unittest.TestCase):
+    def test_add_batches(self):
+        dwg = dxf.drawing()
+        dwg.add_lines([(0, 0)], [(1, 1)])
+        dwg.add_points([(0, 0)])
+        dwg.add_circles([(0, 0)], [1])
+        dwg.add_arcs([(0, 0)], 1, 0, 90)
+        dwg.add_texts([(0, 0)], ['Text'])
+        dwg.add_solids([[(0, 0), (1, 0), (1, 1)]])
+        expected = dxf.drawing()
+        expected.add(dxf.line((0, 0), (1, 1)))
+        expected.add(dxf.point((0, 0)))
+        expected.add(dxf.circle(1, (0, 0)))
+        expected.add(dxf.arc(1, (0, 0), 0, 90))
+        expected.add(dxf.text('Text', (0, 0)))
+        expected.add(dxf.solid([(0, 0), (1, 0), (1, 1)]))
+        self.assertEqual(dwg.to_bytes(), expected.to_bytes())
+
+    def test_add_by_layout_proxies(self):
+        dwg = dxf.drawing()
+        dwg.modelspace.add(dxf.lines([(0, 0)], [(1, 1)]))
+        batch = dwg.paperspace.add(dxf.circles([(0, 0), (1, 1)], 1.))
+        self.assertEqual(batch['paper_space'], 1)
+        expected = dxf.drawing()
+        expected.modelspace.add(dxf.line((0, 0), (1, 1)))
+        expected.paperspace.add(dxf.circle(1., (0, 0)))
+        expected.paperspace.add(dxf.circle(1., (1, 1)))
+        self.assertEqual(dwg.to_bytes(), expected.to_bytes())
+
+    def test_set_column(self):
+        batch = dxf.lines([(0, 0), (1, 0)], [(0, 1), (1, 1)])
+        tags2str(batch)  # cache the template
+        batch['color'] = [1, 2]
+        expected = [dxf.line((0, 0), (0, 1), color=1), dxf.line((1, 0), (1, 1), color=2)]
+        self.assertEqual(tags2str(batch), joined(expected))
+
+    def test_stream_extents(self):
+        dwg = dxf.drawing()
+        with dwg.stream(StringIO()):
+            dwg.add_circles([(-1, -2), (3, 4, 5)], 1.)
+        self.assertEqual(dwg.header['$EXTMIN']['xyz'], [-2., -3., 0.])
+        self.assertEqual(dwg.header['$EXTMAX']['xyz'], [4., 5., 5.])
+
+
+if __name__ == '__main__':
+    unittest.main()
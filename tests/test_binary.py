@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import struct
+import unittest
+from io import BytesIO, StringIO
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.base import DXFAtom, DXFFloat, DXFInt, DXFString, DXFPoint, DXFPoint2D, DXFList
+from dxfwrite.base import pack_tag, str2bin, tags2bin, tags2str, iterbinchunks, BINARY_SENTINEL
+
+
+def read_binary(data):
+    """ Read R12 binary DXF data as list of (group_code, value) tuples. """
+    tags = []
+    pos = 0
+    while pos < len(data):
+        code = data[pos]
+        pos += 1
+        if code == 255:
+            code = struct.unpack_from('<h', data, pos)[0]
+            pos += 2
+        if 10 <= code < 60 or 110 <= code < 150 or 210 <= code < 240 or 1010 <= code < 1060:
+            value = struct.unpack_from('<d', data, pos)[0]
+            pos += 8
+        elif 90 <= code < 100 or code == 1071:
+            value = struct.unpack_from('<l', data, pos)[0]
+            pos += 4
+        elif 60 <= code < 80 or 170 <= code < 180 or 1060 <= code < 1071:
+            value = struct.unpack_from('<h', data, pos)[0]
+            pos += 2
+        else:
+            end = data.index(b'\x00', pos)
+            value = data[pos:end].decode('cp1252')
+            pos = end + 1
+        tags.append((code, value))
+    return tags
+
+
+def read_ascii(string):
+    lines = string.split('\n')
+    tags = []
+    for code, value in zip(lines[0:-1:2], lines[1::2]):
+        code = int(code)
+        tags.append((code, DXFAtom._dxftype.cast(value, code)))
+    return tags
+
+
+class TestPackTag(unittest.TestCase):
+    def test_string(self):
+        self.assertEqual(pack_tag(0, 'LINE'), b'\x00LINE\x00')
+
+    def test_float(self):
+        self.assertEqual(pack_tag(10, 1.5), b'\x0a' + struct.pack('<d', 1.5))
+
+    def test_int16(self):
+        self.assertEqual(pack_tag(62, -7), b'\x3e' + struct.pack('<h', -7))
+
+    def test_int32(self):
+        self.assertEqual(pack_tag(90, 100000), b'\x5a' + struct.pack('<l', 100000))
+
+    def test_extended_group_code(self):
+        self.assertEqual(pack_tag(1000, 'XDATA'), b'\xff\xe8\x03XDATA\x00')
+        self.assertEqual(pack_tag(1071, 7), b'\xff\x2f\x04' + struct.pack('<l', 7))
+
+    def test_encoding(self):
+        self.assertEqual(pack_tag(1, u'\xe4€'), b'\x01\xe4\x80\x00')
+
+    def test_unknown_group_code(self):
+        self.assertRaises(KeyError, pack_tag, 2000, 'x')
+
+
+class TestTags(unittest.TestCase):
+    def test_atoms(self):
+        tags = DXFList([DXFString('text'), DXFFloat(1.25), DXFInt(3)])
+        self.assertEqual(read_binary(tags2bin(tags)), [(1, 'text'), (40, 1.25), (70, 3)])
+
+    def test_points(self):
+        self.assertEqual(read_binary(DXFPoint((1, 2, 3), 1).__dxfbin__()), [(11, 1.), (21, 2.), (31, 3.)])
+        self.assertEqual(read_binary(DXFPoint2D((1, 2, 3)).__dxfbin__()), [(10, 1.), (20, 2.)])
+
+    def test_str2bin(self):
+        string = "  0\nLINE\n 10\n1.5\n 62\n7\n"
+        self.assertEqual(str2bin(string), pack_tag(0, 'LINE') + pack_tag(10, 1.5) + pack_tag(62, 7))
+
+    def test_tags_without_dxfbin(self):
+        class Tag(object):
+            def __dxf__(self):
+                return "  0\nLINE\n"
+        self.assertEqual(tags2bin(DXFList([Tag()])), pack_tag(0, 'LINE'))
+
+    def test_chunks(self):
+        tags = DXFList([DXFFloat(x) for x in range(100)])
+        chunks = list(iterbinchunks(tags, chunk_size=90))
+        self.assertEqual(len(chunks), 10)
+        self.assertEqual(b"".join(chunks), tags2bin(tags))
+
+
+class TestEntities(unittest.TestCase):
+    def check(self, dxfobj):
+        self.assertEqual(read_binary(tags2bin(dxfobj)), read_ascii(tags2str(dxfobj)))
+
+    def test_entities(self):
+        self.check(dxf.line((0, 0), (1.5, 2, 3), color=3, layer='LINES'))
+        self.check(dxf.text(u'100% €', (0, 0), height=.5))
+        self.check(dxf.insert('BLOCK', (1, 1), xscale=2.))
+
+    def test_batches(self):
+        self.check(dxf.lines([(0, 0), (1, 1)], [(2, 2), (3, 3, 3)], color=[1, 2]))
+        self.check(dxf.texts([(0, 0), (1, 1)], ['Text', u'€'], style='STANDARD'))
+
+    def test_polyline(self):
+        polyline = dxf.polyline([(0, 0), (1, 1), (2, 3)])
+        polyline.add_vertex((4, 4), bulge=.5)
+        polyline.add_vertex((5, 5), layer='OTHER')
+        self.check(polyline)
+
+    def test_polyface_and_polymesh(self):
+        polyface = dxf.polyface()
+        polyface.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0)], color=2)
+        polyface.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+        self.check(polyface)
+        polymesh = dxf.polymesh(3, 3)
+        polymesh.set_vertex(1, 1, (1, 1, 1))
+        self.check(polymesh)
+
+    def test_mtext(self):
+        self.check(dxf.mtext('Line1\nLine2', (1, 1)))
+
+
+class TestDrawing(unittest.TestCase):
+    def drawing(self):
+        dwg = dxf.drawing()
+        dwg.add(dxf.line((0, 0), (1, 1)))
+        dwg.add_circles([(0, 0), (1, 1)], 1.5)
+        return dwg
+
+    def test_to_bytes(self):
+        dwg = self.drawing()
+        data = dwg.to_bytes(format='binary')
+        self.assertTrue(data.startswith(BINARY_SENTINEL))
+        self.assertTrue(data.endswith(b'\x00EOF\x00'))
+        self.assertEqual(read_binary(data[len(BINARY_SENTINEL):]), read_ascii(dwg.__dxf__()))
+
+    def test_binary_is_smaller(self):
+        dwg = dxf.drawing()
+        dwg.add_lines([(x / 3., x / 7.) for x in range(100)], [(x / 11., x / 13.) for x in range(100)])
+        self.assertLess(len(dwg.to_bytes(format='binary')), len(dwg.to_bytes()))
+
+    def test_save_to_fileobj(self):
+        dwg = self.drawing()
+        fileobj = BytesIO()
+        dwg.save_to_fileobj(fileobj, format='binary')
+        self.assertEqual(fileobj.getvalue(), dwg.to_bytes(format='binary'))
+
+    def test_float_format_does_not_apply(self):
+        dwg = self.drawing()
+        expected = dwg.to_bytes(format='binary')
+        dwg.set_float_format(precision=1)
+        self.assertEqual(dwg.to_bytes(format='binary'), expected)
+
+    def test_parallel(self):
+        dwg = self.drawing()
+        self.assertEqual(dwg.to_bytes(workers=2, executor='thread', format='binary'),
+                         dwg.to_bytes(format='binary'))
+
+    def test_requires_binary_stream(self):
+        self.assertRaises(ValueError, self.drawing().save_to_fileobj, StringIO(), format='binary')
+
+    def test_invalid_format(self):
+        self.assertRaises(ValueError, self.drawing().to_bytes, format='dwg')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.acadctb import UserStyles
+from dxfwrite.compression import compression_for, member_name, arcname
+
+
+class TestHelpers(unittest.TestCase):
+    def test_compression_for(self):
+        self.assertEqual(compression_for('plan.dxf.gz'), 'gzip')
+        self.assertEqual(compression_for('plan.DXF.BZ2'), 'bz2')
+        self.assertEqual(compression_for('plan.xz'), 'xz')
+        self.assertEqual(compression_for('/tmp/plan.zip'), 'zip')
+        self.assertIsNone(compression_for('plan.dxf'))
+
+    def test_member_name(self):
+        self.assertEqual(member_name('/tmp/plan.zip'), 'plan.dxf')
+        self.assertEqual(member_name('plan.dxf.zip'), 'plan.dxf')
+
+    def test_arcname(self):
+        self.assertEqual(arcname('xrefs/./base.dxf'), 'xrefs/base.dxf')
+        self.assertEqual(arcname('xrefs\\base.dxf'), 'xrefs/base.dxf')
+        self.assertEqual(arcname('xrefs/../base.dxf'), 'base.dxf')
+        self.assertIsNone(arcname('../base.dxf'))
+        self.assertIsNone(arcname('xrefs/../../base.dxf'))
+        self.assertIsNone(arcname('/tmp/base.dxf'))
+        self.assertIsNone(arcname('C:\\xrefs\\base.dxf'))
+
+
+class TestCompressedSave(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.drawing = dxf.drawing()
+        self.drawing.add_lines([(x, 0) for x in range(100)], [(x, 1) for x in range(100)])
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def saveas(self, name, **kwargs):
+        self.drawing.filename = os.path.join(self.tempdir, name)
+        self.drawing.save(**kwargs)
+        return self.drawing.filename
+
+    def test_gzip(self):
+        filename = self.saveas('plan.dxf.gz', compression='gzip', compresslevel=1)
+        with gzip.open(filename, 'rb') as fileobj:
+            self.assertEqual(fileobj.read(), self.drawing.to_bytes())
+
+    def test_bz2(self):
+        filename = self.saveas('plan.dxf.bz2', compression='bz2')
+        with bz2.open(filename, 'rb') as fileobj:
+            self.assertEqual(fileobj.read(), self.drawing.to_bytes())
+
+    def test_xz(self):
+        filename = self.saveas('plan.dxf.xz', compression='xz', compresslevel=0)
+        with lzma.open(filename, 'rb') as fileobj:
+            self.assertEqual(fileobj.read(), self.drawing.to_bytes())
+
+    def test_zip(self):
+        filename = self.saveas('plan.zip', compression='zip', chunk_size=100)
+        with zipfile.ZipFile(filename) as zip_file:
+            self.assertEqual(zip_file.read('plan.dxf'), self.drawing.to_bytes())
+
+    def test_zip_compresslevel(self):
+        filename = self.saveas('plan.zip', compression='zip', compresslevel=1)
+        with zipfile.ZipFile(filename) as zip_file:
+            self.assertEqual(zip_file.read('plan.dxf'), self.drawing.to_bytes())
+
+    def test_explicit_compression(self):
+        filename = self.saveas('plan.dxf', compression='gzip')
+        with gzip.open(filename, 'rb') as fileobj:
+            self.assertEqual(fileobj.read(), self.drawing.to_bytes())
+
+    def test_suffix_without_compression(self):
+        filename = self.saveas('plan.dxf.gz')
+        with open(filename, 'rb') as fileobj:
+            self.assertEqual(fileobj.read(), self.drawing.to_bytes())
+
+    def test_binary_format(self):
+        filename = self.saveas('plan.dxf.gz', compression='gzip', format='binary')
+        with gzip.open(filename, 'rb') as fileobj:
+            self.assertEqual(fileobj.read(), self.drawing.to_bytes(format='binary'))
+
+    def test_pipeline(self):
+        filename = self.saveas('plan.dxf.gz', compression='gzip', pipeline=True, chunk_size=100)
+        with gzip.open(filename, 'rb') as fileobj:
+            self.assertEqual(fileobj.read(), self.drawing.to_bytes())
+
+    def test_invalid_compression(self):
+        self.assertRaises(ValueError, self.saveas, 'plan.dxf', compression='rar')
+
+
+class TestBundle(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.tempdir, 'xrefs'))
+        self.xref = os.path.join(self.tempdir, 'xrefs', 'base.dxf')
+        dxf.drawing(self.xref).save()
+        self.drawing = dxf.drawing(os.path.join(self.tempdir, 'plan.dxf'))
+        self.drawing.add_xref(os.path.join('xrefs', 'base.dxf'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_add_xref_records_paths(self):
+        self.drawing.add_xref(os.path.join('xrefs', 'base.dxf'), insert=(1, 1))
+        self.assertEqual(self.drawing.xrefs, [os.path.join('xrefs', 'base.dxf')])
+
+    def test_bundle(self):
+        ctb = UserStyles('bundle test')
+        filename = os.path.join(self.tempdir, 'bundle.zip')
+        self.drawing.save_bundle(filename, ctbs={'plot.ctb': ctb})
+        with zipfile.ZipFile(filename) as zip_file:
+            self.assertEqual(sorted(zip_file.namelist()), ['bundle.dxf', 'plot.ctb', 'xrefs/base.dxf'])
+            self.assertEqual(zip_file.read('bundle.dxf'), self.drawing.to_bytes())
+            with open(self.xref, 'rb') as fileobj:
+                self.assertEqual(zip_file.read('xrefs/base.dxf'), fileobj.read())
+            self.assertTrue(zip_file.read('plot.ctb').startswith(b'PIAFILEVERSION_2.0'))
+
+    def test_absolute_xref_path(self):
+        drawing = dxf.drawing(os.path.join(self.tempdir, 'plan.dxf'))
+        drawing.add_xref(self.xref)
+        expected = drawing.to_bytes()
+        filename = os.path.join(self.tempdir, 'bundle.zip')
+        drawing.save_bundle(filename)
+        with zipfile.ZipFile(filename) as zip_file:
+            self.assertEqual(sorted(zip_file.namelist()), ['base.dxf', 'bundle.dxf'])
+            self.assertEqual(zip_file.read('bundle.dxf'),
+                             expected.replace(self.xref.encode(drawing.ENCODING), b'base.dxf'))
+        self.assertEqual(drawing.to_bytes(), expected)
+
+    def test_xref_outside_of_bundle(self):
+        os.mkdir(os.path.join(self.tempdir, 'sheets'))
+        drawing = dxf.drawing(os.path.join(self.tempdir, 'sheets', 'plan.dxf'))
+        drawing.add_xref(os.path.join('..', 'xrefs', 'base.dxf'))
+        filename = os.path.join(self.tempdir, 'bundle.zip')
+        drawing.save_bundle(filename)
+        with zipfile.ZipFile(filename) as zip_file:
+            self.assertEqual(sorted(zip_file.namelist()), ['base.dxf', 'bundle.dxf'])
+            self.assertNotIn(b'..', zip_file.read('bundle.dxf'))
+
+    def test_invalid_ctb_name(self):
+        filename = os.path.join(self.tempdir, 'bundle.zip')
+        self.assertRaises(ValueError, self.drawing.save_bundle, filename,
+                          ctbs={'../plot.ctb': UserStyles()})
+        self.assertRaises(ValueError, self.drawing.save_bundle, filename,
+                          ctbs={'xrefs/base.dxf': UserStyles()})
+
+    def test_missing_xref(self):
+        self.drawing.add_xref('missing.dxf')
+        self.assertRaises(IOError, self.drawing.save_bundle, os.path.join(self.tempdir, 'bundle.zip'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,10 +8,13 @@ __author__ = "mozman <mozman@gmx.at>"
 
 import os
 import re
+import shutil
+import tempfile
 import unittest
+from io import BytesIO
 
 from dxfwrite import DXFEngine as dxf
-from dxfwrite.util import is_string
+from dxfwrite.util import is_string, to_unicode, StringIO
 
 
 class TestDrawing(unittest.TestCase):
@@ -99,6 +102,59 @@ class TestDrawing(unittest.TestCase):
         element = dwg.add_ucs('TEST')
         self.assertEqual(element['name'], 'TEST')
 
+    def test_to_bytes(self):
+        dwg = dxf.drawing()
+        dwg.add(dxf.text(to_unicode('äöü')))
+        result = dwg.to_bytes()
+        self.assertEqual(result, dwg.__dxf__().encode(dwg.ENCODING))
+        self.assertTrue(to_unicode('äöü').encode(dwg.ENCODING) in result)
+
+    def test_to_bytes_small_chunks(self):
+        dwg = dxf.drawing()
+        self.assertEqual(dwg.to_bytes(chunk_size=10), dwg.to_bytes())
+
+    def test_save_to_binary_fileobj(self):
+        dwg = dxf.drawing()
+        fileobj = BytesIO()
+        dwg.save_to_fileobj(fileobj)
+        self.assertEqual(fileobj.getvalue(), dwg.to_bytes())
+
+    def test_float_format(self):
+        dwg = dxf.drawing()
+        dwg.add(dxf.line((0, 0), (1.23456, 2)))
+        self.assertTrue(' 11\n1.23456\n 21\n2.0\n' in dwg.__dxf__())
+        dwg.set_float_format(precision=2)
+        self.assertTrue(' 11\n1.23\n 21\n2\n' in dwg.__dxf__())
+        self.assertEqual(dwg.to_bytes(), dwg.__dxf__().encode(dwg.ENCODING))
+
+    def test_save_to_text_fileobj(self):
+        dwg = dxf.drawing()
+        fileobj = StringIO()
+        dwg.save_to_fileobj(fileobj, chunk_size=100)
+        self.assertEqual(fileobj.getvalue(), dwg.__dxf__())
+
+
+
+class TestSave(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_platform_line_endings(self):
+        dwg = dxf.drawing(os.path.join(self.tempdir, 'plan.dxf'))
+        dwg.add(dxf.text(to_unicode('äöü')))
+        dwg.save()
+        with open(dwg.filename, 'rb') as fileobj:
+            self.assertEqual(fileobj.read(), dwg.to_bytes().replace(b'\n', os.linesep.encode('ascii')))
+
+    def test_binary_format_line_endings(self):
+        dwg = dxf.drawing(os.path.join(self.tempdir, 'plan.dxf'))
+        dwg.save(format='binary')
+        with open(dwg.filename, 'rb') as fileobj:
+            self.assertEqual(fileobj.read(), dwg.to_bytes(format='binary'))
+
 
 if __name__ == '__main__':
     unittest.main()
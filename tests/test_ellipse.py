@@ -15,7 +15,7 @@ except ImportError:
     import unittest
 
 from dxfwrite.helpers import normalize_dxf_chunk
-from dxfwrite.base import dxfstr, DXFInt
+from dxfwrite.base import dxfstr
 from dxfwrite.const import POLYLINE_CLOSED
 
 from dxfwrite.curves import Ellipse
@@ -56,12 +56,9 @@ class TestEllipse(unittest.TestCase):
         ellipse = Ellipse(center=(0., 0.), rx=5.0, ry=3.0,
                           startangle=0., endangle=360., rotation=30.,
                           segments=16, color=3, layer='0', linetype='SOLID')
-        flags = 0
-        for tag in ( t for t in ellipse.__dxftags__() if isinstance(t, DXFInt) ):
-            if tag.group_code == 70:
-                flags = tag.value
-                break
-                
+        tags = dxfstr(ellipse).split('\n')
+        # first group code 70 is the POLYLINE flag, vertices follow
+        flags = int(tags[tags.index(' 70') + 1])
         self.assertTrue(flags & POLYLINE_CLOSED)
 
 if __name__=='__main__':
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import unittest
+from io import StringIO
+
+from dxfwrite import DXFEngine as dxf
+
+
+def base_drawing():
+    dwg = dxf.drawing('base.dxf')
+    block = dxf.block('TITLE')
+    block.add(dxf.line((0, 0), (10, 0)))
+    dwg.blocks.add(block)
+    dwg.add(dxf.insert('TITLE', (0, 0)))
+    dwg.add(dxf.line((0, 0), (5, 5), layer='GRID'))
+    return dwg
+
+
+class TestFork(unittest.TestCase):
+    def test_equal_to_new_drawing(self):
+        fork = base_drawing().fork('sheet.dxf')
+        fork.add(dxf.circle(1, (2, 2)))
+        fork.add_layer('OVERLAY')
+        expected = base_drawing()
+        expected.add(dxf.circle(1, (2, 2)))
+        expected.add_layer('OVERLAY')
+        self.assertEqual(fork.filename, 'sheet.dxf')
+        self.assertEqual(fork.__dxf__(), expected.__dxf__())
+        self.assertEqual(fork.to_bytes(format='binary'), expected.to_bytes(format='binary'))
+
+    def test_base_is_unchanged(self):
+        dwg = base_drawing()
+        expected = dwg.__dxf__()
+        fork = dwg.fork()
+        fork.add(dxf.circle(1, (2, 2)))
+        fork.add_layer('OVERLAY')
+        fork.layers['DIMENSIONS']['color'] = 3
+        fork.header['$EXTMAX'] = (10, 10, 0)
+        fork.blocks.add(dxf.block('LEGEND'))
+        self.assertEqual(dwg.__dxf__(), expected)
+        self.assertEqual(dwg.filename, 'base.dxf')
+
+    def test_modify_base_after_fork(self):
+        dwg = base_drawing()
+        fork = dwg.fork()
+        expected = fork.__dxf__()
+        dwg.add(dxf.circle(1, (2, 2)))
+        dwg.add_layer('OVERLAY')
+        dwg.layers['DIMENSIONS']['color'] = 3
+        dwg.blocks.find('TITLE').add(dxf.circle(1, (0, 0)))
+        self.assertEqual(fork.__dxf__(), expected)
+        self.assertIn('CIRCLE', dwg.__dxf__())
+
+    def test_tables_got_before_fork(self):
+        dwg = base_drawing()
+        layers = dwg.layers
+        header = dwg.header
+        fork = dwg.fork()
+        expected = fork.__dxf__()
+        layers.add(dxf.layer('OVERLAY'))
+        layers['DIMENSIONS']['color'] = 3
+        header['$EXTMAX'].coords = (10., 10., 0.)
+        self.assertIs(dwg.layers, layers)
+        self.assertEqual(fork.__dxf__(), expected)
+        self.assertIn('OVERLAY', dwg.__dxf__())
+        self.assertEqual(dwg.layers['DIMENSIONS']['color'], 3)
+
+    def test_find_block(self):
+        dwg = base_drawing()
+        fork = dwg.fork()
+        fork.blocks.find('TITLE').add(dxf.circle(1, (0, 0)))
+        self.assertEqual(fork.__dxf__().count('CIRCLE'), 1)
+        self.assertNotIn('CIRCLE', dwg.__dxf__())
+
+    def test_fork_of_fork(self):
+        fork = base_drawing().fork()
+        fork.add(dxf.circle(1, (2, 2)))
+        fork2 = fork.fork()
+        fork2.add(dxf.circle(2, (2, 2)))
+        self.assertEqual(fork.__dxf__().count('CIRCLE'), 1)
+        self.assertEqual(fork2.__dxf__().count('CIRCLE'), 2)
+
+    def test_float_format(self):
+        dwg = base_drawing()
+        fork = dwg.fork()
+        fork.set_float_format(precision=2)
+        expected = base_drawing()
+        expected.set_float_format(precision=2)
+        self.assertEqual(dwg.fork().__dxf__(), base_drawing().__dxf__())
+        self.assertEqual(fork.__dxf__(), expected.__dxf__())
+
+    def test_r2000(self):
+        fork = base_drawing().fork()
+        fork.dialect = 'R2000'
+        fork.add(dxf.polyline([(0, 0), (1, 1)]))
+        expected = base_drawing()
+        expected.dialect = 'R2000'
+        expected.add(dxf.polyline([(0, 0), (1, 1)]))
+        self.assertEqual(fork.__dxf__(), expected.__dxf__())
+
+    def test_stream(self):
+        fork = base_drawing().fork()
+        expected = base_drawing()
+        results = []
+        for dwg in (fork, expected):
+            stream = StringIO()
+            with dwg.stream(stream) as drawing_stream:
+                dwg.add(dxf.circle(1, (20, 20)))
+            results.append((stream.getvalue(), drawing_stream.count))
+        self.assertEqual(results[0], results[1])
+
+    def test_streamed_drawing(self):
+        dwg = base_drawing()
+        with dwg.stream(StringIO()):
+            self.assertRaises(ValueError, dwg.fork)
+
+
+if __name__ == '__main__':
+    unittest.main()
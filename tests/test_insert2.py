@@ -7,6 +7,7 @@
 __author__ = "mozman <mozman@gmx.at>"
 
 import unittest
+from io import StringIO
 
 from dxfwrite import DXFEngine as dxf
 from dxfwrite.base import dxfstr
@@ -27,5 +28,21 @@ class TestInsert2(unittest.TestCase):
         self.assertTrue('TextForTAG1' in result)
         self.assertTrue('TextForTAG2' in result)
 
+    def test_float_format(self):
+        block = dxf.block('B1')
+        block.add(dxf.attdef('TAG1', (1.0, 0.0), height=0.35))
+        drawing = dxf.drawing()
+        drawing.blocks.add(block)
+        drawing.add(dxf.insert2(block, insert=(0.12345, 0), attribs={'TAG1': 'TextForTAG1'}))
+        drawing.set_float_format(precision=2)
+        result = drawing.to_bytes().decode(drawing.ENCODING)
+        self.assertTrue('\n0.12\n' in result)
+        self.assertFalse('0.12345' in result)
+        self.assertTrue('TextForTAG1' in result)
+        stream = StringIO()
+        with drawing.stream(stream):
+            pass
+        self.assertTrue('\n0.12\n' in stream.getvalue())
+
 if __name__=='__main__':
     unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import unittest
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.base import DXFFormat, AttribLayout, AttribDef, DXFString, DXFFloat, tags2str
+
+OMIT = DXFFormat(omit_defaults=True)
+
+
+def group_codes(string):
+    lines = string.split('\n')
+    return [int(code) for code in lines[0:-1:2]]
+
+
+class TestAttribLayout(unittest.TestCase):
+    def setUp(self):
+        self.layout = AttribLayout({
+            'layer': AttribDef(DXFString, 8, 10, default='0'),
+            'scale': AttribDef(DXFFloat, 41, 20, default=1.),
+            'width': AttribDef(DXFFloat, 40, 30),
+        })
+
+    def test_nothing_omitted_returns_values(self):
+        values = self.layout.new_values()
+        self.layout.set_value(values, 'layer', 'LAYER')
+        self.assertTrue(self.layout.omit_defaults(values) is values)
+
+    def test_omit_defaults(self):
+        values = self.layout.new_values()
+        self.layout.set_value(values, 'layer', '0')
+        self.layout.set_value(values, 'scale', 1)
+        self.layout.set_value(values, 'width', 0.)
+        self.assertEqual(self.layout.omit_defaults(values), [None, None, 0.])
+        self.assertEqual(values, ['0', 1., 0.])
+
+    def test_serialize(self):
+        values = self.layout.new_values()
+        self.layout.set_value(values, 'layer', '0')
+        self.layout.set_value(values, 'scale', 2.)
+        self.assertEqual(self.layout.serialize('TEST', values, OMIT), '  0\nTEST\n 41\n2.0\n')
+        self.assertEqual(self.layout.serialize('TEST', values), '  0\nTEST\n  8\n0\n 41\n2.0\n')
+
+
+class TestEntities(unittest.TestCase):
+    def test_common_attribs(self):
+        line = dxf.line((0, 0), (1, 1), color=256, linetype='BYLAYER', thickness=0.)
+        self.assertEqual(group_codes(tags2str(line, OMIT)), [0, 10, 20, 30, 11, 21, 31])
+        line = dxf.line((0, 0), (1, 1), color=1, layer='LINES')
+        self.assertEqual(group_codes(tags2str(line, OMIT)), [0, 62, 8, 10, 20, 30, 11, 21, 31])
+
+    def test_insert(self):
+        insert = dxf.insert('BLOCK', (0, 0), xscale=1., yscale=2., rotation=0.)
+        self.assertEqual(group_codes(tags2str(insert, OMIT)), [0, 2, 10, 20, 30, 42])
+
+    def test_insert_with_attribs(self):
+        insert = dxf.insert('BLOCK', (0, 0))
+        insert.add(dxf.attrib('value', (0, 0), tag='TAG'))
+        codes = group_codes(tags2str(insert, OMIT))
+        self.assertEqual(codes[:2], [0, 66])
+        self.assertNotIn(70, codes)
+
+    def test_vertex_layer_is_not_omitted(self):
+        polyline = dxf.polyline([(0, 0), (1, 1)], layer='POLY')
+        polyline.add_vertex((2, 2), layer='0')
+        string = tags2str(polyline, OMIT)
+        self.assertEqual(string.count('  8\nPOLY\n'), 3)
+        self.assertEqual(string.count('VERTEX\n  8\n0\n'), 1)
+
+    def test_attrib_layer_is_not_omitted(self):
+        insert = dxf.insert('BLOCK', (0, 0), layer='INSERT')
+        insert.add(dxf.attrib('value', (0, 0), tag='TAG'))
+        self.assertIn('ATTRIB\n  8\n0\n', tags2str(insert, OMIT))
+
+    def test_vertex_widths_are_not_omitted(self):
+        polyline = dxf.polyline([(0, 0)], flags=0, startwidth=1.)
+        polyline.add_vertex((1, 1), startwidth=0.)
+        self.assertEqual(tags2str(polyline, OMIT).count(' 40\n'), 2)
+
+    def test_polyface(self):
+        polyface = dxf.polyface(layer='MESH')
+        polyface.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+        string = tags2str(polyface, OMIT)
+        self.assertEqual(string.count('  8\nMESH\n'), 5)
+        self.assertEqual(string.count(' 70\n128\n'), 1)
+
+    def test_batch(self):
+        batch = dxf.lines([(0, 0), (1, 0)], [(0, 1), (1, 1)], color=256)
+        expected = "".join(tags2str(dxf.line(start, end), OMIT) for start, end in
+                           [((0, 0), (0, 1)), ((1, 0), (1, 1))])
+        self.assertEqual(tags2str(batch, OMIT), expected)
+
+    def test_float_format(self):
+        fmt = DXFFormat(precision=2, shorten_integers=True, omit_defaults=True)
+        self.assertEqual(tags2str(dxf.circle(1.234, (0, 0)), fmt), "  0\nCIRCLE\n 10\n0\n 20\n0\n 30\n0\n 40\n1.23\n")
+
+
+class TestDrawing(unittest.TestCase):
+    def drawing(self):
+        dwg = dxf.drawing()
+        dwg.add(dxf.polyline([(x, x) for x in range(10)], layer='POLY'))
+        dwg.add(dxf.text('Text', (0, 0), style='STANDARD'))
+        return dwg
+
+    def test_smaller_output(self):
+        dwg = self.drawing()
+        size = len(dwg.__dxf__())
+        dwg.set_omit_defaults()
+        self.assertLess(len(dwg.__dxf__()), size)
+        dwg.set_omit_defaults(False)
+        self.assertEqual(len(dwg.__dxf__()), size)
+
+    def test_set_float_format_keeps_policy(self):
+        dwg = self.drawing()
+        dwg.set_omit_defaults()
+        dwg.set_float_format(precision=3)
+        self.assertTrue(dwg.dxfformat.omit_defaults)
+        self.assertEqual(dwg.dxfformat.precision, 3)
+        dwg.set_omit_defaults()
+        self.assertEqual(dwg.dxfformat.precision, 3)
+
+    def test_insert2(self):
+        dwg = dxf.drawing()
+        block = dxf.block('BLOCK')
+        block.add(dxf.attdef('TAG', (0, 0)))
+        dwg.blocks.add(block)
+        dwg.add(dxf.insert2(block, insert=(1, 1), attribs={'TAG': 'value'}))
+        dwg.set_omit_defaults()
+        string = dwg.__dxf__()
+        insert = string[string.index('INSERT'):string.index('SEQEND')]
+        self.assertIn('ATTRIB\n', insert)
+        self.assertIn('  1\nvalue\n', insert)
+        self.assertNotIn(' 41\n', insert)
+
+    def test_r2000_writes_layer(self):
+        dwg = dxf.drawing(dialect='R2000')
+        dwg.set_omit_defaults()
+        dwg.add(dxf.polyline([(0, 0), (1, 1)]))
+        string = dwg.__dxf__()
+        lwpolyline = string[string.index('LWPOLYLINE'):]
+        self.assertTrue(lwpolyline.startswith('LWPOLYLINE\n  5\n'))
+        self.assertIn('  8\n0\n100\nAcDbPolyline\n', lwpolyline)
+        self.assertNotIn(' 62\n', lwpolyline[:lwpolyline.index('AcDbPolyline')])
+
+
+if __name__ == '__main__':
+    unittest.main()
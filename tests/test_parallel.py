@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import sys
+import threading
+import unittest
+from io import StringIO
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.base import DXFList, DXFAtom
+from dxfwrite import parallel
+from dxfwrite.parallel import partitions, iterchunks_parallel, start_method
+
+
+def create_drawing():
+    drawing = dxf.drawing()
+    block = dxf.block('BLOCK')
+    for x in range(50):
+        block.add(dxf.line((x, 0), (x, 1)))
+    drawing.blocks.add(block)
+    for x in range(100):
+        drawing.add(dxf.circle(x, (x, 0), color=x % 7))
+        drawing.add(dxf.text(u'Text %d €' % x, (x, 1)))
+    drawing.add(dxf.polyline([(x, x) for x in range(100)]))
+    drawing.add(dxf.lines([(x, 0) for x in range(100)], [(x, 1) for x in range(100)]))
+    return drawing
+
+
+class TestPartitions(unittest.TestCase):
+    def test_large_list(self):
+        tags = DXFList(DXFAtom(str(x)) for x in range(25))
+        result = partitions(DXFList([DXFAtom('START'), tags]), partition_size=10)
+        self.assertEqual([(start, stop) for part, start, stop in result],
+                         [(0, 1), (0, 10), (10, 20), (20, 25)])
+        self.assertTrue(result[1][0] is tags)
+
+    def test_ordered(self):
+        drawing = create_drawing()
+        tags = []
+        for part, start, stop in partitions(drawing, partition_size=20):
+            tags.extend(part[start:stop])
+        self.assertEqual(DXFList(tags).__dxf__(), drawing.__dxf__())
+
+
+class TestParallelSave(unittest.TestCase):
+    def test_thread_pool(self):
+        drawing = create_drawing()
+        self.assertEqual(drawing.to_bytes(workers=3, executor='thread'), drawing.to_bytes())
+
+    def test_process_pool(self):
+        drawing = create_drawing()
+        self.assertEqual(drawing.to_bytes(workers=2), drawing.to_bytes())
+
+    def test_small_partitions(self):
+        drawing = create_drawing()
+        drawing.set_float_format(precision=3)
+        chunks = list(iterchunks_parallel(drawing, 2, 'process', 'cp1252', drawing.dxfformat,
+                                          partition_size=20))
+        self.assertTrue(len(chunks) > 10)
+        self.assertEqual(b"".join(chunks), drawing.to_bytes())
+
+    def test_pool_without_initializer(self):
+        # Python 3.6
+        drawing = create_drawing()
+        parallel.POOL_INITIALIZER = False
+        try:
+            chunks = list(iterchunks_parallel(drawing, 2, 'process', 'cp1252', partition_size=20))
+        finally:
+            parallel.POOL_INITIALIZER = sys.version_info >= (3, 7)
+        self.assertEqual(b"".join(chunks), drawing.to_bytes())
+
+    def test_abandoned_save(self):
+        drawing = create_drawing()
+        chunks = iterchunks_parallel(drawing, 2, 'process', 'cp1252', partition_size=20)
+        next(chunks)
+        self.assertEqual(drawing.to_bytes(workers=2), drawing.to_bytes())
+        chunks.close()
+
+    def test_running_thread(self):
+        drawing = create_drawing()
+        expected = drawing.to_bytes()
+        event = threading.Event()
+        thread = threading.Thread(target=event.wait)
+        thread.start()
+        try:
+            self.assertNotEqual(start_method(), 'fork')
+            self.assertEqual(drawing.to_bytes(workers=2), expected)
+        finally:
+            event.set()
+            thread.join()
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), "requires Linux")
+    def test_fork_without_threads(self):
+        self.assertEqual(start_method(), 'fork')
+
+    def test_save_to_text_stream(self):
+        drawing = create_drawing()
+        stream = StringIO()
+        drawing.save_to_fileobj(stream, workers=2, executor='thread')
+        self.assertEqual(stream.getvalue(), drawing.__dxf__())
+
+    def test_invalid_executor(self):
+        drawing = create_drawing()
+        self.assertRaises(ValueError, drawing.to_bytes, workers=2, executor='mozman')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import unittest
+import threading
+from io import BytesIO, StringIO
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.pipeline import writechunks_pipelined, PipelineStats
+
+
+def create_drawing():
+    drawing = dxf.drawing()
+    for x in range(500):
+        drawing.add(dxf.line((x, 0), (x, 1)))
+        drawing.add(dxf.text(u'Text %d €' % x, (x, 1)))
+    return drawing
+
+
+class FailingStream(object):
+    def __init__(self, count):
+        self.count = count
+        self.written = []
+
+    def write(self, chunk):
+        if len(self.written) == self.count:
+            raise IOError("disk full")
+        self.written.append(chunk)
+
+
+class TestPipeline(unittest.TestCase):
+    def test_binary_stream(self):
+        drawing = create_drawing()
+        stream = BytesIO()
+        stats = drawing.save_to_fileobj(stream, chunk_size=1000, pipeline=True)
+        self.assertEqual(stream.getvalue(), drawing.to_bytes())
+        self.assertTrue(isinstance(stats, PipelineStats))
+        self.assertTrue(stats.chunks > 10)
+        self.assertEqual(stats.size, len(stream.getvalue()))
+
+    def test_text_stream(self):
+        drawing = create_drawing()
+        stream = StringIO()
+        drawing.save_to_fileobj(stream, pipeline=True)
+        self.assertEqual(stream.getvalue(), drawing.__dxf__())
+
+    def test_parallel(self):
+        drawing = create_drawing()
+        stream = BytesIO()
+        drawing.save_to_fileobj(stream, workers=2, executor='thread', pipeline=True)
+        self.assertEqual(stream.getvalue(), drawing.to_bytes())
+
+    def test_sequential_returns_none(self):
+        self.assertTrue(create_drawing().save_to_fileobj(BytesIO()) is None)
+
+    def test_writer_error(self):
+        produced = []
+
+        def chunks():
+            for index in range(100):
+                produced.append(index)
+                yield str(index)
+
+        stream = FailingStream(3)
+        self.assertRaises(IOError, writechunks_pipelined, stream, chunks(), queue_size=1)
+        self.assertEqual(stream.written, ['0', '1', '2'])
+        self.assertTrue(len(produced) < 100)  # formatting stopped
+        self.assertEqual(threading.active_count(), 1)
+
+    def test_formatter_error(self):
+        def chunks():
+            yield 'chunk'
+            raise ValueError()
+
+        stream = StringIO()
+        self.assertRaises(ValueError, writechunks_pipelined, stream, chunks())
+        self.assertEqual(stream.getvalue(), 'chunk')
+        self.assertEqual(threading.active_count(), 1)
+
+    def test_stalls(self):
+        stats = writechunks_pipelined(StringIO(), (str(index) for index in range(100)), queue_size=1)
+        self.assertEqual(stats.chunks, 100)
+        self.assertTrue(stats.producer_stalls + stats.writer_stalls > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -120,5 +120,49 @@ class TestPolyface(unittest.TestCase):
         pface.add_vertex( (1.001, 1.0, 1.0) )
         self.assertEqual(len(pface.vertices), 2)
 
+    def test_add_mesh(self):
+        vertices = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1)]
+        faces = [(0, 1, 2, 3), (0, 1, 4), (1, 2, 4)]
+        pface = Polyface()
+        pface.add_mesh(vertices, faces, colors=[1, 2, 3])
+        expected = Polyface()
+        for face, color in zip(faces, [1, 2, 3]):
+            expected.add_face([vertices[index] for index in face], color=color)
+        self.assertEqual(dxfstr(pface), dxfstr(expected))
+
+    def test_add_mesh_merges_vertices(self):
+        pface = Polyface(precision=3)
+        pface.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+        pface.add_mesh([(1.0001, 1, 0), (2, 2, 0), (1, 1.0001, 0), (0, 0, 0)],
+                       [(0, 1, 3), (2, 1, 3)], colors=7)
+        self.assertEqual(len(pface.vertices), 4)
+        self.assertEqual(len(pface.faces), 3)
+        self.assertEqual(pface.faces[1][0], 3)
+        self.assertEqual(pface.faces[1][1], 4)
+        self.assertEqual(pface.faces[1][2], 1)
+        self.assertEqual(pface.faces[2][0], 3)
+        self.assertEqual(pface.faces[2]['color'], 7)
+        self.assertEqual(pface.vertices[2]['location']['xyz'], [1., 1., 0.])
+
+    def test_add_mesh_precision(self):
+        pface = Polyface()
+        pface.add_mesh([(1.0001, 1, 1), (1.0002, 1, 1)], [(0, 1, 0)], precision=3)
+        self.assertEqual(len(pface.vertices), 1)
+
+    def test_add_mesh_errors(self):
+        pface = Polyface()
+        self.assertRaises(ValueError, pface.add_mesh, [(0, 0, 0), (1, 0, 0), (1, 1, 0)],
+                          [(0, 1, 2)], colors=[1, 2])
+        self.assertRaises(IndexError, pface.add_mesh, [(0, 0, 0), (1, 0, 0), (1, 1, 0)],
+                          [(0, 1, 3)])
+
+    def test_faces_on_polyface_layer(self):
+        pface = Polyface()
+        pface.add_face([(0, 0), (1, 0), (1, 1)])
+        pface['layer'] = 'PFACE'
+        result = dxfstr(pface)
+        self.assertEqual(result.count("  8\nPFACE\n"), 5)
+
+
 if __name__=='__main__':
     unittest.main()
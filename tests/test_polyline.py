@@ -14,9 +14,17 @@ try:
 except ImportError:
     import unittest
 
-from dxfwrite.entities import Polyline
+from dxfwrite.entities import Polyline, Vertex
+from dxfwrite.base import DXFFormat, DXFAtom, tags2str, tags2bin
 from dxfwrite import dxfstr
 
+POLYLINE = "  0\nPOLYLINE\n  8\n0\n 66\n1\n 10\n0.0\n 20\n0.0\n 30\n0.0\n 70\n8\n"
+SEQEND = "  0\nSEQEND\n"
+
+
+def vertices2str(vertices, fmt=None):
+    return "".join(tags2str(vertex, fmt) for vertex in vertices)
+
 class TestPolyline(unittest.TestCase):
     def setUp(self):
         self.addTypeEqualityFunc(str, self.assertMultiLineEqual)
@@ -35,6 +43,84 @@ class TestPolyline(unittest.TestCase):
         polyline = Polyline()
         self.assertFalse(polyline.valid())
 
+    def test_polyline_without_vertices(self):
+        expected = "  0\nPOLYLINE\n  8\n0\n 66\n1\n 10\n0.0\n 20\n0.0\n 30\n0.0\n" \
+                   " 70\n8\n  0\nSEQEND\n"
+        self.assertEqual(dxfstr(Polyline()), expected)
+        self.assertTrue(tags2bin(Polyline()).endswith(tags2bin(DXFAtom('SEQEND'))))
+
+
+class TestVertexBuffer(unittest.TestCase):
+    def test_vertex_columns(self):
+        polyline = Polyline()
+        polyline.add_vertices([(0, 0), (1, 1, 1)], startwidth=.5, bulge=[1, 0])
+        expected = [Vertex(location=(0, 0), startwidth=.5, bulge=1),
+                    Vertex(location=(1, 1, 1), startwidth=.5, bulge=0)]
+        self.assertEqual(dxfstr(polyline), POLYLINE + vertices2str(expected) + SEQEND)
+
+    def test_absent_values(self):
+        polyline = Polyline([(0, 0)])
+        polyline.add_vertex((1, 1), bulge=.5)
+        polyline.add_vertex((2, 2), endwidth=.5)
+        expected = [Vertex(location=(0, 0)),
+                    Vertex(location=(1, 1), bulge=.5),
+                    Vertex(location=(2, 2), endwidth=.5)]
+        self.assertEqual(dxfstr(polyline), POLYLINE + vertices2str(expected) + SEQEND)
+
+    def test_vertex_entities(self):
+        polyline = Polyline([(0, 0)])
+        polyline.add_vertex((1, 1), flags=1)
+        polyline.add_vertex((2, 2), layer='VERTEX')
+        polyline.add_vertex((3, 3))
+        expected = [Vertex(location=(0, 0)),
+                    Vertex(location=(1, 1), flags=1),
+                    Vertex(location=(2, 2), layer='VERTEX'),
+                    Vertex(location=(3, 3))]
+        self.assertEqual(dxfstr(polyline), POLYLINE + vertices2str(expected) + SEQEND)
+
+    def test_vertex_entity_columns(self):
+        polyline = Polyline()
+        polyline.add_vertices([(0, 0), (1, 1)], bulge=[1, 0], flags=1)
+        expected = [Vertex(location=(0, 0), bulge=1, flags=1),
+                    Vertex(location=(1, 1), bulge=0, flags=1)]
+        self.assertEqual(dxfstr(polyline), POLYLINE + vertices2str(expected) + SEQEND)
+
+    def test_format(self):
+        fmt = DXFFormat(precision=2, shorten_integers=True)
+        polyline = Polyline([(0, 0.123), (1.5, 1)])
+        polyline.add_vertex((2, 2), bulge=.333)
+        expected = [Vertex(location=(0, 0.123)), Vertex(location=(1.5, 1)),
+                    Vertex(location=(2, 2), bulge=.333)]
+        self.assertEqual(tags2str(polyline, fmt),
+                         POLYLINE.replace('0.0', '0') + vertices2str(expected, fmt) + SEQEND)
+
+    def test_chunks(self):
+        polyline = Polyline([(x, x) for x in range(25)])
+        polyline.vertices.CHUNK_SIZE = 10
+        self.assertEqual(len(polyline.vertices.__dxftags__()), 3)
+        expected = [Vertex(location=(x, x)) for x in range(25)]
+        self.assertEqual(dxfstr(polyline), POLYLINE + vertices2str(expected) + SEQEND)
+
+    def test_get_vertex(self):
+        polyline = Polyline([(0, 0), (1, 1, 1)], layer='POLYLINE')
+        polyline.add_vertex((2, 2), bulge=.5)
+        self.assertEqual(len(polyline.vertices), 3)
+        self.assertEqual(polyline.vertices[1]['location']['xyz'], [1., 1., 1.])
+        self.assertEqual(polyline.vertices[-1]['bulge'], .5)
+        self.assertEqual(polyline.vertices[0]['layer'], 'POLYLINE')
+        self.assertFalse('bulge' in polyline.vertices[0])
+        self.assertEqual(len(list(polyline.vertices)), 3)
+        self.assertRaises(IndexError, polyline.vertices.__getitem__, 3)
+
+    def test_invalid_column(self):
+        polyline = Polyline()
+        self.assertRaises(ValueError, polyline.add_vertices, [(0, 0), (1, 1)], bulge=[1])
+
+    def test_invalid_point(self):
+        polyline = Polyline([(0, 0)])
+        self.assertRaises(ValueError, polyline.add_vertices, [(1, 1), (1, )])
+        self.assertEqual(len(polyline.vertices), 1)
+
 
 if __name__=='__main__':
     unittest.main()
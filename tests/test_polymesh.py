@@ -53,6 +53,43 @@ class TestPolymesh(unittest.TestCase):
         self.assertFalse(mesh['flags'] & const.POLYLINE_MESH_CLOSED_N_DIRECTION)
 
 
+    def test_set_vertices(self):
+        grid = [[(row, col, row * col) for col in range(3)] for row in range(2)]
+        mesh = Polymesh(2, 3, layer='MESH')
+        mesh.set_vertices(grid)
+        expected = Polymesh(2, 3, layer='MESH')
+        for row in range(2):
+            for col in range(3):
+                expected.set_vertex(row, col, grid[row][col])
+        self.assertEqual(dxfstr(mesh), dxfstr(expected))
+
+    def test_set_heightfield(self):
+        mesh = Polymesh(2, 3)
+        mesh.set_vertices([[0, 1, 2], [3, 4, 5]], origin=(10, 20), spacing=(2, .5))
+        vertices = list(mesh.get_vertices())
+        self.assertEqual(vertices[0]['location']['xyz'], [10., 20., 0.])
+        self.assertEqual(vertices[2]['location']['xyz'], [10., 21., 2.])
+        self.assertEqual(vertices[4]['location']['xyz'], [12., 20.5, 4.])
+
+    def test_unset_vertices(self):
+        mesh = Polymesh(2, 2, layer='MESH')
+        mesh.set_vertex(1, 1, (1, 1, 1))
+        vertices = list(mesh.get_vertices())
+        self.assertEqual(len(vertices), 4)
+        self.assertEqual(vertices[0]['location']['xyz'], [0., 0., 0.])
+        self.assertEqual(vertices[0]['layer'], 'MESH')
+        self.assertEqual(vertices[0]['flags'], const.VTX_3D_POLYGON_MESH_VERTEX)
+
+    def test_invalid_index(self):
+        mesh = Polymesh(2, 2)
+        self.assertRaises(IndexError, mesh.set_vertex, 2, 0, (1, 1, 1))
+        self.assertRaises(IndexError, mesh.set_vertex, 0, -1, (1, 1, 1))
+
+    def test_invalid_grid(self):
+        mesh = Polymesh(2, 2)
+        self.assertRaises(ValueError, mesh.set_vertices, [[0, 0], [0, 0], [0, 0]])
+        self.assertRaises(ValueError, mesh.set_vertices, [[0, 0], [0]])
+
 
 if __name__=='__main__':
     unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import unittest
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.base import DXFFormat, SerializedTags, tags2str, tags2bin, trusted_input
+from dxfwrite import drawing
+from dxfwrite.drawing import Drawing
+from dxfwrite.tables import create_table
+
+
+class SettingsDrawing(Drawing):
+    """ Drawing without the prototype. """
+    def default_settings(self):
+        super(SettingsDrawing, self).default_settings()
+
+
+class TestTableCopyOnWrite(unittest.TestCase):
+    def setUp(self):
+        self.table = create_table('LAYER')
+        self.table.add(dxf.layer('LAYER1'))
+        self.copy = self.table.copy_on_write()
+
+    def test_shares_entries(self):
+        self.assertTrue(self.copy['LAYER1'] is not self.table['LAYER1'])
+        self.assertEqual(tags2str(self.copy), tags2str(self.table))
+
+    def test_add(self):
+        self.copy.add(dxf.layer('LAYER2'))
+        self.assertIn('LAYER2', self.copy)
+        self.assertNotIn('LAYER2', self.table)
+
+    def test_modify_entry(self):
+        self.copy['LAYER1']['color'] = 3
+        self.assertEqual(self.copy['LAYER1']['color'], 3)
+        self.assertEqual(self.table['LAYER1']['color'], 1)
+
+    def test_clear(self):
+        self.copy.clear()
+        self.assertNotIn('LAYER1', self.copy)
+        self.assertIn('LAYER1', self.table)
+
+    def test_serialized_table(self):
+        tags = self.copy.__dxftags__()
+        self.assertTrue(isinstance(tags[0], SerializedTags))
+        self.assertTrue(self.table.copy_on_write().__dxftags__()[0] is tags[0])
+        self.copy.add(dxf.layer('LAYER2'))
+        self.assertFalse(isinstance(self.copy.__dxftags__()[0], SerializedTags))
+
+    def test_get_values(self):
+        for entry in self.copy._get_values():
+            entry['color'] = 3
+        self.assertEqual(self.table['LAYER1']['color'], 1)
+        self.assertEqual(self.copy['LAYER1']['color'], 3)
+
+    def test_viewports(self):
+        table = create_table('VPORT')
+        table.add(dxf.vport('*ACTIVE'))
+        copy = table.copy_on_write()
+        copy['*ACTIVE'][0]['snap_on'] = 1
+        self.assertEqual(copy['*ACTIVE'][0]['snap_on'], 1)
+        self.assertEqual(table['*ACTIVE'][0]['snap_on'], 0)
+
+
+class TestSerializedTags(unittest.TestCase):
+    def test_cached_by_format(self):
+        circle = dxf.circle(1.2345, (0, 0))
+        tags = SerializedTags(circle)
+        self.assertEqual(tags.__dxf__(), tags2str(circle))
+        fmt = DXFFormat(precision=2)
+        self.assertEqual(tags.__dxf__(fmt), tags2str(circle, fmt))
+        self.assertTrue(tags.__dxf__(DXFFormat(precision=2)) is tags.__dxf__(fmt))
+        self.assertEqual(tags.__dxfbin__(), tags2bin(circle))
+
+
+class TestDrawing(unittest.TestCase):
+    def test_equal_to_default_settings(self):
+        self.assertEqual(dxf.drawing().__dxf__(), SettingsDrawing().__dxf__())
+        self.assertEqual(dxf.drawing().to_bytes(format='binary'), SettingsDrawing().to_bytes(format='binary'))
+        self.assertEqual(dxf.drawing(dialect='R2000').__dxf__(), SettingsDrawing(dialect='R2000').__dxf__())
+
+    def test_float_format(self):
+        dwg = dxf.drawing()
+        dwg.set_float_format(precision=3)
+        expected = SettingsDrawing()
+        expected.set_float_format(precision=3)
+        self.assertEqual(dwg.__dxf__(), expected.__dxf__())
+
+    def test_drawings_are_independent(self):
+        dwg = dxf.drawing()
+        dwg.add_layer('NEW')
+        dwg.layers['DIMENSIONS']['color'] = 3
+        dwg.header['$EXTMAX'] = (10, 10, 0)
+        self.assertEqual(dxf.drawing().__dxf__(), SettingsDrawing().__dxf__())
+        self.assertIn('NEW', dwg.layers)
+        self.assertEqual(dwg.layers['DIMENSIONS']['color'], 3)
+
+    def test_independent_viewports(self):
+        dwg = dxf.drawing()
+        viewport = dwg.entities.entities[0]
+        viewport['layer'] = 'OTHER'
+        viewport['view_height'] = 5.
+        self.assertEqual(dxf.drawing().__dxf__(), SettingsDrawing().__dxf__())
+
+    def test_independent_table_entries(self):
+        dwg = dxf.drawing()
+        for style in dwg.styles._get_values():
+            style['font'] = 'other.ttf'
+        self.assertIn('other.ttf', dwg.__dxf__())
+        self.assertEqual(dxf.drawing().__dxf__(), SettingsDrawing().__dxf__())
+
+    def test_independent_header_variables(self):
+        dwg = dxf.drawing()
+        dwg.header['$EXTMAX'].coords = (5., 5., 0.)
+        self.assertEqual(dxf.drawing().__dxf__(), SettingsDrawing().__dxf__())
+
+    def test_customized_settings(self):
+        class CustomDrawing(Drawing):
+            def std_styles(self):
+                return [dxf.style('CUSTOM')]
+        dwg = CustomDrawing()
+        self.assertIn('CUSTOM', dwg.styles)
+        self.assertNotIn('CUSTOM', dxf.drawing().styles)
+
+    def test_trusted_input(self):
+        prototype = drawing._PROTOTYPE
+        drawing._PROTOTYPE = None  # create the prototype in the trusted input mode
+        try:
+            with trusted_input():
+                dwg = dxf.drawing()
+        finally:
+            drawing._PROTOTYPE = prototype
+        self.assertEqual(dwg.__dxf__(), SettingsDrawing().__dxf__())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import unittest
+from io import BytesIO, StringIO
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite import r2000
+
+
+def read_tags(string):
+    lines = string.split('\n')
+    return [(int(code), value) for code, value in zip(lines[0:-1:2], lines[1::2])]
+
+
+def split_entities(tags, name):
+    """ Returns the tag lists of all entities `name`. """
+    entities = []
+    for code, value in tags:
+        if code == 0:
+            current = [] if value == name else None
+            if current is not None:
+                entities.append(current)
+        elif current is not None:
+            current.append((code, value))
+    return entities
+
+
+def values(tags, code):
+    return [value for tag_code, value in tags if tag_code == code]
+
+
+class TestR2000Drawing(unittest.TestCase):
+    def drawing(self):
+        dwg = dxf.drawing(dialect='R2000')
+        dwg.add(dxf.line((0, 0), (1, 1), layer='LINES'))
+        dwg.add(dxf.polyline([(0, 0), (1, 1), (2, 0)], layer='POLY', color=3))
+        return dwg
+
+    def test_invalid_dialect(self):
+        self.assertRaises(ValueError, dxf.drawing, dialect='R14')
+
+    def test_header(self):
+        tags = read_tags(self.drawing().__dxf__())
+        index = tags.index((9, '$ACADVER'))
+        self.assertEqual(tags[index + 1], (1, 'AC1015'))
+        self.assertIn('$HANDSEED', values(tags, 9))
+
+    def test_sections(self):
+        tags = read_tags(self.drawing().__dxf__())
+        sections = [tags[index + 1][1] for index, tag in enumerate(tags) if tag == (0, 'SECTION')]
+        self.assertEqual(sections, ['HEADER', 'CLASSES', 'TABLES', 'BLOCKS', 'ENTITIES', 'OBJECTS'])
+        self.assertEqual(tags[-1], (0, 'EOF'))
+
+    def test_unique_handles_below_handseed(self):
+        tags = read_tags(self.drawing().__dxf__())
+        index = tags.index((9, '$HANDSEED'))
+        handseed = int(tags[index + 1][1], 16)
+        handles = [value for code, value in tags[index + 2:] if code in (5, 105)]
+        self.assertEqual(len(handles), len(set(handles)))
+        self.assertLess(max(int(handle, 16) for handle in handles), handseed)
+
+    def test_owner_handles_exist(self):
+        tags = read_tags(self.drawing().__dxf__())
+        handles = set(value for code, value in tags if code in (5, 105))
+        for owner in values(tags, 330):
+            self.assertTrue(owner == '0' or owner in handles, owner)
+
+    def test_required_table_entries(self):
+        tags = read_tags(self.drawing().__dxf__())
+        names = values(tags, 2)
+        for name in ('*ACTIVE', 'BYBLOCK', 'BYLAYER', 'CONTINUOUS', 'ACAD', 'STANDARD', '*Model_Space',
+                     '*Paper_Space', 'DIMSTYLE', 'BLOCK_RECORD'):
+            self.assertIn(name, names)
+
+    def test_line_subclasses(self):
+        line = split_entities(read_tags(self.drawing().__dxf__()), 'LINE')[0]
+        self.assertEqual(values(line, 100), ['AcDbEntity', 'AcDbLine'])
+        self.assertEqual(values(line, 8), ['LINES'])
+
+    def test_lwpolyline(self):
+        tags = read_tags(self.drawing().__dxf__())
+        self.assertEqual(split_entities(tags, 'POLYLINE'), [])
+        self.assertEqual(split_entities(tags, 'VERTEX'), [])
+        self.assertEqual(split_entities(tags, 'SEQEND'), [])
+        lwpolyline = split_entities(tags, 'LWPOLYLINE')[0]
+        self.assertEqual(values(lwpolyline, 100), ['AcDbEntity', 'AcDbPolyline'])
+        self.assertEqual(values(lwpolyline, 8), ['POLY'])
+        self.assertEqual(values(lwpolyline, 62), ['3'])
+        self.assertEqual(values(lwpolyline, 90), ['3'])
+        self.assertEqual(values(lwpolyline, 10), ['0.0', '1.0', '2.0'])
+        self.assertEqual(values(lwpolyline, 20), ['0.0', '1.0', '0.0'])
+
+    def test_lwpolyline_elevation(self):
+        dwg = dxf.drawing(dialect='R2000')
+        dwg.add(dxf.polyline([(0, 0, 5), (1, 1, 5)]))
+        lwpolyline = split_entities(read_tags(dwg.__dxf__()), 'LWPOLYLINE')[0]
+        self.assertEqual(values(lwpolyline, 38), ['5.0'])
+        self.assertEqual(values(lwpolyline, 30), [])
+
+    def test_lwpolyline_closed_rectangle(self):
+        dwg = dxf.drawing(dialect='R2000')
+        dwg.add(dxf.rectangle((0, 0), 2, 3))
+        lwpolyline = split_entities(read_tags(dwg.__dxf__()), 'LWPOLYLINE')[0]
+        self.assertEqual(values(lwpolyline, 70), ['1'])
+        self.assertEqual(values(lwpolyline, 90), ['4'])
+
+    def test_lwpolyline_of_curves(self):
+        dwg = dxf.drawing(dialect='R2000')
+        dwg.add(dxf.ellipse((0, 0), 3, 1, segments=16))
+        tags = read_tags(dwg.__dxf__())
+        self.assertEqual(len(split_entities(tags, 'LWPOLYLINE')), 1)
+        self.assertEqual(split_entities(tags, 'VERTEX'), [])
+
+    def test_lwpolyline_widths_and_bulges(self):
+        dwg = dxf.drawing(dialect='R2000')
+        polyline = dxf.polyline([(0, 0), (1, 1)], flags=0, startwidth=.5, endwidth=.5)
+        polyline.add_vertex((2, 0), bulge=.25, startwidth=.1)
+        dwg.add(polyline)
+        lwpolyline = split_entities(read_tags(dwg.__dxf__()), 'LWPOLYLINE')[0]
+        self.assertEqual(values(lwpolyline, 40), ['0.5', '0.5', '0.1'])
+        self.assertEqual(values(lwpolyline, 41), ['0.5', '0.5', '0.5'])
+        self.assertEqual(values(lwpolyline, 42), ['0.0', '0.0', '0.25'])
+
+    def test_const_width(self):
+        dwg = dxf.drawing(dialect='R2000')
+        dwg.add(dxf.polyline([(0, 0), (1, 1)], flags=0, startwidth=.5, endwidth=.5))
+        lwpolyline = split_entities(read_tags(dwg.__dxf__()), 'LWPOLYLINE')[0]
+        self.assertEqual(values(lwpolyline, 43), ['0.5'])
+        self.assertEqual(values(lwpolyline, 40), [])
+
+    def test_3d_polyline(self):
+        dwg = dxf.drawing(dialect='R2000')
+        dwg.add(dxf.polyline([(0, 0, 0), (1, 1, 1)]))
+        tags = read_tags(dwg.__dxf__())
+        self.assertEqual(split_entities(tags, 'LWPOLYLINE'), [])
+        polyline = split_entities(tags, 'POLYLINE')[0]
+        self.assertEqual(values(polyline, 100), ['AcDbEntity', 'AcDb3dPolyline'])
+        vertices = split_entities(tags, 'VERTEX')
+        self.assertEqual(len(vertices), 2)
+        self.assertEqual(values(vertices[0], 100), ['AcDbEntity', 'AcDbVertex', 'AcDb3dPolylineVertex'])
+        polyline_handle = values(polyline, 5)[0]
+        self.assertEqual(values(vertices[0], 330), [polyline_handle])
+        seqend = split_entities(tags, 'SEQEND')[0]
+        self.assertEqual(values(seqend, 330), [polyline_handle])
+
+    def test_polyface(self):
+        dwg = dxf.drawing(dialect='R2000')
+        polyface = dxf.polyface()
+        polyface.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+        dwg.add(polyface)
+        tags = read_tags(dwg.__dxf__())
+        self.assertEqual(values(split_entities(tags, 'POLYLINE')[0], 100), ['AcDbEntity', 'AcDbPolyFaceMesh'])
+        markers = [values(vertex, 100)[-1] for vertex in split_entities(tags, 'VERTEX')]
+        self.assertEqual(markers, ['AcDbPolyFaceMeshVertex'] * 3 + ['AcDbFaceRecord'])
+
+    def test_block_and_insert(self):
+        dwg = dxf.drawing(dialect='R2000')
+        block = dxf.block('B1')
+        block.add(dxf.circle(1, (0, 0)))
+        dwg.blocks.add(block)
+        insert = dxf.insert('B1', (1, 1))
+        insert.add(dxf.attrib('value', (0, 0), tag='TAG'))
+        dwg.add(insert)
+        tags = read_tags(dwg.__dxf__())
+        index = tags.index((2, 'B1'))  # BLOCK_RECORD entry
+        record_handle = dict(tags[index - 8:index])[5]
+        circle = split_entities(tags, 'CIRCLE')[0]
+        self.assertEqual(values(circle, 330), [record_handle])
+        insert_handle = values(split_entities(tags, 'INSERT')[0], 5)[0]
+        attrib = split_entities(tags, 'ATTRIB')[0]
+        self.assertEqual(values(attrib, 330), [insert_handle])
+        self.assertEqual(values(attrib, 100), ['AcDbEntity', 'AcDbText', 'AcDbAttribute'])
+
+    def test_paper_space_owner(self):
+        tags = read_tags(self.drawing().__dxf__())
+        records = split_entities(tags, 'BLOCK_RECORD')
+        paper_space = [values(record, 5)[0] for record in records if '*Paper_Space' in values(record, 2)]
+        viewport = split_entities(tags, 'VIEWPORT')[0]
+        self.assertEqual(values(viewport, 330), paper_space)
+
+    def test_float_format(self):
+        dwg = self.drawing()
+        dwg.set_float_format(precision=3)
+        lwpolyline = split_entities(read_tags(dwg.__dxf__()), 'LWPOLYLINE')[0]
+        self.assertEqual(values(lwpolyline, 10), ['0', '1', '2'])
+
+    def test_chunks(self):
+        dwg = self.drawing()
+        self.assertEqual(dwg.to_bytes(chunk_size=100), dwg.__dxf__().encode('cp1252'))
+        self.assertTrue(all(len(chunk) <= 200 for chunk in list(dwg.iter_chunks(chunk_size=100))[1:]))
+
+    def test_spool_to_disk(self):
+        dwg = self.drawing()
+        expected = dwg.__dxf__()
+        size = r2000.SPOOL_SIZE
+        r2000.SPOOL_SIZE = 10
+        try:
+            self.assertEqual(dwg.to_bytes(chunk_size=10).decode('cp1252'), expected)
+        finally:
+            r2000.SPOOL_SIZE = size
+
+    def test_save_to_fileobj(self):
+        dwg = self.drawing()
+        stream = StringIO()
+        dwg.save_to_fileobj(stream)
+        self.assertEqual(stream.getvalue(), dwg.__dxf__())
+        fileobj = BytesIO()
+        dwg.save_to_fileobj(fileobj)
+        self.assertEqual(fileobj.getvalue(), dwg.to_bytes())
+
+    def test_unsupported_output(self):
+        dwg = self.drawing()
+        self.assertRaises(ValueError, dwg.to_bytes, format='binary')
+        self.assertRaises(ValueError, dwg.to_bytes, workers=2)
+        self.assertRaises(ValueError, dwg.stream, StringIO())
+
+    def test_r2000_is_smaller(self):
+        points = [(x / 3., x / 7.) for x in range(1000)]
+        r12 = dxf.drawing()
+        r12.add(dxf.polyline(points))
+        dwg = dxf.drawing(dialect='R2000')
+        dwg.add(dxf.polyline(points))
+        self.assertLess(len(dwg.__dxf__()), len(r12.__dxf__()) * .75)
+
+
+if __name__ == '__main__':
+    unittest.main()
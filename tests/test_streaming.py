@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import unittest
+from io import BytesIO
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.util import StringIO
+
+
+def new_drawing():
+    dwg = dxf.drawing()
+    dwg.add_layer('LINES')
+    return dwg
+
+
+def build_drawing(dwg):
+    dwg.add(dxf.line((0, 0), (1, 0), layer='LINES'))
+    dwg.add(dxf.circle(2., (3, 4)))
+    dwg.add(dxf.text('TEXT', insert=(-1, 7)))
+    dwg.paperspace.add(dxf.line((0, 0), (500, 500)))
+    return dwg
+
+
+def get_header_point(content, name):
+    lines = content.split('\n')
+    index = lines.index(name)
+    return tuple(float(value) for value in lines[index+2:index+8:2])
+
+
+class TestDrawingStream(unittest.TestCase):
+    def test_equal_to_save(self):
+        dwg = build_drawing(new_drawing())
+        expected = StringIO()
+        dwg.save_to_fileobj(expected)
+
+        dwg = new_drawing()
+        result = StringIO()
+        with dwg.stream(result, extents=False):
+            build_drawing(dwg)
+        self.assertEqual(expected.getvalue(), result.getvalue())
+
+    def test_entities_are_not_stored(self):
+        dwg = dxf.drawing()
+        with dwg.stream(StringIO()) as stream:
+            for x in range(10):
+                dwg.add(dxf.line((x, 0), (x, 1)))
+                self.assertEqual(len(dwg.entities.entities), 0)
+        self.assertEqual(stream.count, 11)  # + default paper space viewport
+
+    def test_add_after_close(self):
+        dwg = dxf.drawing()
+        with dwg.stream(StringIO()):
+            pass
+        dwg.add(dxf.line())
+        self.assertEqual(len(dwg.entities.entities), 1)
+
+    def test_patch_extents(self):
+        dwg = new_drawing()
+        result = StringIO()
+        with dwg.stream(result):
+            build_drawing(dwg)
+        content = result.getvalue()
+        self.assertEqual(get_header_point(content, '$EXTMIN'), (-1., 0., 0.))
+        self.assertEqual(get_header_point(content, '$EXTMAX'), (5., 8., 0.))  # circle radius, text height
+        self.assertTrue(content.endswith('  0\nENDSEC\n  0\nEOF\n'))
+
+    def test_circle_extents(self):
+        dwg = dxf.drawing()
+        with dwg.stream(StringIO()):
+            dwg.add(dxf.circle(10., (0, 0)))
+        self.assertEqual(dwg.header['$EXTMIN']['xyz'], [-10., -10., 0.])
+        self.assertEqual(dwg.header['$EXTMAX']['xyz'], [10., 10., 0.])
+
+    def test_arc_extents(self):
+        dwg = dxf.drawing()
+        with dwg.stream(StringIO()):
+            dwg.add(dxf.arc(2., (0, 0), 0, 90))
+        for value, expected in zip(dwg.header['$EXTMIN']['xyz'] + dwg.header['$EXTMAX']['xyz'],
+                                   [0., 0., 0., 2., 2., 0.]):
+            self.assertAlmostEqual(value, expected)
+
+    def test_text_extents(self):
+        dwg = dxf.drawing()
+        with dwg.stream(StringIO()):
+            dwg.add(dxf.text('ABC', (1, 1), height=2.))
+        self.assertEqual(dwg.header['$EXTMAX']['xyz'], [7., 3., 0.])
+
+    def test_ocs_extents(self):
+        dwg = dxf.drawing()
+        with dwg.stream(StringIO()):
+            dwg.add(dxf.circle(1., (0, 0, 5), extrusion_direction=(1, 0, 0)))
+        self.assertEqual(dwg.header['$EXTMIN']['xyz'], [5., -1., -1.])
+        self.assertEqual(dwg.header['$EXTMAX']['xyz'], [5., 1., 1.])
+
+    def test_exception_does_not_finalize(self):
+        dwg = dxf.drawing()
+        result = StringIO()
+        try:
+            with dwg.stream(result):
+                dwg.add(dxf.circle(10., (0, 0)))
+                raise RuntimeError('failed')
+        except RuntimeError:
+            pass
+        content = result.getvalue()
+        self.assertFalse(content.endswith('EOF\n'))
+        self.assertEqual(get_header_point(content, '$EXTMAX'), (100., 100., 0.))
+        dwg.add(dxf.line())
+        self.assertEqual(len(dwg.entities.entities), 1)
+
+    def test_wide_extents_value(self):
+        dwg = dxf.drawing()
+        dwg.set_float_format(precision=12, strip_zeros=False)
+        result = StringIO()
+        stream = dwg.stream(result)
+        stream.open()
+        dwg.add(dxf.line((0, 0), (12345678901234.25, 0)))
+        self.assertRaises(ValueError, stream.close)
+        content = result.getvalue()
+        self.assertEqual(get_header_point(content, '$EXTMAX'), (100., 100., 0.))
+        self.assertTrue('\n  9\n$UNITMODE\n' in content)
+
+    def test_binary_fileobj(self):
+        results = []
+        for fileobj in (StringIO(), BytesIO()):
+            dwg = new_drawing()
+            with dwg.stream(fileobj):
+                build_drawing(dwg)
+                dwg.add(dxf.text(u'\xe4\xf6\xfc', insert=(20, 20)))
+            results.append(fileobj.getvalue())
+        text, data = results
+        self.assertEqual(data, text.encode(dwg.ENCODING))
+        self.assertEqual(get_header_point(text, '$EXTMAX')[:2], (23.0, 21.0))
+
+    def test_no_entities_keeps_extents(self):
+        dwg = dxf.drawing()
+        result = StringIO()
+        with dwg.stream(result):
+            pass
+        self.assertEqual(get_header_point(result.getvalue(), '$EXTMAX'), (100., 100., 0.))
+
+
+if __name__ == '__main__':
+    unittest.main()
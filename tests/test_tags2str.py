@@ -8,7 +8,7 @@ __author__ = "mozman"
 
 import unittest
 from dxfwrite.base import DXFAtom, DXFList, dxfstr
-from dxfwrite.base import tags2str
+from dxfwrite.base import tags2str, iterdxftags
 
 class TestDXFAtom(unittest.TestCase):
     def test_group_code_0(self):
@@ -61,5 +61,29 @@ class TestDXFList(unittest.TestCase):
         ])
         self.assertEqual(dxfstr(atoms), tags2str(atoms))
 
+    def test_empty_sublists(self):
+        atoms = DXFList([DXFList(), DXFAtom('TAG1'), DXFList([DXFList()]),
+                         DXFAtom('TAG2'), DXFList()])
+        self.assertEqual(tags2str(atoms), '  0\nTAG1\n  0\nTAG2\n')
+
+    def test_deep_nesting(self):
+        # deeper than the recursion limit
+        atoms = DXFList([DXFAtom('LAST')])
+        for _ in range(5000):
+            atoms = DXFList([DXFAtom('TAG'), atoms])
+        result = tags2str(atoms)
+        self.assertTrue(result.startswith('  0\nTAG\n  0\nTAG\n'))
+        self.assertTrue(result.endswith('  0\nTAG\n  0\nLAST\n'))
+
+class TestIterDXFTags(unittest.TestCase):
+    def test_atom(self):
+        atom = DXFAtom('TAG')
+        self.assertEqual(list(iterdxftags(atom)), [atom])
+
+    def test_order(self):
+        atoms = [DXFAtom('TAG%d' % index) for index in range(5)]
+        tags = DXFList([atoms[0], DXFList([atoms[1], DXFList([atoms[2]]), atoms[3]]), atoms[4]])
+        self.assertEqual(list(iterdxftags(tags)), atoms)
+
 if __name__=='__main__':
     unittest.main()
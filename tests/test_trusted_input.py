@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import unittest
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.base import AttribLayout, DXFValidationError, dxfstr, validatetags
+
+
+class TestTrustedInput(unittest.TestCase):
+    def test_context(self):
+        self.assertFalse(AttribLayout.trusted)
+        with dxf.trusted_input():
+            self.assertTrue(AttribLayout.trusted)
+        self.assertFalse(AttribLayout.trusted)
+
+    def test_context_restored_after_exception(self):
+        try:
+            with dxf.trusted_input():
+                raise ValueError()
+        except ValueError:
+            pass
+        self.assertFalse(AttribLayout.trusted)
+
+    def test_same_output_for_well_typed_input(self):
+        def create():
+            return [
+                dxf.line((0., 0.), (1., 2., 3.), color=3, layer='LINES', linetype=None),
+                dxf.text('Text', (1., 2.), height=.5, rotation=30.),
+                dxf.circle(2., (1., 1.)),
+                dxf.arc(2., (1., 1.), 10., 80.),
+                dxf.solid([(0., 0.), (1., 0.), (1., 1.)]),
+                dxf.polyline([(0., 0.), (1., 0.), (1., 1., 1.)]),
+                dxf.layer('LINES', color=3),
+            ]
+        expected = [dxfstr(entity) for entity in create()]
+        with dxf.trusted_input():
+            entities = create()
+        self.assertEqual([dxfstr(entity) for entity in entities], expected)
+        for entity in entities:
+            validatetags(entity)
+
+    def test_values_are_not_casted(self):
+        with dxf.trusted_input():
+            circle = dxf.circle(2, (1, 1))
+        self.assertEqual(dxfstr(circle), '  0\nCIRCLE\n  8\n0\n 10\n1\n 20\n1\n 30\n0.0\n 40\n2\n')
+
+    def test_invalid_attribute(self):
+        with dxf.trusted_input():
+            self.assertRaises(KeyError, dxf.line, (0., 0.), (1., 0.), mozman=1)
+
+    def test_setitem(self):
+        with dxf.trusted_input():
+            solid = dxf.solid()
+            solid[0] = (1., 2.)
+        self.assertEqual(solid[0]['xyz'], [1., 2., 0.])
+
+
+class TestValidate(unittest.TestCase):
+    def test_validate_entity(self):
+        with dxf.trusted_input():
+            line = dxf.line((0, 0), (1., 0.))
+        self.assertRaises(DXFValidationError, line.validate)
+
+    def test_validate_string(self):
+        with dxf.trusted_input():
+            text = dxf.text(u'€')
+        self.assertRaises(DXFValidationError, text.validate)
+
+    def test_validate_int(self):
+        with dxf.trusted_input():
+            line = dxf.line(color=3.)
+        self.assertRaises(DXFValidationError, line.validate)
+
+    def test_validate_table_entry(self):
+        with dxf.trusted_input():
+            layer = dxf.layer('LAYER', color='3')
+        self.assertRaises(DXFValidationError, layer.validate)
+
+    def test_validate_drawing(self):
+        drawing = dxf.drawing()
+        with dxf.trusted_input():
+            polyline = dxf.polyline([(0., 0.), (1., 0.)])
+            drawing.add(polyline)
+        drawing.validate()
+        polyline.add_vertex((1, 1))  # not trusted: casted
+        drawing.validate()
+        with dxf.trusted_input():
+            polyline.add_vertex((2, 2))  # vertex locations are stored as floats
+        drawing.validate()
+        with dxf.trusted_input():
+            polyline.add_vertex((3., 3.), flags=1.)  # stored as Vertex entity
+        self.assertRaises(DXFValidationError, drawing.validate)
+
+    def test_validate_default_input(self):
+        drawing = dxf.drawing()
+        drawing.add(dxf.line((0, 0), (1, 0)))
+        drawing.add(dxf.text(u'€', (1, 1), height=1))
+        drawing.validate()
+
+
+if __name__ == '__main__':
+    unittest.main()
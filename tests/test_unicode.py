@@ -9,6 +9,7 @@ __author__ = "mozman <mozman@gmx.at>"
 import unittest
 
 from dxfwrite.util import to_string, to_unicode
+from dxfwrite.base import DXFString
 
 
 class TestToString(unittest.TestCase):
@@ -19,5 +20,29 @@ class TestToString(unittest.TestCase):
         self.assertEqual(to_string(layer), r'\U+017d\U+0106\U+010c\U+0110\U+0160')
         self.assertEqual(to_string(text), r'\U+041d\U+0430 \U+043a\U+0440\U+0430\U+0458 \U+0441\U+0435\U+043b\U+0430 \U+0436\U+0443\U+0442\U+0430 \U+045b\U+0438\U+0440\U+0438\U+043b\U+0438\U+0447\U+043d\U+0430 \U+043a\U+0443\U+045b\U+0430')
 
+    def test_ascii_string_is_unchanged(self):
+        text = 'ASCII only'
+        self.assertTrue(to_string(text) is text)
+
+    def test_latin1_chars_are_not_escaped(self):
+        self.assertEqual(to_string(to_unicode('äöü')), to_unicode('äöü'))
+
+    def test_mixed_latin1_and_escaped_chars(self):
+        text = to_unicode('äЖ')
+        self.assertEqual(to_string(text), to_unicode('ä') + r'\U+0416')
+
+    def test_backslash_u_is_not_escaped(self):
+        text = to_unicode(r'C:\users\\u')
+        self.assertEqual(to_string(text), text)
+
+    def test_escaped_strings_are_cached(self):
+        text = to_unicode('Жук')
+        self.assertTrue(to_string(text) is to_string(text))
+
+    def test_dxf_atom_output(self):
+        atom = DXFString(to_unicode('Жук'))
+        self.assertEqual(atom.__dxf__(), '  1\n\\U+0416\\U+0443\\U+043a\n')
+
+
 if __name__=='__main__':
     unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+
+__author__ = "mozman <mozman@gmx.at>"
+
+import asyncio
+import unittest
+
+from dxfwrite import DXFEngine as dxf
+from dxfwrite.web import DXFResponse
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestIterChunks(unittest.TestCase):
+    def test_chunks(self):
+        dwg = dxf.drawing()
+        chunks = list(dwg.iter_chunks(1000))
+        self.assertTrue(len(chunks) > 1)
+        self.assertTrue(all(isinstance(chunk, bytes) for chunk in chunks))
+        self.assertEqual(b"".join(chunks), dwg.to_bytes())
+
+
+class TestDXFResponse(unittest.TestCase):
+    def setUp(self):
+        self.dwg = dxf.drawing('plan.dxf')
+        self.dwg.add(dxf.line((0, 0), (1, 0)))
+
+    def test_wsgi(self):
+        responses = []
+
+        def start_response(status, headers):
+            responses.append((status, headers))
+
+        body = DXFResponse(self.dwg, chunk_size=1000).wsgi({}, start_response)
+        self.assertEqual(b"".join(body), self.dwg.to_bytes())
+        status, headers = responses[0]
+        self.assertEqual(status, '200 OK')
+        self.assertTrue(('Content-Disposition',
+                         "attachment; filename=\"plan.dxf\"; filename*=UTF-8''plan.dxf") in headers)
+
+    def test_asgi(self):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        run(DXFResponse(self.dwg, chunk_size=1000).asgi({'type': 'http'}, None, send))
+        self.assertEqual(messages[0]['type'], 'http.response.start')
+        self.assertEqual(messages[0]['status'], 200)
+        self.assertTrue((b'content-type', b'image/vnd.dxf') in messages[0]['headers'])
+        self.assertFalse(messages[-1]['more_body'])
+        body = b"".join(message['body'] for message in messages[1:])
+        self.assertEqual(body, self.dwg.to_bytes())
+
+    def test_filename_without_path(self):
+        self.dwg.filename = '/srv/drawings/plan.dxf'
+        self.assertEqual(dict(DXFResponse(self.dwg).headers)['Content-Disposition'],
+                         "attachment; filename=\"plan.dxf\"; filename*=UTF-8''plan.dxf")
+        response = DXFResponse(self.dwg, 'C:\\drawings\\plan.dxf')
+        self.assertEqual(dict(response.headers)['Content-Disposition'],
+                         "attachment; filename=\"plan.dxf\"; filename*=UTF-8''plan.dxf")
+
+    def test_quoted_filename(self):
+        response = DXFResponse(self.dwg, 'plan"\r\nX-Header: 1.dxf')
+        self.assertEqual(dict(response.headers)['Content-Disposition'],
+                         "attachment; filename=\"plan_X-Header: 1.dxf\"; "
+                         "filename*=UTF-8''plan%22X-Header%3A%201.dxf")
+
+    def test_unicode_filename(self):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        run(DXFResponse(self.dwg, u'Gr\xfcndriss.dxf').asgi({'type': 'http'}, None, send))
+        self.assertTrue((b'content-disposition',
+                         b"attachment; filename=\"Gr_ndriss.dxf\"; filename*=UTF-8''Gr%C3%BCndriss.dxf")
+                        in messages[0]['headers'])
+
+    def test_async_iteration(self):
+        async def collect():
+            return [chunk async for chunk in DXFResponse(self.dwg, chunk_size=1000)]
+
+        self.assertEqual(b"".join(run(collect())), self.dwg.to_bytes())
+
+
+if __name__ == '__main__':
+    unittest.main()